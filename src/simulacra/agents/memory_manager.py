@@ -1,19 +1,30 @@
 """Memory management system for agents with formation, storage, and retrieval."""
 
+import asyncio
 import logging
 import math
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
 
 from ..llm.llm_service import LLMService
-from ..models.action import Action, ActionResult
+from ..models.action import Action, ActionResult, ActionType
 from ..models.agent import Agent
-from ..models.memory import Memory, MemoryType, MemoryQuery, MemorySearchResult
+from ..models.memory import Memory, MemoryType, MemoryQuery, MemorySearchResult, RetrievalWeights
 from ..storage.sqlite_store import SQLiteStore
 from ..storage.vector_store import VectorStore
 
 logger = logging.getLogger(__name__)
 
+# Baseline importance of routine action memories scored without the LLM
+_ACTION_BASE_IMPORTANCE = {
+    ActionType.WAIT: 1.0,
+    ActionType.MOVE: 2.0,
+    ActionType.OBSERVE: 2.0,
+    ActionType.INTERACT: 4.0,
+}
+
 
 class MemoryManager:
     """Manages memory formation, storage, and retrieval for agents."""
@@ -34,21 +45,51 @@ class MemoryManager:
         self.sqlite_store = sqlite_store
         self.vector_store = vector_store
         self.llm_service = llm_service
+        
+        # Hybrid retrieval weights and recency half-life from settings
+        settings = llm_service.settings
+        self.retrieval_weights = RetrievalWeights(
+            semantic=settings.semantic_weight,
+            recency=settings.recency_weight,
+            importance=settings.importance_weight
+        )
+        self.recency_half_life_hours = settings.recency_decay_hours
+        
+        # Caps in-flight embedding requests so large batches queue instead of
+        # flooding Ollama; matches the cap on decision requests
+        self._embed_slots = asyncio.Semaphore(max(1, settings.ollama_max_parallel))
+        
+        # Called with each memory once it is persisted, whatever formed it
+        self._store_callbacks: List[Callable[[Memory], Any]] = []
+    
+    def add_store_callback(self, callback: Callable[[Memory], Any]) -> None:
+        """Add a callback to be called for every stored memory.
+        
+        Args:
+            callback: Function to call with the stored memory
+        """
+        self._store_callbacks.append(callback)
     
     async def form_memory_from_action(
         self, 
         agent: Agent, 
         action: Action, 
         result: ActionResult,
-        location: str
+        location: str,
+        infer: bool = False
     ) -> Memory:
         """Form a memory from an agent's action and its result.
         
+        The simulation already knows what happened, so routine actions are
+        scored with a structural heuristic; the LLM scores the memory only if
+        asked to or when the agent interacted with another agent.
+        
         Args:
             agent: The agent performing the action
             action: The action performed
             result: The result of the action
             location: Where the action took place
+            infer: Whether to always score importance with the LLM
             
         Returns:
             Created memory
@@ -56,8 +97,10 @@ class MemoryManager:
         # Create memory content based on action and result
         content = self._create_action_memory_content(agent, action, result, location)
         
-        # Score importance using LLM
-        importance = await self._score_memory_importance(agent, content)
+        if infer or action.parameters.get("target_agent_id") or result.side_effects.get("target_agent"):
+            importance = await self._score_memory_importance(agent, content)
+        else:
+            importance = self._estimate_action_importance(action, result)
         
         # Create memory
         memory = Memory(
@@ -141,44 +184,42 @@ class MemoryManager:
             )
             
             # Get full memory objects from SQLite
-            enhanced_results = []
+            memories = []
+            semantic_scores = []
             for memory_id, semantic_score in vector_results:
                 try:
-                    # Get full memory from SQLite
                     memory = await self.sqlite_store.get_memory(memory_id)
                     if not memory:
                         continue
-                    
-                    # Calculate time decay (more recent = higher score)
-                    hours_ago = (datetime.utcnow() - memory.timestamp).total_seconds() / 3600
-                    recency_score = self._calculate_time_decay(hours_ago)
-                    
-                    # Normalize importance (0-10 -> 0-1)
-                    importance_score = memory.importance_score / 10.0
-                    
-                    # Calculate final hybrid score with default weights
-                    final_score = (
-                        0.6 * semantic_score +
-                        0.2 * recency_score +
-                        0.2 * importance_score
-                    )
-                    
-                    enhanced_result = MemorySearchResult(
-                        memory=memory,
-                        score=final_score,
-                        semantic_score=semantic_score,
-                        recency_score=recency_score,
-                        importance_score=importance_score
-                    )
-                    enhanced_results.append(enhanced_result)
+                    memories.append(memory)
+                    semantic_scores.append(semantic_score)
                     
                 except Exception as e:
                     logger.warning(f"Failed to retrieve memory {memory_id}: {e}")
                     continue
             
-            # Sort by final score and return
-            enhanced_results.sort(key=lambda x: x.score, reverse=True)
-            final_results = enhanced_results[:limit]
+            # Score all candidates in one vectorized pass
+            now = datetime.utcnow()
+            hours_ago = np.array(
+                [(now - memory.timestamp).total_seconds() for memory in memories]
+            ) / 3600.0
+            semantic = np.asarray(semantic_scores, dtype=np.float64)
+            recency = self._calculate_time_decay(hours_ago)
+            importance = np.array([memory.importance_score for memory in memories]) / 10.0
+            scores = self._score_memories(semantic, recency, importance)
+            
+            # Highest scores first; only materialize results we return
+            top_indices = np.argsort(-scores, kind="stable")[:limit]
+            final_results = [
+                MemorySearchResult(
+                    memory=memories[i],
+                    score=float(scores[i]),
+                    semantic_score=float(semantic[i]),
+                    recency_score=float(recency[i]),
+                    importance_score=float(importance[i])
+                )
+                for i in top_indices
+            ]
             
             logger.info(f"🎯 MEMORY RETRIEVAL: Found {len(final_results)} relevant memories for {agent_id}")
             return final_results
@@ -234,7 +275,7 @@ class MemoryManager:
         Returns:
             Memory content string
         """
-        action_type = action.action_type.value if hasattr(action.action_type, 'value') else str(action.action_type)
+        action_type = action.action_type.value
         
         if action_type == "move":
             previous_location = result.side_effects.get("previous_location", "unknown")
@@ -263,6 +304,26 @@ class MemoryManager:
         else:
             return f"I performed {action_type} at {location}. {result.message}"
     
+    def _estimate_action_importance(self, action: Action, result: ActionResult) -> float:
+        """Estimate an action memory's importance without the LLM.
+        
+        Args:
+            action: The action performed
+            result: The result of the action
+            
+        Returns:
+            Importance score (0-10)
+        """
+        importance = _ACTION_BASE_IMPORTANCE.get(action.action_type, 3.0)
+        
+        # Failures are surprising and company makes a moment more memorable
+        if not result.success:
+            importance += 1.5
+        if result.side_effects.get("other_agents"):
+            importance += 1.0
+        
+        return min(10.0, importance)
+    
     async def _score_memory_importance(self, agent: Agent, content: str) -> float:
         """Score the importance of a memory using LLM.
         
@@ -296,7 +357,7 @@ Consider the agent's personality and background. What would be important to this
 Respond with just a number from 0-10."""
 
             response = await self.llm_service.ollama_client.generate(
-                model=self.llm_service.settings.ollama_model,
+                model=self.llm_service.settings.scoring_model,
                 prompt=prompt,
                 options={
                     "temperature": 0.3,  # Lower temperature for consistent scoring
@@ -321,45 +382,89 @@ Respond with just a number from 0-10."""
             logger.error(f"Failed to score memory importance: {e}")
             return 3.0  # Default fallback
     
-    def _calculate_time_decay(self, hours_ago: float) -> float:
-        """Calculate recency score using exponential decay.
+    def _calculate_time_decay(self, hours_ago: np.ndarray) -> np.ndarray:
+        """Calculate recency scores using exponential decay.
         
         Args:
-            hours_ago: How many hours ago the memory was formed
+            hours_ago: How many hours ago each memory was formed
             
         Returns:
-            Recency score (0-1, with 1 being most recent)
+            Recency scores (0-1, with 1 being most recent)
         """
-        # Exponential decay with 24-hour half-life
-        half_life_hours = 24.0
-        return math.exp(-hours_ago * math.log(2) / half_life_hours)
+        return np.exp(-hours_ago * math.log(2) / self.recency_half_life_hours)
     
-    async def _store_memory_embedding(self, memory: Memory) -> None:
-        """Generate embedding and store in vector database.
+    def _score_memories(
+        self,
+        semantic: np.ndarray,
+        recency: np.ndarray,
+        importance: np.ndarray
+    ) -> np.ndarray:
+        """Combine component scores with the hybrid retrieval weights.
         
         Args:
-            memory: Memory to store
+            semantic: Semantic similarity scores (0-1)
+            recency: Recency scores (0-1)
+            importance: Normalized importance scores (0-1)
+            
+        Returns:
+            Final hybrid scores
+        """
+        weights = self.retrieval_weights
+        return (
+            weights.semantic * semantic +
+            weights.recency * recency +
+            weights.importance * importance
+        )
+    
+    async def _generate_memory_embedding(self, memory: Memory) -> Optional[List[float]]:
+        """Generate the embedding for a memory.
+        
+        Args:
+            memory: Memory to embed
+            
+        Returns:
+            Embedding vector, or None if generation failed
         """
         logger.info(f"🔤 COGNITIVE PROCESS: Generating embedding for {memory.agent_id} memory - '{memory.content[:50]}...'")
         
         try:
-            # Generate embedding using LLM service
-            embedding_response = await self.llm_service.ollama_client.embeddings(
-                model=self.llm_service.settings.ollama_embedding_model,
-                prompt=memory.content
-            )
+            async with self._embed_slots:
+                embedding_response = await self.llm_service.ollama_client.embeddings(
+                    model=self.llm_service.settings.ollama_embedding_model,
+                    prompt=memory.content
+                )
+            return embedding_response.embedding
             
-            # Store in vector database
-            embedding_id = await self.vector_store.add_memory_embedding(memory, embedding_response.embedding)
+        except Exception as e:
+            logger.error(f"Failed to generate embedding for memory {memory.id}: {e}")
+            return None
+    
+    async def _store_memory_embeddings(self, memories: List[Memory]) -> None:
+        """Generate embeddings concurrently and store them in one vector write.
+        
+        Args:
+            memories: Memories to embed
+        """
+        embeddings = await asyncio.gather(*(self._generate_memory_embedding(memory) for memory in memories))
+        embedded = [(memory, embedding) for memory, embedding in zip(memories, embeddings) if embedding is not None]
+        if not embedded:
+            return
+        
+        try:
+            embedding_ids = await self.vector_store.add_memory_embeddings(
+                [memory for memory, _ in embedded],
+                [embedding for _, embedding in embedded]
+            )
             
-            # Update memory with embedding reference
-            memory.embedding_id = embedding_id
+            # Update memories with embedding references
+            for (memory, _), embedding_id in zip(embedded, embedding_ids):
+                memory.embedding_id = embedding_id
             
-            logger.info(f"💾 EMBEDDING STORED: {memory.agent_id} memory embedded and indexed")
+            logger.info(f"💾 EMBEDDING STORED: {len(embedding_ids)} memories embedded and indexed")
             
         except Exception as e:
-            logger.error(f"Failed to generate/store embedding for memory {memory.id}: {e}")
-            # Don't raise - memory can exist without embedding
+            logger.error(f"Failed to store embeddings for {len(embedded)} memories: {e}")
+            # Don't raise - memories can exist without embeddings
     
     async def _store_memory(self, memory: Memory) -> None:
         """Store memory in both SQLite and vector database.
@@ -370,14 +475,36 @@ Respond with just a number from 0-10."""
         try:
             # Store in SQLite
             await self.sqlite_store.add_memory(memory)
+            for callback in self._store_callbacks:
+                callback(memory)
             
             # Generate embedding and store in vector database
-            await self._store_memory_embedding(memory)
+            await self._store_memory_embeddings([memory])
             
         except Exception as e:
             logger.error(f"Failed to store memory {memory.id}: {e}")
             raise
     
+    async def _store_memories(self, memories: List[Memory]) -> None:
+        """Store several memories in both SQLite and vector database.
+        
+        Args:
+            memories: Memories to store
+        """
+        try:
+            # Store in SQLite in one transaction
+            await self.sqlite_store.add_memories(memories)
+            for callback in self._store_callbacks:
+                for memory in memories:
+                    callback(memory)
+            
+            # Generate embeddings concurrently, then index them together
+            await self._store_memory_embeddings(memories)
+            
+        except Exception as e:
+            logger.error(f"Failed to store {len(memories)} memories: {e}")
+            raise
+    
     async def health_check(self) -> bool:
         """Check if memory system is working.
         
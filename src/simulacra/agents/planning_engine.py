@@ -16,6 +16,11 @@ from .memory_manager import MemoryManager
 
 logger = logging.getLogger(__name__)
 
+# Memories at or above this importance count towards replanning
+_HIGH_IMPORTANCE_SCORE = 7.0
+# Number of such memories since the current plan that triggers a replan
+_REPLAN_HIGH_IMPORTANCE_COUNT = 3
+
 
 class PlanningEngine:
     """Generates and manages goal-oriented plans for agents using LLM reasoning."""
@@ -39,6 +44,25 @@ class PlanningEngine:
         self.sqlite_store = sqlite_store
         self.llm_service = llm_service
         self.settings = settings or Settings()
+        
+        # agent_id -> (date, that day's plan or None); plans only change through
+        # _store_daily_plan, which keeps this up to date
+        self._daily_plan_cache: Dict[str, Tuple[date, Optional[DailyPlan]]] = {}
+        
+        # agent_id -> high-importance memories formed since the current plan;
+        # seeded from storage on an agent's first check, then kept current by
+        # note_memory, which sees every memory the memory manager stores
+        self._high_importance_counts: Dict[str, int] = {}
+        memory_manager.add_store_callback(self.note_memory)
+    
+    def note_memory(self, memory: Memory) -> None:
+        """Count a newly stored memory towards its agent's replanning trigger.
+        
+        Args:
+            memory: The stored memory
+        """
+        if memory.importance_score >= _HIGH_IMPORTANCE_SCORE and memory.agent_id in self._high_importance_counts:
+            self._high_importance_counts[memory.agent_id] += 1
     
     async def should_plan(self, agent: Agent) -> bool:
         """Check if an agent should generate or update their daily plan.
@@ -63,18 +87,23 @@ class PlanningEngine:
                 logger.info(f"🎯 {agent.name}'s plan is {plan_age_hours:.1f} hours old - updating needed")
                 return True
                 
-            # Check if agent has had significant experiences since last plan
-            recent_memories = await self.memory_manager.get_recent_memories(
-                agent.id, 
-                since=current_plan.updated_at,
-                limit=20
-            )
+            # Check if agent has had significant experiences since last plan;
+            # only the first check per agent needs to query storage
+            high_importance_count = self._high_importance_counts.get(agent.id)
+            if high_importance_count is None:
+                recent_memories = await self.memory_manager.get_recent_memories(
+                    agent.id, 
+                    since=current_plan.updated_at,
+                    limit=20
+                )
+                high_importance_count = sum(
+                    1 for m in recent_memories if m.importance_score >= _HIGH_IMPORTANCE_SCORE
+                )
+                self._high_importance_counts[agent.id] = high_importance_count
             
-            if recent_memories:
-                high_importance_memories = [m for m in recent_memories if m.importance_score >= 7.0]
-                if len(high_importance_memories) >= 3:
-                    logger.info(f"🎯 {agent.name} has {len(high_importance_memories)} high-importance experiences - plan update needed")
-                    return True
+            if high_importance_count >= _REPLAN_HIGH_IMPORTANCE_COUNT:
+                logger.info(f"🎯 {agent.name} has {high_importance_count} high-importance experiences - plan update needed")
+                return True
             
             return False
             
@@ -108,8 +137,9 @@ class PlanningEngine:
             daily_plan = await self._parse_plan_response(agent, plan_data)
             
             if daily_plan:
-                # Store the plan
+                # Store the plan and start counting experiences against it
                 await self._store_daily_plan(daily_plan)
+                self._high_importance_counts[agent.id] = 0
                 
                 logger.info(f"📋 PLAN GENERATED: Created daily plan for {agent.name} with {len(daily_plan.hourly_blocks)} blocks")
                 return daily_plan
@@ -124,14 +154,21 @@ class PlanningEngine:
     async def get_current_daily_plan(self, agent_id: str) -> Optional[DailyPlan]:
         """Get the current daily plan for an agent.
         
+        Plans are read from storage once per agent per day and then served
+        from memory.
+        
         Args:
             agent_id: ID of the agent
             
         Returns:
             Current daily plan or None if no plan exists
         """
+        today = date.today()
+        cached = self._daily_plan_cache.get(agent_id)
+        if cached is not None and cached[0] == today:
+            return cached[1]
+        
         try:
-            today = date.today()
             plans = await self.sqlite_store.get_plans(
                 agent_id=agent_id,
                 plan_type="daily",
@@ -139,11 +176,9 @@ class PlanningEngine:
                 limit=1
             )
             
-            if plans:
-                plan_data = plans[0]
-                return DailyPlan.model_validate_json(plan_data["content"])
-            
-            return None
+            daily_plan = DailyPlan.model_validate_json(plans[0]["content"]) if plans else None
+            self._daily_plan_cache[agent_id] = (today, daily_plan)
+            return daily_plan
             
         except Exception as e:
             logger.error(f"Error retrieving daily plan for {agent_id}: {e}")
@@ -553,6 +588,7 @@ Keep activities realistic and specific to your character and environment."""
                 date_for=daily_plan.date,
                 status=daily_plan.status.value
             )
+            self._daily_plan_cache[daily_plan.agent_id] = (daily_plan.date, daily_plan)
             
         except Exception as e:
             logger.error(f"Error storing daily plan: {e}")
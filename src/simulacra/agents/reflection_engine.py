@@ -38,21 +38,28 @@ class ReflectionEngine:
         self.llm_service = llm_service
         self.settings = settings or Settings()
     
-    async def should_reflect(self, agent: Agent) -> bool:
+    async def should_reflect(self, agent: Agent, tick: Optional[int] = None) -> bool:
         """Check if an agent should generate reflections based on importance accumulation.
         
+        This runs for every agent on every tick, so it must stay a cheap
+        arithmetic check; the LLM work happens in trigger_reflection.
+        
         Args:
             agent: The agent to check
+            tick: Current tick number, used to space out reflection attempts
             
         Returns:
             True if agent should reflect, False otherwise
         """
-        try:
-            # Check if importance accumulator exceeds threshold
-            return agent.state.importance_accumulator >= self.settings.reflection_threshold
-        except Exception as e:
-            logger.error(f"Error checking reflection trigger for {agent.name}: {e}")
+        state = agent.state
+        if state.importance_accumulator < self.settings.reflection_threshold:
             return False
+        
+        # Don't retry every tick when a reflection produced nothing
+        last_tick = state.last_reflection_tick
+        if tick is not None and last_tick is not None:
+            return tick - last_tick >= self.settings.reflection_min_gap_ticks
+        return True
     
     async def trigger_reflection(self, agent: Agent) -> List[Reflection]:
         """Trigger reflection process for an agent.
@@ -87,8 +94,7 @@ class ReflectionEngine:
                 reflections.append(reflection)
             
             # Store reflections as high-importance memories
-            for reflection in reflections:
-                await self._store_reflection_as_memory(reflection)
+            await self._store_reflections_as_memories(reflections)
             
             # Reset importance accumulator
             await self._reset_importance_accumulator(agent)
@@ -123,18 +129,26 @@ class ReflectionEngine:
             logger.error(f"Failed to get reflections for {agent_id}: {e}")
             return []
     
-    async def update_importance_accumulator(self, agent: Agent, importance_delta: float) -> None:
+    async def update_importance_accumulator(
+        self,
+        agent: Agent,
+        importance_delta: float,
+        persist: bool = True
+    ) -> None:
         """Update agent's importance accumulator.
         
         Args:
             agent: The agent to update
             importance_delta: Amount to add to accumulator
+            persist: Whether to write the state now; callers that batch state
+                writes (e.g. once per tick) pass False and save it themselves
         """
         try:
             agent.state.importance_accumulator += importance_delta
             
             # Update in database
-            await self.sqlite_store.update_agent_state(agent.state)
+            if persist:
+                await self.sqlite_store.update_agent_state(agent.state)
             
             logger.debug(f"Updated importance accumulator for {agent.name}: {agent.state.importance_accumulator:.1f} (+{importance_delta:.1f})")
             
@@ -209,30 +223,33 @@ class ReflectionEngine:
         
         return reflection
     
-    async def _store_reflection_as_memory(self, reflection: Reflection) -> None:
-        """Store reflection as a high-importance memory.
+    async def _store_reflections_as_memories(self, reflections: List[Reflection]) -> None:
+        """Store reflections as high-importance memories.
         
         Args:
-            reflection: The reflection to store
+            reflections: The reflections to store
         """
         try:
-            # Store reflection in reflections table
-            await self.sqlite_store.add_reflection(reflection)
-            
-            # Also create a memory entry for this reflection
-            reflection_memory = Memory(
-                agent_id=reflection.agent_id,
-                content=f"I reflected and realized: {reflection.content}",
-                memory_type=MemoryType.REFLECTION,
-                timestamp=reflection.timestamp,
-                importance_score=reflection.importance_score,
-                location=None  # Reflections are internal
-            )
+            # Store reflections in reflections table
+            await self.sqlite_store.add_reflections(reflections)
+            
+            # Also create a memory entry for each reflection
+            reflection_memories = [
+                Memory(
+                    agent_id=reflection.agent_id,
+                    content=f"I reflected and realized: {reflection.content}",
+                    memory_type=MemoryType.REFLECTION,
+                    timestamp=reflection.timestamp,
+                    importance_score=reflection.importance_score,
+                    location=None  # Reflections are internal
+                )
+                for reflection in reflections
+            ]
             
-            # Store the reflection memory (this will also generate embeddings)
-            await self.memory_manager._store_memory(reflection_memory)
+            # Store the reflection memories (this will also generate embeddings)
+            await self.memory_manager._store_memories(reflection_memories)
             
-            logger.debug(f"Stored reflection as memory: {reflection.content[:50]}...")
+            logger.debug(f"Stored {len(reflections)} reflections as memories")
             
         except Exception as e:
             logger.error(f"Failed to store reflection as memory: {e}")
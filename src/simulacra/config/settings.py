@@ -20,17 +20,33 @@ class Settings(BaseSettings):
     # Database settings
     sqlite_db_path: str = Field(default="data/simulacra.db", env="SQLITE_DB_PATH")
     chroma_persist_dir: str = Field(default="data/chroma", env="CHROMA_PERSIST_DIR")
+    chroma_host: Optional[str] = Field(default=None, env="CHROMA_HOST")  # Use a Chroma server instead of local files
+    chroma_port: int = Field(default=8000, env="CHROMA_PORT")
+    vector_backend: str = Field(default="chroma", env="VECTOR_BACKEND")  # "chroma" or in-process "memory"
+    vector_quantize: bool = Field(default=False, env="VECTOR_QUANTIZE")  # int8 embeddings for the "memory" backend
     
     # Ollama settings
     ollama_base_url: str = Field(default="http://localhost:11434", env="OLLAMA_BASE_URL")
     ollama_model: str = Field(default="llama3.2:3b", env="OLLAMA_MODEL")
     ollama_embedding_model: str = Field(default="nomic-embed-text", env="OLLAMA_EMBEDDING_MODEL")
+    # Smaller model for short, high-frequency calls such as importance scoring
+    # (falls back to ollama_model when unset)
+    ollama_fast_model: Optional[str] = Field(default=None, env="OLLAMA_FAST_MODEL")
     ollama_timeout: int = Field(default=120, env="OLLAMA_TIMEOUT")
+    ollama_max_parallel: int = Field(default=4, env="OLLAMA_MAX_PARALLEL")
     
     # Simulation settings
     tick_duration_minutes: int = Field(default=5, env="TICK_DURATION_MINUTES")
+    tick_interval_seconds: float = Field(default=0.5, env="TICK_INTERVAL_SECONDS")
     reflection_threshold: float = Field(default=15.0, env="REFLECTION_THRESHOLD")
+    reflection_min_gap_ticks: int = Field(default=3, env="REFLECTION_MIN_GAP_TICKS")
     max_agents: int = Field(default=50, env="MAX_AGENTS")
+    parallel_stepping: bool = Field(default=True, env="PARALLEL_STEPPING")
+    max_concurrent_agents: int = Field(default=8, env="MAX_CONCURRENT_AGENTS")
+    deterministic_mode: bool = Field(default=False, env="DETERMINISTIC_MODE")
+    decision_fast_path: bool = Field(default=True, env="DECISION_FAST_PATH")
+    fast_path_observe_min_energy: float = Field(default=30.0, env="FAST_PATH_OBSERVE_MIN_ENERGY")
+    fast_path_rest_max_energy: float = Field(default=15.0, env="FAST_PATH_REST_MAX_ENERGY")
     
     # Retrieval settings
     default_memory_limit: int = Field(default=10, env="DEFAULT_MEMORY_LIMIT")
@@ -52,6 +68,14 @@ class Settings(BaseSettings):
     # Logging settings
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
     log_file: Optional[str] = Field(default=None, env="LOG_FILE")
+    tick_summaries: bool = Field(default=True, env="TICK_SUMMARIES")
+    log_agent_actions: bool = Field(default=True, env="LOG_AGENT_ACTIONS")
+    log_flush_interval: int = Field(default=50, env="LOG_FLUSH_INTERVAL")
+    
+    @property
+    def scoring_model(self) -> str:
+        """Get the model used for per-memory importance scoring."""
+        return self.ollama_fast_model or self.ollama_model
     
     @property
     def agents_config_path(self) -> Path:
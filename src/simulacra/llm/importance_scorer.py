@@ -187,7 +187,7 @@ Respond with only a number from 1-10, no explanation needed."""
         
         async with self.ollama_client as client:
             response = await client.generate(
-                model=self.settings.ollama_model,
+                model=self.settings.scoring_model,
                 prompt=prompt,
                 options={
                     "temperature": 0.1,  # Low temperature for consistent scoring
@@ -25,11 +25,19 @@ class LLMService:
             settings = get_settings()
         
         self.settings = settings
+        # One keep-alive pool shared by every caller for the service's lifetime;
+        # sized for the decision slots plus headroom for embedding/scoring calls
         self.ollama_client = OllamaClient(
             base_url=settings.ollama_base_url,
-            timeout=settings.ollama_timeout
+            timeout=settings.ollama_timeout,
+            max_connections=max(10, settings.ollama_max_parallel),
+            persistent=True
         )
     
+    async def aclose(self) -> None:
+        """Close the shared HTTP connection pool."""
+        await self.ollama_client.disconnect()
+    
     async def generate_reflection(
         self,
         agent: Agent,
@@ -3,7 +3,7 @@
 import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import httpx
 from pydantic import BaseModel
@@ -43,7 +43,9 @@ class OllamaClient:
         self, 
         base_url: str = "http://localhost:11434",
         timeout: float = 120.0,
-        max_retries: int = 3
+        max_retries: int = 3,
+        max_connections: int = 10,
+        persistent: bool = False
     ):
         """Initialize Ollama client.
         
@@ -51,10 +53,15 @@ class OllamaClient:
             base_url: Base URL for Ollama API
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
+            max_connections: Size of the HTTP connection pool
+            persistent: Keep the connection pool open across `async with`
+                blocks; it is then only closed by an explicit disconnect()
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_connections = max_connections
+        self.persistent = persistent
         self._client: Optional[httpx.AsyncClient] = None
     
     async def __aenter__(self):
@@ -64,14 +71,18 @@ class OllamaClient:
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self.disconnect()
+        if not self.persistent:
+            await self.disconnect()
     
     async def connect(self) -> None:
         """Initialize HTTP client."""
         if self._client is None:
             self._client = httpx.AsyncClient(
                 timeout=httpx.Timeout(self.timeout),
-                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
             )
     
     async def disconnect(self) -> None:
@@ -221,6 +232,79 @@ class OllamaClient:
             logger.error(f"Failed to generate text: {e}")
             raise
     
+    async def generate_stream(
+        self,
+        model: str,
+        prompt: str,
+        system: Optional[str] = None,
+        format: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """Generate text using Ollama, yielding it chunk by chunk.
+        
+        Closing the iterator early (e.g. via contextlib.aclosing) closes the
+        HTTP response, which stops generation on the server. Unlike generate,
+        failed requests are not retried since chunks may already be consumed.
+        
+        Args:
+            model: Model name (e.g., 'llama3.2:3b')
+            prompt: Input prompt
+            system: Optional system message
+            format: Optional output format constraint (e.g. 'json')
+            options: Additional model options
+            
+        Yields:
+            Generated text chunks
+            
+        Raises:
+            OllamaError: If the request fails
+        """
+        if not self._client:
+            await self.connect()
+        
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "stream": True
+        }
+        
+        if system:
+            payload["system"] = system
+        if format:
+            payload["format"] = format
+        if options:
+            payload["options"] = options
+        
+        try:
+            async with self._client.stream("POST", f"{self.base_url}/api/generate", json=payload) as response:
+                response.raise_for_status()
+                
+                async for line in response.aiter_lines():
+                    if not line.strip():
+                        continue
+                    
+                    try:
+                        data = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(f"Failed to parse streaming response line: {line}")
+                        continue
+                    
+                    if data.get("response"):
+                        yield data["response"]
+                    
+                    if data.get("done", False):
+                        break
+        
+        except httpx.HTTPStatusError as e:
+            error_msg = f"HTTP {e.response.status_code}"
+            logger.error(f"Ollama streaming request failed: {error_msg}")
+            raise OllamaError(error_msg)
+        
+        except httpx.RequestError as e:
+            error_msg = f"Request error: {str(e)}"
+            logger.error(f"Ollama streaming request failed: {error_msg}")
+            raise OllamaError(error_msg)
+    
     async def embeddings(self, model: str, prompt: str) -> OllamaEmbeddingResponse:
         """Generate embeddings using Ollama.
         
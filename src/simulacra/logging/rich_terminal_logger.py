@@ -28,6 +28,10 @@ class RichTerminalLogger:
         self._agent_actions = []
         self._tick_count = 0
         
+        # Totals for actions already handed off by take_buffered_data
+        self._flushed_action_count = 0
+        self._flushed_agent_names = set()
+        
     def log_simulation_start(self, agent_count: int, world_info: Dict[str, Any]) -> None:
         """Log simulation start with beautiful banner."""
         # Create simple but beautiful banner
@@ -486,8 +490,9 @@ Autonomous Agent Simulation
         summary_text.append("🏁 Simulation Complete\n\n", style="bold bright_green")
         summary_text.append(f"⏰ Total ticks: {total_ticks}\n", style="white")
         summary_text.append(f"⌚ Duration: {duration}\n", style="white")
-        summary_text.append(f"📊 Actions logged: {len(self._agent_actions)}\n", style="white")
-        summary_text.append(f"🤖 Agents tracked: {len(set(a['agent_name'] for a in self._agent_actions))}\n", style="white")
+        agent_names = self._flushed_agent_names.union(a['agent_name'] for a in self._agent_actions)
+        summary_text.append(f"📊 Actions logged: {self.logged_action_count}\n", style="white")
+        summary_text.append(f"🤖 Agents tracked: {len(agent_names)}\n", style="white")
         
         self.console.print(Panel(
             Align.center(summary_text),
@@ -496,6 +501,26 @@ Autonomous Agent Simulation
             padding=(1, 2)
         ))
     
+    @property
+    def logged_action_count(self) -> int:
+        """Number of actions logged so far, including ones already handed off."""
+        return self._flushed_action_count + len(self._agent_actions)
+    
+    def take_buffered_data(self) -> Dict[str, Any]:
+        """Hand off the buffered actions and state snapshots and clear the buffers.
+        
+        Returns:
+            Buffered data in the same shape as get_logged_data()
+        """
+        data = self.get_logged_data()
+        
+        self._flushed_action_count += len(self._agent_actions)
+        self._flushed_agent_names.update(a['agent_name'] for a in self._agent_actions)
+        self._simulation_state = {}
+        self._agent_actions = []
+        
+        return data
+    
     def get_logged_data(self) -> Dict[str, Any]:
         """Get all logged data for export."""
         return {
@@ -1,7 +1,9 @@
 """Integrated simulation logger combining Apple UX and data export."""
 
+import json
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
 
 from .rich_terminal_logger import RichTerminalLogger
 from .data_exporter import DataExporter
@@ -10,18 +12,34 @@ from .data_exporter import DataExporter
 class SimulationLogger:
     """Integrated logger for beautiful UX and structured data export."""
     
-    def __init__(self, session_name: Optional[str] = None, output_dir: str = "output"):
+    def __init__(
+        self,
+        session_name: Optional[str] = None,
+        output_dir: str = "output",
+        tick_summaries: bool = True,
+        agent_actions: bool = True
+    ):
         """Initialize simulation logger.
         
         Args:
             session_name: Name for this simulation session
             output_dir: Directory for data export
+            tick_summaries: Whether to display and record per-tick agent summaries
+            agent_actions: Whether to display and record each agent's thinking and actions
         """
         self.session_name = session_name or f"sim_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.tick_summaries = tick_summaries
+        self._enabled_kinds = frozenset(
+            kind for kind, enabled in (("tick_summary", tick_summaries), ("agent_action", agent_actions))
+            if enabled
+        )
         self.rich_logger = RichTerminalLogger()
         self.data_exporter = DataExporter(output_dir)
         self._session_start_time = datetime.now()
         
+        # Newline-delimited JSON file that flush_partial appends buffered data to
+        self._stream_path: Optional[Path] = None
+        
     def log_simulation_start(self, agent_count: int, world_info: Dict[str, Any]) -> None:
         """Log simulation start with beautiful banner and setup data collection."""
         self.rich_logger.log_simulation_start(agent_count, world_info)
@@ -77,6 +95,26 @@ class SimulationLogger:
         """Log agent planning generation."""
         self.rich_logger.log_agent_planning(agent_name, blocks_count, plan_summary)
         
+    def enabled_for(self, kind: str) -> bool:
+        """Check whether a kind of record is displayed and recorded.
+        
+        Lets callers skip building data that would be thrown away, like
+        logging.Logger.isEnabledFor.
+        
+        Args:
+            kind: "tick_summary" (log_tick_complete) or "agent_action"
+                (log_agent_thinking and log_agent_action)
+            
+        Returns:
+            True if records of this kind are logged
+        """
+        return kind in self._enabled_kinds
+        
+    @property
+    def wants_tick_summary(self) -> bool:
+        """Whether log_tick_complete consumes agent summaries, so callers can skip building them."""
+        return self.enabled_for("tick_summary")
+        
     def log_tick_complete(self, agent_summaries: Dict[str, Any]) -> None:
         """Log completion of tick with agent status summary."""
         self.rich_logger.log_tick_complete(agent_summaries)
@@ -110,7 +148,7 @@ class SimulationLogger:
         self.rich_logger.log_simulation_end(total_ticks, duration_str)
         
         # Export all logged data
-        simulation_data = self.rich_logger.get_logged_data()
+        simulation_data = self.get_logged_data()
         exported_files = self.data_exporter.export_simulation_data(
             simulation_data, 
             self.session_name
@@ -118,17 +156,81 @@ class SimulationLogger:
         
         return exported_files
         
+    @property
+    def has_logged_actions(self) -> bool:
+        """Whether any agent action has been logged, flushed or not."""
+        return self.rich_logger.logged_action_count > 0
+        
+    def flush_partial(self, path: Optional[Union[str, Path]] = None) -> Optional[str]:
+        """Append buffered actions and state snapshots to an NDJSON file and free them.
+        
+        Args:
+            path: File to append to; defaults to simulation_stream.ndjson in
+                the session's output directory and is remembered for later flushes
+            
+        Returns:
+            Path of the stream file, or None if nothing has been flushed yet
+            
+        Raises:
+            OSError: If the stream can't be written; the buffers are kept
+        """
+        if path is not None:
+            self._stream_path = Path(path)
+        
+        data = self.rich_logger.get_logged_data()
+        if not data["agent_actions"] and not data["simulation_state"]:
+            return str(self._stream_path) if self._stream_path else None
+        
+        if self._stream_path is None:
+            self._stream_path = self.data_exporter.base_output_dir / self.session_name / "simulation_stream.ndjson"
+        self._stream_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        records = [
+            json.dumps({"record": "action", **action}, ensure_ascii=False) + "\n"
+            for action in data["agent_actions"]
+        ]
+        records.extend(
+            json.dumps({"record": "state", "tick": tick, **snapshot}, ensure_ascii=False) + "\n"
+            for tick, snapshot in data["simulation_state"].items()
+        )
+        with open(self._stream_path, "a", encoding="utf-8") as stream:
+            stream.write("".join(records))
+        
+        # Only drop the buffers once written, so a failed write loses nothing
+        self.rich_logger.take_buffered_data()
+        return str(self._stream_path)
+        
     def get_session_name(self) -> str:
         """Get the current session name."""
         return self.session_name
         
     def get_logged_data(self) -> Dict[str, Any]:
-        """Get all logged data without exporting."""
-        return self.rich_logger.get_logged_data()
+        """Get all logged data without exporting, including flushed data."""
+        buffered = self.rich_logger.get_logged_data()
+        if self._stream_path is None or not self._stream_path.exists():
+            return buffered
+        
+        simulation_state: Dict[int, Any] = {}
+        agent_actions: List[Dict[str, Any]] = []
+        with open(self._stream_path, encoding="utf-8") as stream:
+            for line in stream:
+                entry = json.loads(line)
+                if entry.pop("record") == "action":
+                    agent_actions.append(entry)
+                else:
+                    simulation_state[entry.pop("tick")] = entry
+        
+        simulation_state.update(buffered["simulation_state"])
+        agent_actions.extend(buffered["agent_actions"])
+        return {
+            "simulation_state": simulation_state,
+            "agent_actions": agent_actions,
+            "total_ticks": buffered["total_ticks"]
+        }
         
     def export_current_data(self) -> Dict[str, str]:
         """Export current data without ending simulation."""
-        simulation_data = self.rich_logger.get_logged_data()
+        simulation_data = self.get_logged_data()
         return self.data_exporter.export_simulation_data(
             simulation_data, 
             f"{self.session_name}_checkpoint_{datetime.now().strftime('%H%M%S')}"
@@ -22,6 +22,8 @@ class Action(BaseModel):
     
     id: UUID = Field(default_factory=uuid4)
     agent_id: str = Field(..., description="ID of the agent performing the action")
+    # Kept as the enum member (no use_enum_values) so executors can dispatch
+    # on it directly
     action_type: ActionType = Field(..., description="Type of action")
     parameters: Dict[str, Any] = Field(
         default_factory=dict,
@@ -44,10 +46,6 @@ class Action(BaseModel):
         default=None,
         description="Description of action result"
     )
-    
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
 
 
 class MoveAction(BaseModel):
@@ -1,11 +1,14 @@
 """Agent-related data models."""
 
+import re
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from .action import ActionType
 
 
 class AgentStatus(Enum):
@@ -22,6 +25,8 @@ class AgentState(BaseModel):
     """Current state of an agent."""
     
     agent_id: str = Field(..., description="ID of the agent")
+    # Enum fields stay enum members (no use_enum_values), including state
+    # loaded from storage, so callers can always read .value
     status: AgentStatus = Field(default=AgentStatus.ACTIVE)
     current_location: Optional[str] = Field(
         default=None,
@@ -52,14 +57,23 @@ class AgentState(BaseModel):
         ge=0.0,
         description="Accumulated importance since last reflection"
     )
+    last_reflection_tick: Optional[int] = Field(
+        default=None,
+        description="Tick at which the agent last attempted to reflect"
+    )
+    last_action_type: Optional[ActionType] = Field(
+        default=None,
+        description="Type of the agent's most recently chosen action"
+    )
+    wait_until_tick: int = Field(
+        default=0,
+        ge=0,
+        description="First tick at which the agent acts again after a wait"
+    )
     last_updated: datetime = Field(
         default_factory=datetime.utcnow,
         description="When this state was last updated"
     )
-    
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
 
 
 class Agent(BaseModel):
@@ -93,6 +107,9 @@ class Agent(BaseModel):
         description="When this agent was created"
     )
     
+    # (personality text, its word tokens), rebuilt when personality changes
+    _personality_tags: Optional[Tuple[str, FrozenSet[str]]] = PrivateAttr(default=None)
+    
     def __init__(self, **data):
         """Initialize agent with proper state setup."""
         super().__init__(**data)
@@ -100,6 +117,15 @@ class Agent(BaseModel):
         if self.state.agent_id != self.id:
             self.state.agent_id = self.id
     
+    @property
+    def personality_tags(self) -> FrozenSet[str]:
+        """Lowercase word tokens of the personality description."""
+        cached = self._personality_tags
+        if cached is None or cached[0] != self.personality:
+            tags = frozenset(re.findall(r"[a-z]+", self.personality.lower()))
+            cached = self._personality_tags = (self.personality, tags)
+        return cached[1]
+    
     class Config:
         """Pydantic configuration."""
         use_enum_values = True
@@ -119,15 +145,19 @@ class AgentConfiguration(BaseModel):
     )
     
     def to_agent(self) -> Agent:
-        """Convert configuration to an Agent."""
-        return Agent(
+        """Convert configuration to an Agent.
+        
+        The configuration has already been validated, so the agent is built
+        with model_construct() to skip a second validation pass.
+        """
+        return Agent.model_construct(
             id=self.id,
             name=self.name,
             bio=self.bio,
             personality=self.personality,
             home_location=self.home_location,
-            relationships=self.relationships,
-            state=AgentState(agent_id=self.id)
+            relationships=dict(self.relationships),
+            state=AgentState.model_construct(agent_id=self.id)
         )
 
 
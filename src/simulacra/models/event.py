@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Literal
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
@@ -20,6 +20,46 @@ class EventType(Enum):
     SYSTEM = "system"              # System-generated event
 
 
+class ActionDetails(BaseModel):
+    """Type-specific details for agent action events."""
+    
+    event_type: Literal["action"] = "action"
+    target: Optional[str] = Field(
+        default=None,
+        description="Target of the action (agent ID, object ID, etc.)"
+    )
+    success: bool = Field(default=True, description="Whether the action succeeded")
+
+
+class DialogueDetails(BaseModel):
+    """Type-specific details for dialogue between agents."""
+    
+    event_type: Literal["dialogue"] = "dialogue"
+    speaker_id: str = Field(..., description="ID of the speaking agent")
+    listener_ids: List[str] = Field(
+        default_factory=list,
+        description="IDs of agents who heard the dialogue"
+    )
+    dialogue_text: str = Field(..., description="What was said")
+
+
+class MovementDetails(BaseModel):
+    """Type-specific details for agent movement."""
+    
+    event_type: Literal["movement"] = "movement"
+    from_location: Optional[str] = Field(
+        default=None,
+        description="Previous location"
+    )
+    to_location: str = Field(..., description="New location")
+
+
+EventDetails = Annotated[
+    Union[ActionDetails, DialogueDetails, MovementDetails],
+    Field(discriminator="event_type")
+]
+
+
 class Event(BaseModel):
     """An event that occurs in the simulation world."""
     
@@ -43,46 +83,16 @@ class Event(BaseModel):
         default_factory=list,
         description="Agent IDs who can perceive this event"
     )
+    details: Optional[EventDetails] = Field(
+        default=None,
+        description="Type-specific details, tagged by event_type"
+    )
     
     class Config:
         """Pydantic configuration."""
         use_enum_values = True
 
 
-class ActionEvent(Event):
-    """Specialized event for agent actions."""
-    
-    event_type: Literal[EventType.ACTION] = Field(default=EventType.ACTION)
-    target: Optional[str] = Field(
-        default=None,
-        description="Target of the action (agent ID, object ID, etc.)"
-    )
-    success: bool = Field(default=True, description="Whether the action succeeded")
-
-
-class DialogueEvent(Event):
-    """Specialized event for dialogue between agents."""
-    
-    event_type: Literal[EventType.DIALOGUE] = Field(default=EventType.DIALOGUE)
-    speaker_id: str = Field(..., description="ID of the speaking agent")
-    listener_ids: List[str] = Field(
-        default_factory=list,
-        description="IDs of agents who heard the dialogue"
-    )
-    dialogue_text: str = Field(..., description="What was said")
-
-
-class MovementEvent(Event):
-    """Specialized event for agent movement."""
-    
-    event_type: Literal[EventType.MOVEMENT] = Field(default=EventType.MOVEMENT)
-    from_location: Optional[str] = Field(
-        default=None,
-        description="Previous location"
-    )
-    to_location: str = Field(..., description="New location")
-
-
 class EventQuery(BaseModel):
     """Query parameters for event search."""
     
@@ -1,10 +1,10 @@
 """World-related data models."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class Place(BaseModel):
@@ -26,6 +26,19 @@ class Place(BaseModel):
         default_factory=list,
         description="Place IDs that are directly accessible from here"
     )
+    
+    # Set view of connected_places for O(1) membership checks. The list is
+    # kept for ordered iteration and serialization; places are static once
+    # loaded, so the set is built once at construction.
+    _connected_set: FrozenSet[str] = PrivateAttr(default_factory=frozenset)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Build the connected-places lookup set."""
+        self._connected_set = frozenset(self.connected_places)
+    
+    def is_connected_to(self, place_id: str) -> bool:
+        """Check whether a place is directly accessible from here."""
+        return place_id in self._connected_set
 
 
 class WorldObject(BaseModel):
@@ -84,6 +97,26 @@ class WorldState(BaseModel):
         description="When this state was last updated"
     )
     
+    # Occupancy index (place_id -> ordered agent IDs) kept in step with
+    # agent_locations so per-place lookups don't scan every agent
+    _occupants: Dict[str, Dict[str, None]] = PrivateAttr(default_factory=dict)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Build the occupancy index from the initial agent locations."""
+        for agent_id, location in self.agent_locations.items():
+            self._occupants.setdefault(location.place_id, {})[agent_id] = None
+    
+    def place_agent(self, agent_id: str, place_id: str) -> AgentLocation:
+        """Place an agent at a location, replacing any previous location."""
+        previous = self.agent_locations.get(agent_id)
+        if previous:
+            self._occupants.get(previous.place_id, {}).pop(agent_id, None)
+        
+        agent_location = AgentLocation(agent_id=agent_id, place_id=place_id)
+        self.agent_locations[agent_id] = agent_location
+        self._occupants.setdefault(place_id, {})[agent_id] = None
+        return agent_location
+    
     def can_perceive(self, observer_id: str, event_location: str) -> bool:
         """Check if an agent can perceive an event at a location."""
         observer_location = self.agent_locations.get(observer_id)
@@ -93,11 +126,11 @@ class WorldState(BaseModel):
     
     def get_agents_at_location(self, place_id: str) -> List[str]:
         """Get all agents currently at a specific location."""
-        return [
-            agent_id 
-            for agent_id, location in self.agent_locations.items()
-            if location.place_id == place_id
-        ]
+        return list(self._occupants.get(place_id, ()))
+    
+    def get_occupancy_counts(self) -> Dict[str, int]:
+        """Get the number of agents at each occupied location."""
+        return {place_id: len(agents) for place_id, agents in self._occupants.items() if agents}
     
     def can_move_to(self, agent_id: str, target_place_id: str) -> bool:
         """Check if an agent can move to a target location."""
@@ -114,26 +147,29 @@ class WorldState(BaseModel):
             return False
         
         # Check if target place is directly accessible
-        return target_place_id in current_place.connected_places
+        return current_place.is_connected_to(target_place_id)
     
     def move_agent(self, agent_id: str, target_place_id: str) -> bool:
         """Move an agent to a new location."""
-        if not self.can_move_to(agent_id, target_place_id):
+        current_location = self.agent_locations.get(agent_id)
+        if not current_location:
             return False
         
-        current_location = self.agent_locations.get(agent_id)
-        if current_location:
-            current_location.previous_place_id = current_location.place_id
-            current_location.place_id = target_place_id
-            current_location.last_updated = datetime.utcnow()
-        else:
-            # Agent not in world yet, add them
-            self.agent_locations[agent_id] = AgentLocation(
-                agent_id=agent_id,
-                place_id=target_place_id
-            )
+        current_place = self.places.get(current_location.place_id)
+        if not current_place or target_place_id not in self.places:
+            return False
         
-        self.last_updated = datetime.utcnow()
+        if not current_place.is_connected_to(target_place_id):
+            return False
+        
+        now = datetime.utcnow()
+        self._occupants.get(current_location.place_id, {}).pop(agent_id, None)
+        self._occupants.setdefault(target_place_id, {})[agent_id] = None
+        current_location.previous_place_id = current_location.place_id
+        current_location.place_id = target_place_id
+        current_location.last_updated = now
+        
+        self.last_updated = now
         return True
 
 
@@ -144,8 +180,12 @@ class WorldConfiguration(BaseModel):
     objects: List[WorldObject] = Field(default_factory=list)
     
     def to_world_state(self) -> WorldState:
-        """Convert configuration to a WorldState."""
-        return WorldState(
+        """Convert configuration to a WorldState.
+        
+        Places and objects are already validated models, so the state is
+        built with model_construct() to skip re-validating them.
+        """
+        return WorldState.model_construct(
             places={place.id: place for place in self.places},
             objects={obj.id: obj for obj in self.objects}
         )
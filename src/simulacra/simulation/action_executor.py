@@ -2,7 +2,7 @@
 
 import logging
 import random
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ..models.action import Action, ActionType, ActionResult
 from ..models.event import Event, EventType
@@ -11,8 +11,33 @@ from .world_manager import WorldManager
 logger = logging.getLogger(__name__)
 
 
+def _action_type(action: Action) -> Optional[ActionType]:
+    """Resolve an action's type to the ActionType member.
+    
+    Validated actions already hold the enum; this also covers actions built
+    with model_construct from raw strings.
+    
+    Args:
+        action: The action
+        
+    Returns:
+        The ActionType, or None if the type is unknown
+    """
+    action_type = action.action_type
+    if isinstance(action_type, ActionType):
+        return action_type
+    try:
+        return ActionType(action_type)
+    except ValueError:
+        return None
+
+
 class ActionExecutor:
-    """Executes agent actions and generates events."""
+    """Executes agent actions and generates events.
+    
+    Results are built with ActionResult.model_construct: every field comes
+    from the executor itself, so re-validating them on each action is wasted work.
+    """
     
     def __init__(self, world_manager: WorldManager):
         """Initialize action executor.
@@ -21,6 +46,15 @@ class ActionExecutor:
             world_manager: World state manager
         """
         self.world_manager = world_manager
+        self._dispatch = {
+            ActionType.MOVE: self._execute_move,
+            ActionType.WAIT: self._execute_wait,
+            ActionType.INTERACT: self._execute_interact,
+            ActionType.OBSERVE: self._execute_observe,
+        }
+        
+        # place_id -> available action descriptions; the world layout is fixed
+        self._available_actions_cache: Dict[Optional[str], Tuple[str, ...]] = {}
     
     async def execute_action(self, action: Action) -> ActionResult:
         """Execute an agent action.
@@ -31,30 +65,22 @@ class ActionExecutor:
         Returns:
             Result of the action execution
         """
-        logger.debug(f"Executing action {action.action_type.value if hasattr(action.action_type, 'value') else str(action.action_type)} for agent {action.agent_id}")
-        
         try:
-            # Handle both enum and string action types
-            action_type_str = action.action_type.value if hasattr(action.action_type, 'value') else str(action.action_type)
-            
-            if action_type_str == "move":
-                return await self._execute_move(action)
-            elif action_type_str == "wait":
-                return await self._execute_wait(action)
-            elif action_type_str == "interact":
-                return await self._execute_interact(action)
-            elif action_type_str == "observe":
-                return await self._execute_observe(action)
-            else:
-                return ActionResult(
+            action_type = _action_type(action)
+            handler = self._dispatch.get(action_type)
+            if handler is None:
+                return ActionResult.model_construct(
                     action_id=action.id,
                     success=False,
-                    message=f"Unknown action type: {action_type_str}"
+                    message=f"Unknown action type: {action.action_type}"
                 )
+            
+            logger.debug("Executing action %s for agent %s", action_type.value, action.agent_id)
+            return await handler(action)
         
         except Exception as e:
-            logger.error(f"Error executing action {action.id}: {e}")
-            return ActionResult(
+            logger.error("Error executing action %s: %s", action.id, e)
+            return ActionResult.model_construct(
                 action_id=action.id,
                 success=False,
                 message=f"Action failed with error: {str(e)}"
@@ -64,7 +90,7 @@ class ActionExecutor:
         """Execute a move action."""
         target_place_id = action.parameters.get("target_place_id")
         if not target_place_id:
-            return ActionResult(
+            return ActionResult.model_construct(
                 action_id=action.id,
                 success=False,
                 message="Move action missing target_place_id parameter"
@@ -77,11 +103,9 @@ class ActionExecutor:
         success = await self.world_manager.move_agent(action.agent_id, target_place_id)
         
         if success:
-            # Get place info for result message
-            place_info = self.world_manager.get_place_info(target_place_id)
-            place_name = place_info["name"] if place_info else target_place_id
+            place_name = self.world_manager.get_place_name(target_place_id)
             
-            return ActionResult(
+            return ActionResult.model_construct(
                 action_id=action.id,
                 success=True,
                 message=f"Moved from {current_location} to {place_name}",
@@ -91,7 +115,7 @@ class ActionExecutor:
                 }
             )
         else:
-            return ActionResult(
+            return ActionResult.model_construct(
                 action_id=action.id,
                 success=False,
                 message=f"Cannot move from {current_location} to {target_place_id} - not connected or place doesn't exist"
@@ -108,11 +132,9 @@ class ActionExecutor:
         if reason:
             message += f" ({reason})"
         if current_location:
-            place_info = self.world_manager.get_place_info(current_location)
-            place_name = place_info["name"] if place_info else current_location
-            message += f" at {place_name}"
+            message += f" at {self.world_manager.get_place_name(current_location)}"
         
-        return ActionResult(
+        return ActionResult.model_construct(
             action_id=action.id,
             success=True,
             message=message,
@@ -129,7 +151,7 @@ class ActionExecutor:
         
         if target_object_id:
             # Interacting with an object
-            return ActionResult(
+            return ActionResult.model_construct(
                 action_id=action.id,
                 success=True,
                 message=f"Performed {interaction_type} interaction with {target_object_id}",
@@ -145,13 +167,13 @@ class ActionExecutor:
             target_location = self.world_manager.get_agent_location(target_agent_id)
             
             if target_location != current_location:
-                return ActionResult(
+                return ActionResult.model_construct(
                     action_id=action.id,
                     success=False,
                     message=f"Cannot interact with {target_agent_id} - they are not in the same location"
                 )
             
-            return ActionResult(
+            return ActionResult.model_construct(
                 action_id=action.id,
                 success=True,
                 message=f"Performed {interaction_type} interaction with {target_agent_id}",
@@ -164,7 +186,7 @@ class ActionExecutor:
         
         else:
             # Generic interaction with environment
-            return ActionResult(
+            return ActionResult.model_construct(
                 action_id=action.id,
                 success=True,
                 message=f"Performed {interaction_type} interaction with the environment",
@@ -180,7 +202,7 @@ class ActionExecutor:
         current_location = self.world_manager.get_agent_location(action.agent_id)
         
         if not current_location:
-            return ActionResult(
+            return ActionResult.model_construct(
                 action_id=action.id,
                 success=False,
                 message="Cannot observe - agent location unknown"
@@ -189,7 +211,7 @@ class ActionExecutor:
         # Get information about current location
         place_info = self.world_manager.get_place_info(current_location)
         if not place_info:
-            return ActionResult(
+            return ActionResult.model_construct(
                 action_id=action.id,
                 success=False,
                 message=f"Cannot observe - unknown location {current_location}"
@@ -202,7 +224,7 @@ class ActionExecutor:
         observations.append(f"At {place_info['name']}: {place_info.get('description', 'A place in the simulation')}")
         
         # Observe other agents
-        other_agents = [agent for agent in place_info['agents'] if agent != action.agent_id]
+        other_agents = self.world_manager.get_other_agents_at_location(current_location, action.agent_id)
         if other_agents:
             agent_list = ", ".join(other_agents)
             observations.append(f"Other agents here: {agent_list}")
@@ -213,7 +235,7 @@ class ActionExecutor:
         
         observation_text = ". ".join(observations)
         
-        return ActionResult(
+        return ActionResult.model_construct(
             action_id=action.id,
             success=True,
             message=f"Observed surroundings: {observation_text}",
@@ -227,22 +249,42 @@ class ActionExecutor:
     def get_available_actions(self, agent_id: str) -> List[str]:
         """Get list of available actions for an agent.
         
+        Available actions depend only on the agent's location and the fixed
+        world layout, so they are cached per location.
+        
         Args:
             agent_id: ID of the agent
             
+        Returns:
+            List of available action descriptions
+        """
+        current_location = self.world_manager.get_agent_location(agent_id)
+        
+        actions = self._available_actions_cache.get(current_location)
+        if actions is None:
+            actions = self._available_actions_cache[current_location] = tuple(
+                self._build_available_actions(current_location)
+            )
+        
+        return list(actions)
+    
+    def _build_available_actions(self, current_location: Optional[str]) -> List[str]:
+        """Build the action descriptions available at a location.
+        
+        Args:
+            current_location: Place ID, or None if the agent isn't placed
+            
         Returns:
             List of available action descriptions
         """
         actions = []
         
-        current_location = self.world_manager.get_agent_location(agent_id)
         if current_location:
             # Get connected places for movement
             connected_places = self.world_manager.get_connected_places(current_location)
+            get_place_name = self.world_manager.get_place_name
             for place_id in connected_places:
-                place_info = self.world_manager.get_place_info(place_id)
-                place_name = place_info["name"] if place_info else place_id
-                actions.append(f"move to {place_name}")
+                actions.append(f"move to {get_place_name(place_id)}")
         
         # Basic actions always available
         actions.extend([
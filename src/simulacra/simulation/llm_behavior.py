@@ -1,7 +1,10 @@
 """LLM-powered behavior system for agents with real cognitive reasoning."""
 
+import asyncio
+import json
 import logging
 import re
+from contextlib import aclosing
 from typing import Dict, List, Optional, Tuple
 
 from ..agents.memory_manager import MemoryManager
@@ -12,6 +15,24 @@ from .world_manager import WorldManager
 
 logger = logging.getLogger(__name__)
 
+# Shared parameters for every observe fallback; to_action still mints a fresh
+# Action (with its own ID) per call
+_OBSERVE_ACTION_TEMPLATE = ObserveAction()
+
+# Action verb -> key holding its argument in the JSON action object
+_ACTION_ARGUMENT_KEYS = {
+    "move": "destination",
+    "wait": "reason",
+    "observe": None,
+    "interact": "target",
+}
+
+# Fallback patterns for flattened action strings the split-based parser doesn't
+# recognize (e.g. "WAITING for Bob")
+_MOVE_RE = re.compile(r'MOVE\s+(?:TO\s+)?(.*)', re.IGNORECASE)
+_WAIT_RE = re.compile(r'WAIT\s*(.*)', re.IGNORECASE)
+_INTERACT_RE = re.compile(r'INTERACT\s*(.*)', re.IGNORECASE)
+
 
 class LLMBehavior:
     """LLM-powered behavior system that uses real AI reasoning for agent decisions."""
@@ -35,6 +56,19 @@ class LLMBehavior:
         self.llm_service = llm_service or LLMService()
         self.memory_manager = memory_manager
         self.planning_engine = planning_engine
+        
+        # Caps in-flight generate calls so batched decisions don't queue up
+        # behind a single model server
+        self._gen_sem = asyncio.Semaphore(max(1, self.llm_service.settings.ollama_max_parallel))
+        
+        # prompt -> in-flight request, shared by identical prompts in deterministic mode
+        self._pending_decisions: Dict[str, asyncio.Future] = {}
+        
+        # Number of decisions made locally without an LLM call
+        self.fast_path_hits = 0
+        
+        # agent_id -> ((name, bio, personality), (static prompt prefix, trailer))
+        self._static_prompt_cache: Dict[str, Tuple[Tuple[str, str, str], Tuple[str, str]]] = {}
     
     async def choose_action_with_reasoning(self, agent: Agent) -> Tuple[Action, str]:
         """Choose an action for an agent using LLM reasoning.
@@ -49,19 +83,83 @@ class LLMBehavior:
             # Get current context
             context = await self._build_agent_context(agent)
             
+            # Skip the LLM when the situation leaves only one sensible choice
+            fast_decision = self._fast_path_decision(agent, context)
+            if fast_decision is not None:
+                self.fast_path_hits += 1
+                logger.debug("Fast-path decision for %s (%d hits so far)", agent.name, self.fast_path_hits)
+                return fast_decision
+            
             # Generate LLM decision with reasoning
             action, reasoning = await self._generate_llm_decision(agent, context)
             
-            logger.debug(f"LLM decision for {agent.name}: {action.action_type} - {reasoning}")
+            logger.debug("LLM decision for %s: %s - %s", agent.name, action.action_type.value, reasoning)
             return action, reasoning
             
         except Exception as e:
-            logger.error(f"LLM decision failed for {agent.name}: {e}")
+            logger.error("LLM decision failed for %s: %s", agent.name, e)
             # Fallback to a safe default action
-            fallback_action = ObserveAction().to_action(agent.id)
+            fallback_action = _OBSERVE_ACTION_TEMPLATE.to_action(agent.id)
             fallback_reasoning = f"Fallback to observation due to decision error: {str(e)}"
             return fallback_action, fallback_reasoning
     
+    def _fast_path_decision(self, agent: Agent, context: Dict) -> Optional[Tuple[Action, str]]:
+        """Decide locally when the context is too constrained to need the LLM.
+        
+        Args:
+            agent: The agent
+            context: Current context
+            
+        Returns:
+            Tuple of (Action, reasoning_text), or None if the LLM should decide
+        """
+        settings = self.llm_service.settings
+        if not settings.decision_fast_path or context['current_task']:
+            return None
+        
+        energy = context['agent_energy']
+        if energy < settings.fast_path_rest_max_energy:
+            action = WaitAction(duration_minutes=5, reason="too tired to do anything else").to_action(agent.id)
+            return action, "I'm exhausted and need to rest before doing anything else."
+        
+        if (
+            energy > settings.fast_path_observe_min_energy
+            and not context['available_destinations']
+            and not context['other_agents']
+        ):
+            return _OBSERVE_ACTION_TEMPLATE.to_action(agent.id), "Nothing to do but observe."
+        
+        return None
+    
+    async def choose_actions_batch(self, agents: List[Agent]) -> List[Tuple[Action, str]]:
+        """Choose actions for several agents concurrently.
+        
+        Decisions are LLM-bound, so they are fanned out together and the
+        step takes about as long as the slowest decision instead of the sum.
+        
+        Args:
+            agents: The agents to choose actions for
+            
+        Returns:
+            List of (Action, reasoning_text) tuples, in the same order as agents
+        """
+        results = await asyncio.gather(
+            *(self.choose_action_with_reasoning(agent) for agent in agents),
+            return_exceptions=True
+        )
+        
+        decisions = []
+        for agent, result in zip(agents, results):
+            if isinstance(result, BaseException):
+                logger.error("Batched LLM decision failed for %s: %s", agent.name, result)
+                result = (
+                    _OBSERVE_ACTION_TEMPLATE.to_action(agent.id),
+                    f"Fallback to observation due to decision error: {str(result)}"
+                )
+            decisions.append(result)
+        
+        return decisions
+    
     async def choose_action(self, agent: Agent) -> Action:
         """Choose an action for an agent (compatibility with existing system).
         
@@ -96,17 +194,16 @@ class LLMBehavior:
         place_description = place_info.get("description", "") if place_info else ""
         
         # Get other agents at location
-        other_agents = []
-        if place_info:
-            other_agents = [agent_id for agent_id in place_info.get("agents", []) if agent_id != agent.id]
+        other_agents = self.world_manager.get_other_agents_at_location(current_location, agent.id)
         
         # Get connected places
         connected_places = self.world_manager.get_connected_places(current_location)
         available_destinations = []
+        dest_by_name_lower = {}
         for place_id in connected_places:
-            dest_info = self.world_manager.get_place_info(place_id)
-            dest_name = dest_info["name"] if dest_info else place_id
+            dest_name = self.world_manager.get_place_name(place_id)
             available_destinations.append(dest_name)
+            dest_by_name_lower[dest_name.lower()] = place_id
         
         # Retrieve relevant memories if memory manager is available
         relevant_memories = []
@@ -129,7 +226,7 @@ class LLMBehavior:
                 relevant_memories = [result.memory for result in memory_results]
                 
             except Exception as e:
-                logger.warning(f"Failed to retrieve memories for {agent.name}: {e}")
+                logger.warning("Failed to retrieve memories for %s: %s", agent.name, e)
         
         # Get current plan context if planning engine is available
         current_plan = None
@@ -144,7 +241,7 @@ class LLMBehavior:
                     current_plan_task = await self.planning_engine.get_current_task(agent.id)
                     
             except Exception as e:
-                logger.warning(f"Failed to retrieve plan for {agent.name}: {e}")
+                logger.warning("Failed to retrieve plan for %s: %s", agent.name, e)
         
         return {
             "current_location": current_location,
@@ -152,6 +249,7 @@ class LLMBehavior:
             "place_description": place_description,
             "other_agents": other_agents,
             "available_destinations": available_destinations,
+            "dest_by_name_lower": dest_by_name_lower,
             "agent_energy": agent.state.energy,
             "agent_mood": agent.state.mood,
             "current_task": agent.state.current_task,
@@ -174,33 +272,105 @@ class LLMBehavior:
         # Build the decision prompt
         prompt = self._build_decision_prompt(agent, context)
         
-        logger.info(f"🎭 COGNITIVE PROCESS: {agent.name} is thinking and making decisions (location: {context.get('location', 'unknown')})")
+        logger.info(
+            "🎭 COGNITIVE PROCESS: %s is thinking and making decisions (location: %s)",
+            agent.name, context.get('location', 'unknown')
+        )
         
         try:
             # Generate LLM response
-            response = await self.llm_service.ollama_client.generate(
-                model=self.llm_service.settings.ollama_model,
-                prompt=prompt,
-                options={
-                    "temperature": 0.7,  # Allow for creative but consistent thinking
-                    "top_p": 0.9,
-                    "num_predict": 300
-                }
-            )
+            response_text = await self._request_decision(prompt)
             
             # Parse the response
-            action, reasoning = self._parse_llm_response(response.response, agent, context)
+            action, reasoning = self._parse_llm_response(response_text, agent, context)
             
-            logger.info(f"🎯 DECISION COMPLETE: {agent.name} chose '{action.action_type}' action")
+            logger.info("🎯 DECISION COMPLETE: %s chose '%s' action", agent.name, action.action_type.value)
             return action, reasoning
             
         except Exception as e:
-            logger.error(f"LLM generation failed for {agent.name}: {e}")
+            logger.error("LLM generation failed for %s: %s", agent.name, e)
             # Create a safe fallback
-            fallback_action = ObserveAction().to_action(agent.id)
+            fallback_action = _OBSERVE_ACTION_TEMPLATE.to_action(agent.id)
             fallback_reasoning = f"Using fallback observation due to LLM error"
             return fallback_action, fallback_reasoning
     
+    async def _request_decision(self, prompt: str) -> str:
+        """Request a decision, coalescing identical in-flight prompts when deterministic.
+        
+        At temperature 0 identical prompts produce identical responses, so
+        agents whose prompts match (e.g. cloned agents idling in the same
+        place) share a single LLM call.
+        
+        Args:
+            prompt: Decision prompt
+            
+        Returns:
+            Generated JSON text
+        """
+        if not self.llm_service.settings.deterministic_mode:
+            return await self._request_decision_bounded(prompt)
+        
+        pending = self._pending_decisions.get(prompt)
+        if pending is None:
+            pending = asyncio.ensure_future(self._request_decision_bounded(prompt))
+            self._pending_decisions[prompt] = pending
+            pending.add_done_callback(lambda _: self._pending_decisions.pop(prompt, None))
+        
+        # Shielded so one cancelled waiter doesn't cancel the shared request
+        return await asyncio.shield(pending)
+    
+    async def _request_decision_bounded(self, prompt: str) -> str:
+        """Stream a decision while holding a generation slot.
+        
+        Args:
+            prompt: Decision prompt
+            
+        Returns:
+            Generated JSON text
+        """
+        async with self._gen_sem:
+            return await self._stream_decision(prompt)
+    
+    async def _stream_decision(self, prompt: str) -> str:
+        """Stream a JSON decision from the LLM, stopping once the object is complete.
+        
+        JSON mode can keep emitting trailing whitespace after the closing
+        brace, so the stream is closed as soon as the buffer parses. No stop
+        sequence is set: blank lines can legitimately appear inside or before
+        a pretty-printed object.
+        
+        Args:
+            prompt: Decision prompt
+            
+        Returns:
+            Generated JSON text
+        """
+        buffer = ""
+        
+        stream = self.llm_service.ollama_client.generate_stream(
+            model=self.llm_service.settings.ollama_model,
+            prompt=prompt,
+            format="json",
+            options={
+                # Allow for creative but consistent thinking, unless runs must be reproducible
+                "temperature": 0.0 if self.llm_service.settings.deterministic_mode else 0.7,
+                "top_p": 0.9,
+                "num_predict": 300  # Safety cap if the object never closes
+            }
+        )
+        async with aclosing(stream):
+            async for chunk in stream:
+                buffer += chunk
+                
+                if "}" in chunk:
+                    try:
+                        json.loads(buffer)
+                        break
+                    except json.JSONDecodeError:
+                        pass
+        
+        return buffer
+    
     def _build_decision_prompt(self, agent: Agent, context: Dict) -> str:
         """Build the prompt for LLM decision making.
         
@@ -265,43 +435,69 @@ class LLMBehavior:
         if planning_context:
             planning_context += "Consider how your planned activities align with what you want to do right now."
         
-        prompt = f"""You are {agent.name}, a character in a social simulation.
+        prefix, trailer = self._get_static_prompt_parts(agent)
+        prompt = "".join([
+            prefix,
+            "Current situation:\n",
+            f"- {location_context}\n",
+            f"- {social_context}\n",
+            f"- {destinations_context}\n",
+            f"- {energy_context}\n",
+            f"- {task_context}\n\n",
+            memory_context,
+            "\n\n",
+            planning_context,
+            "\n\nWhat would you like to do next? Think about what this character would naturally "
+            "want to do given their personality, current situation, social context, past experiences, "
+            "and planned activities.\n\n",
+            trailer,
+        ])
+
+        return prompt
+    
+    def _get_static_prompt_parts(self, agent: Agent) -> Tuple[str, str]:
+        """Get the parts of the decision prompt that don't change between ticks.
+        
+        Keeping the prefix first and byte-identical across calls lets the model
+        server reuse its cached prefix instead of re-processing it every decision.
+        
+        Args:
+            agent: The agent
+            
+        Returns:
+            Tuple of (static prompt prefix, closing reminder) for this agent
+        """
+        signature = (agent.name, agent.bio, agent.personality)
+        cached = self._static_prompt_cache.get(agent.id)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        prefix = f"""You are {agent.name}, a character in a social simulation.
 
 Your background: {agent.bio}
 
 Your personality: {agent.personality}
 
-Current situation:
-- {location_context}
-- {social_context}
-- {destinations_context}
-- {energy_context}
-- {task_context}
-
-{memory_context}
-
-{planning_context}
-
-What would you like to do next? Think about what this character would naturally want to do given their personality, current situation, social context, past experiences, and planned activities.
-
 Available actions:
 1. MOVE to another location (specify which one from the available destinations)
 2. WAIT and rest (specify why you're waiting)
 3. OBSERVE your surroundings (look around and take in the environment)
 4. INTERACT with the environment or people around you
 
-Please respond in this exact format:
-
-REASONING: [Your thoughts as {agent.name} - what are you thinking and feeling? Why do you want to take this action? Be authentic to your personality and situation. Consider how your past experiences influence this decision]
-
-ACTION: [Choose exactly one: MOVE to [destination] | WAIT [reason] | OBSERVE | INTERACT [with what/whom]]
+Please respond with a single JSON object in exactly this shape:
 
-Remember: You are {agent.name}, with the personality traits "{agent.personality}". Think and act in character based on your experiences!"""
+{{"reasoning": "Your thoughts as {agent.name} - what are you thinking and feeling? Why do you want to take this action? Be authentic to your personality and situation. Consider how your past experiences influence this decision", "action": {{"type": "MOVE | WAIT | OBSERVE | INTERACT", "destination": "place name, for MOVE", "reason": "why you're waiting, for WAIT", "target": "what/whom, for INTERACT"}}}}
 
-        return prompt
+"""
+        trailer = (
+            f'Remember: You are {agent.name}, with the personality traits "{agent.personality}". '
+            "Think and act in character based on your experiences!"
+        )
+        self._static_prompt_cache[agent.id] = (signature, (prefix, trailer))
+        return prefix, trailer
     
     def _parse_llm_response(self, response: str, agent: Agent, context: Dict) -> Tuple[Action, str]:
-        """Parse LLM response into action and reasoning.
+        """Parse a JSON LLM response into action and reasoning.
         
         Args:
             response: Raw LLM response
@@ -312,28 +508,47 @@ Remember: You are {agent.name}, with the personality traits "{agent.personality}
             Tuple of (Action, reasoning_text)
         """
         try:
-            # Extract reasoning
-            reasoning_match = re.search(r'REASONING:\s*(.*?)(?=ACTION:|$)', response, re.DOTALL | re.IGNORECASE)
-            reasoning = reasoning_match.group(1).strip() if reasoning_match else "I'm thinking about what to do next."
+            payload = json.loads(response)
+            if not isinstance(payload, dict):
+                raise ValueError(f"expected a JSON object, got {type(payload).__name__}")
             
-            # Extract action
-            action_match = re.search(r'ACTION:\s*(.*?)(?:\n|$)', response, re.IGNORECASE)
-            action_text = action_match.group(1).strip() if action_match else ""
+            reasoning = str(payload.get("reasoning") or "I'm thinking about what to do next.").strip()
             
-            # Parse action into concrete Action object
-            action = self._parse_action_text(action_text, agent, context)
+            action_payload = payload.get("action")
+            if isinstance(action_payload, dict):
+                action = self._parse_action_payload(action_payload, agent, context)
+            else:
+                # Some models flatten the action to a "MOVE to X" string
+                action = self._parse_action_text(str(action_payload or ""), agent, context)
             
             return action, reasoning
             
         except Exception as e:
-            logger.warning(f"Failed to parse LLM response for {agent.name}: {e}")
+            logger.warning("Failed to parse LLM response for %s: %s", agent.name, e)
             # Return safe fallback
-            fallback_action = ObserveAction().to_action(agent.id)
+            fallback_action = _OBSERVE_ACTION_TEMPLATE.to_action(agent.id)
             fallback_reasoning = "I need to observe my surroundings and think about my next move."
             return fallback_action, fallback_reasoning
     
+    def _parse_action_payload(self, action_payload: Dict, agent: Agent, context: Dict) -> Action:
+        """Parse the JSON action object into a concrete Action object.
+        
+        Args:
+            action_payload: The "action" object from the LLM response
+            agent: The agent
+            context: Current context
+            
+        Returns:
+            Parsed Action object
+        """
+        verb = str(action_payload.get("type", "")).strip().lower()
+        argument_key = _ACTION_ARGUMENT_KEYS.get(verb)
+        argument = str(action_payload.get(argument_key) or "").strip() if argument_key else ""
+        
+        return self._build_action(verb, argument, agent, context)
+    
     def _parse_action_text(self, action_text: str, agent: Agent, context: Dict) -> Action:
-        """Parse action text into a concrete Action object.
+        """Parse a plain-text action line into a concrete Action object.
         
         Args:
             action_text: The action text from LLM
@@ -343,42 +558,96 @@ Remember: You are {agent.name}, with the personality traits "{agent.personality}
         Returns:
             Parsed Action object
         """
-        action_text = action_text.strip().upper()
+        parts = action_text.split(None, 1)
+        verb = parts[0].lower() if parts else ""
+        argument = parts[1].strip() if len(parts) > 1 else ""
         
-        if action_text.startswith("MOVE"):
-            # Parse destination
-            move_match = re.search(r'MOVE\s+(?:TO\s+)?(.*)', action_text)
-            if move_match:
-                destination_name = move_match.group(1).strip()
-                
-                # Find matching place ID
-                for place_id in context['available_destinations']:
-                    place_info = self.world_manager.get_place_info(place_id)
-                    if place_info and destination_name.lower() in place_info["name"].lower():
-                        return MoveAction(target_place_id=place_id).to_action(agent.id)
-                
-                # If no exact match, try the first available destination
-                connected_places = self.world_manager.get_connected_places(context['current_location'])
-                if connected_places:
-                    return MoveAction(target_place_id=connected_places[0]).to_action(agent.id)
-        
-        elif action_text.startswith("WAIT"):
-            # Parse wait reason
-            wait_match = re.search(r'WAIT\s*(.*)', action_text)
-            reason = wait_match.group(1).strip() if wait_match else "resting and thinking"
-            return WaitAction(duration_minutes=5, reason=reason).to_action(agent.id)
-        
-        elif action_text.startswith("OBSERVE"):
-            return ObserveAction().to_action(agent.id)
-        
-        elif action_text.startswith("INTERACT"):
-            # Parse interaction target
-            interact_match = re.search(r'INTERACT\s*(.*)', action_text)
-            target = interact_match.group(1).strip() if interact_match else "environment"
-            return InteractAction(interaction_type=f"interact with {target}").to_action(agent.id)
+        if verb in _ACTION_ARGUMENT_KEYS:
+            if verb == "move":
+                # Drop an optional leading "to"
+                tokens = argument.split(None, 1)
+                if len(tokens) == 2 and tokens[0].lower() == "to":
+                    argument = tokens[1]
+        else:
+            verb, argument = self._match_action_text(action_text)
+        
+        return self._build_action(verb, argument, agent, context)
+    
+    def _build_action(self, verb: str, argument: str, agent: Agent, context: Dict) -> Action:
+        """Build a concrete Action from a parsed verb and its argument.
+        
+        Args:
+            verb: Lowercase action verb ("move", "wait", "observe" or "interact")
+            argument: Destination, wait reason or interaction target
+            agent: The agent
+            context: Current context
+            
+        Returns:
+            Action object, observing if the verb is unknown or unusable
+        """
+        if verb == "move" and argument:
+            # Resolve the destination name to a place ID, exact match first
+            destination = argument.lower()
+            dest_by_name_lower = context.get('dest_by_name_lower', {})
+            place_id = dest_by_name_lower.get(destination)
+            if place_id is None:
+                for name_lower, candidate_id in dest_by_name_lower.items():
+                    if destination in name_lower or name_lower in destination:
+                        place_id = candidate_id
+                        break
+            if place_id is not None:
+                return MoveAction(target_place_id=place_id).to_action(agent.id)
+            
+            # If no match, try the first available destination
+            connected_places = self.world_manager.get_connected_places(context['current_location'])
+            if connected_places:
+                return MoveAction(target_place_id=connected_places[0]).to_action(agent.id)
+        
+        elif verb == "wait":
+            return WaitAction(duration_minutes=5, reason=argument).to_action(agent.id)
+        
+        elif verb == "interact":
+            target = argument or "environment"
+            # Record a co-located agent named in the target, so the executor and
+            # memory scoring treat this as a social interaction. Prefer an exact
+            # id, then the longest id that appears as a whole word.
+            target_lower = target.strip().lower()
+            other_agents = context.get('other_agents', [])
+            target_agent_id = next(
+                (other for other in other_agents if other.lower() == target_lower),
+                None
+            )
+            if target_agent_id is None:
+                target_agent_id = next(
+                    (
+                        other for other in sorted(other_agents, key=len, reverse=True)
+                        if re.search(rf"(?<!\w){re.escape(other.lower())}(?!\w)", target_lower)
+                    ),
+                    None
+                )
+            return InteractAction(
+                target_agent_id=target_agent_id,
+                interaction_type=f"interact with {target}"
+            ).to_action(agent.id)
         
         # Default fallback
-        return ObserveAction().to_action(agent.id)
+        return _OBSERVE_ACTION_TEMPLATE.to_action(agent.id)
+    
+    def _match_action_text(self, action_text: str) -> Tuple[str, str]:
+        """Match an irregular action line against the fallback patterns.
+        
+        Args:
+            action_text: The action text from LLM
+            
+        Returns:
+            Tuple of (verb, argument), or ("", "") if nothing matched
+        """
+        for verb, pattern in (("move", _MOVE_RE), ("wait", _WAIT_RE), ("interact", _INTERACT_RE)):
+            match = pattern.match(action_text)
+            if match:
+                return verb, match.group(1).strip()
+        
+        return "", ""
     
     async def health_check(self) -> bool:
         """Check if the LLM behavior system is working.
@@ -389,5 +658,5 @@ Remember: You are {agent.name}, with the personality traits "{agent.personality}
         try:
             return await self.llm_service.health_check()
         except Exception as e:
-            logger.warning(f"LLM behavior health check failed: {e}")
+            logger.warning("LLM behavior health check failed: %s", e)
             return False
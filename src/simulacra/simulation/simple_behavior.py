@@ -2,14 +2,39 @@
 
 import logging
 import random
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, Mapping, Optional, Sequence, Tuple
 
-from ..models.action import Action, MoveAction, WaitAction, ObserveAction
+from ..models.action import Action, ActionType, MoveAction, WaitAction, ObserveAction
 from ..models.agent import Agent
 from .world_manager import WorldManager
 
 logger = logging.getLogger(__name__)
 
+_SOCIAL_TAGS = frozenset({"social", "community"})
+_INTROVERTED_TAGS = frozenset({"introverted", "quiet"})
+_ACTIVE_TAGS = frozenset({"active", "energetic"})
+
+# Default behavior for agents without a matching personality
+_RANDOM_ACTION_TYPES = ("move", "wait", "observe")
+_RANDOM_ACTION_WEIGHTS = (0.4, 0.3, 0.3)
+
+# Parameter models are never modified after construction, so they are shared;
+# to_action still mints a fresh Action (with its own ID) per call
+_OBSERVE_ACTION_TEMPLATE = ObserveAction()
+
+
+@lru_cache(maxsize=64)
+def _wait_action(duration_minutes: int, reason: str) -> WaitAction:
+    """Get the shared WaitAction parameters for a duration and reason."""
+    return WaitAction(duration_minutes=duration_minutes, reason=reason)
+
+
+@lru_cache(maxsize=256)
+def _move_action(target_place_id: str) -> MoveAction:
+    """Get the shared MoveAction parameters for a destination."""
+    return MoveAction(target_place_id=target_place_id)
+
 
 class SimpleBehavior:
     """Simple behavior system for basic agent actions."""
@@ -21,13 +46,41 @@ class SimpleBehavior:
             world_manager: World state manager
         """
         self.world_manager = world_manager
-        self.agent_last_actions: dict[str, str] = {}  # Track last action to avoid loops
+        
+        # place_id -> connected place IDs; the world topology is fixed after initialization
+        self._connected_cache: Dict[str, Tuple[str, ...]] = {}
+    
+    def invalidate_connectivity(self) -> None:
+        """Forget cached place connections, e.g. after the world is re-initialized."""
+        self._connected_cache.clear()
     
-    async def choose_action(self, agent: Agent) -> Action:
+    def _get_connected_places(self, place_id: str) -> Tuple[str, ...]:
+        """Get places connected to a place, caching the result.
+        
+        Args:
+            place_id: ID of the place
+            
+        Returns:
+            Tuple of connected place IDs
+        """
+        connected = self._connected_cache.get(place_id)
+        if connected is None:
+            connected = self._connected_cache[place_id] = tuple(
+                self.world_manager.get_connected_places(place_id)
+            )
+        return connected
+    
+    async def choose_action(
+        self,
+        agent: Agent,
+        occupancy: Optional[Mapping[str, int]] = None
+    ) -> Action:
         """Choose an action for an agent based on simple rules.
         
         Args:
             agent: The agent to choose an action for
+            occupancy: Agent count per place ID, computed once per tick by the
+                caller (taken from the world manager if None)
             
         Returns:
             Action for the agent to perform
@@ -39,17 +92,21 @@ class SimpleBehavior:
             await self.world_manager.place_agent(agent.id, agent.home_location)
             current_location = agent.home_location
             
-            return ObserveAction().to_action(agent.id)
+            return _OBSERVE_ACTION_TEMPLATE.to_action(agent.id)
         
         # Get possible moves
-        connected_places = self.world_manager.get_connected_places(current_location)
-        last_action = self.agent_last_actions.get(agent.id, "")
+        connected_places = self._get_connected_places(current_location)
+        last_action = agent.state.last_action_type
+        if occupancy is None:
+            occupancy = self.world_manager.get_occupancy_counts()
         
         # Simple personality-based behavior
-        action = self._choose_personality_based_action(agent, current_location, connected_places, last_action)
+        action = self._choose_personality_based_action(
+            agent, current_location, connected_places, last_action, occupancy
+        )
         
-        # Remember this action
-        self.agent_last_actions[agent.id] = action.action_type.value if hasattr(action.action_type, 'value') else str(action.action_type)
+        # Remember this action to avoid loops
+        agent.state.last_action_type = action.action_type
         
         return action
     
@@ -57,8 +114,9 @@ class SimpleBehavior:
         self, 
         agent: Agent, 
         current_location: str, 
-        connected_places: List[str],
-        last_action: str
+        connected_places: Sequence[str],
+        last_action: Optional[ActionType],
+        occupancy: Mapping[str, int]
     ) -> Action:
         """Choose action based on agent personality.
         
@@ -66,120 +124,104 @@ class SimpleBehavior:
             agent: The agent
             current_location: Current place ID
             connected_places: Places agent can move to
-            last_action: Last action type performed
+            last_action: Last action type chosen, if any
+            occupancy: Agent count per place ID
             
         Returns:
             Chosen action
         """
-        personality = agent.personality.lower()
+        tags = agent.personality_tags
         
         # Avoid doing the same action repeatedly
-        if last_action == "wait" and random.random() < 0.7:
+        if last_action is ActionType.WAIT and random.random() < 0.7:
             # If we just waited, prefer to move or observe
             if connected_places and random.random() < 0.8:
-                return self._choose_move_action(connected_places)
+                return self._choose_move_action(connected_places, agent.id)
             else:
-                return ObserveAction().to_action(agent.id)
+                return _OBSERVE_ACTION_TEMPLATE.to_action(agent.id)
         
         # Personality-based tendencies
-        if "social" in personality or "community" in personality:
+        if not _SOCIAL_TAGS.isdisjoint(tags):
             # Social agents prefer to move to busier places
-            return self._choose_social_action(agent, current_location, connected_places)
+            return self._choose_social_action(agent, current_location, connected_places, occupancy)
         
-        elif "introverted" in personality or "quiet" in personality:
+        elif not _INTROVERTED_TAGS.isdisjoint(tags):
             # Introverted agents prefer quieter places and observation
-            return self._choose_introverted_action(agent, current_location, connected_places)
+            return self._choose_introverted_action(agent, current_location, connected_places, occupancy)
         
-        elif "active" in personality or "energetic" in personality:
+        elif not _ACTIVE_TAGS.isdisjoint(tags):
             # Active agents prefer to move around
             if connected_places and random.random() < 0.7:
-                return self._choose_move_action(connected_places)
+                return self._choose_move_action(connected_places, agent.id)
             else:
-                return ObserveAction().to_action(agent.id)
+                return _OBSERVE_ACTION_TEMPLATE.to_action(agent.id)
         
         else:
             # Default behavior - random choice
-            return self._choose_random_action(current_location, connected_places)
+            return self._choose_random_action(agent.id, current_location, connected_places)
     
-    def _choose_social_action(self, agent: Agent, current_location: str, connected_places: List[str]) -> Action:
+    def _choose_social_action(
+        self,
+        agent: Agent,
+        current_location: str,
+        connected_places: Sequence[str],
+        occupancy: Mapping[str, int]
+    ) -> Action:
         """Choose action for social agents."""
-        # Look for places with other agents
-        best_place = None
-        most_agents = -1
-        
-        for place_id in connected_places:
-            agents_there = self.world_manager.get_agents_at_location(place_id)
-            if len(agents_there) > most_agents:
-                most_agents = len(agents_there)
-                best_place = place_id
-        
-        # Move to busiest place if found, otherwise explore
-        if best_place and most_agents > 0:
-            return MoveAction(target_place_id=best_place).to_action(agent.id)
+        # Look for the busiest connected place
+        best_place = max(connected_places, key=lambda place_id: occupancy.get(place_id, 0), default=None)
+        
+        # Move to busiest place if anyone is there, otherwise explore
+        if best_place and occupancy.get(best_place, 0) > 0:
+            return _move_action(best_place).to_action(agent.id)
         elif connected_places and random.random() < 0.6:
-            return self._choose_move_action(connected_places)
+            return self._choose_move_action(connected_places, agent.id)
         else:
             # Wait and observe, might attract others
-            return WaitAction(
-                duration_minutes=random.randint(3, 8),
-                reason="socializing and people-watching"
-            ).to_action(agent.id)
+            return _wait_action(random.randint(3, 8), "socializing and people-watching").to_action(agent.id)
     
-    def _choose_introverted_action(self, agent: Agent, current_location: str, connected_places: List[str]) -> Action:
+    def _choose_introverted_action(
+        self,
+        agent: Agent,
+        current_location: str,
+        connected_places: Sequence[str],
+        occupancy: Mapping[str, int]
+    ) -> Action:
         """Choose action for introverted agents."""
         # Check if current location is crowded
-        current_occupancy = len(self.world_manager.get_agents_at_location(current_location))
+        current_occupancy = occupancy.get(current_location, 0)
         
         if current_occupancy > 2:  # Too crowded, find a quieter place
-            quietest_place = None
-            fewest_agents = float('inf')
-            
-            for place_id in connected_places:
-                agents_there = self.world_manager.get_agents_at_location(place_id)
-                if len(agents_there) < fewest_agents:
-                    fewest_agents = len(agents_there)
-                    quietest_place = place_id
+            quietest_place = min(
+                connected_places, key=lambda place_id: occupancy.get(place_id, 0), default=None
+            )
             
             if quietest_place:
-                return MoveAction(target_place_id=quietest_place).to_action(agent.id)
+                return _move_action(quietest_place).to_action(agent.id)
         
         # Prefer to observe or wait quietly
         if random.random() < 0.6:
-            return ObserveAction().to_action(agent.id)
+            return _OBSERVE_ACTION_TEMPLATE.to_action(agent.id)
         else:
-            return WaitAction(
-                duration_minutes=random.randint(5, 10),
-                reason="enjoying the peaceful atmosphere"
-            ).to_action(agent.id)
+            return _wait_action(random.randint(5, 10), "enjoying the peaceful atmosphere").to_action(agent.id)
     
-    def _choose_move_action(self, connected_places: List[str]) -> Action:
+    def _choose_move_action(self, connected_places: Sequence[str], agent_id: str) -> Action:
         """Choose a random move action."""
         target_place = random.choice(connected_places)
-        return MoveAction(target_place_id=target_place).to_action("dummy")  # Agent ID will be set by caller
+        return _move_action(target_place).to_action(agent_id)
     
-    def _choose_random_action(self, current_location: str, connected_places: List[str]) -> Action:
+    def _choose_random_action(
+        self,
+        agent_id: str,
+        current_location: str,
+        connected_places: Sequence[str]
+    ) -> Action:
         """Choose a random action."""
-        action_weights = [
-            (0.4, "move"),
-            (0.3, "wait"),
-            (0.3, "observe")
-        ]
-        
-        rand = random.random()
-        cumulative = 0.0
-        
-        for weight, action_type in action_weights:
-            cumulative += weight
-            if rand < cumulative:
-                if action_type == "move" and connected_places:
-                    return self._choose_move_action(connected_places)
-                elif action_type == "wait":
-                    return WaitAction(
-                        duration_minutes=random.randint(3, 7),
-                        reason="thinking and relaxing"
-                    ).to_action("dummy")
-                else:
-                    return ObserveAction().to_action("dummy")
-        
-        # Fallback
-        return ObserveAction().to_action("dummy")
+        action_type = random.choices(_RANDOM_ACTION_TYPES, _RANDOM_ACTION_WEIGHTS)[0]
+        
+        if action_type == "move" and connected_places:
+            return self._choose_move_action(connected_places, agent_id)
+        elif action_type == "wait":
+            return _wait_action(random.randint(3, 7), "thinking and relaxing").to_action(agent_id)
+        else:
+            return _OBSERVE_ACTION_TEMPLATE.to_action(agent_id)
@@ -2,7 +2,9 @@
 
 import asyncio
 import logging
-from typing import Dict, List, Optional
+import math
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
 
 from ..agents.memory_manager import MemoryManager
 from ..agents.reflection_engine import ReflectionEngine
@@ -11,7 +13,9 @@ from ..config import get_settings
 from ..config.agent_config import AgentConfigLoader
 from ..config.world_config import WorldConfigLoader
 from ..logging.simulation_logger import SimulationLogger
+from ..models.action import Action, ActionResult, ActionType
 from ..models.agent import Agent
+from ..models.memory import Memory
 from ..storage.sqlite_store import SQLiteStore
 from ..storage.vector_store import VectorStore
 from .action_executor import ActionExecutor
@@ -35,47 +39,88 @@ class SimulationController:
         self.settings = get_settings()
         
         # Beautiful logging system
-        self.sim_logger = SimulationLogger(session_name)
+        self.sim_logger = SimulationLogger(
+            session_name,
+            tick_summaries=self.settings.tick_summaries,
+            agent_actions=self.settings.log_agent_actions
+        )
         
         # Core components
         self.storage = SQLiteStore(self.settings.sqlite_db_path)
-        self.vector_store = VectorStore()
         self.world_config_loader = WorldConfigLoader(self.settings.world_config_path)
         self.agent_config_loader = AgentConfigLoader(self.settings.agents_config_path)
         
         # Simulation components
         self.world_manager = WorldManager(self.world_config_loader, self.storage)
-        self.time_manager = TimeManager(self.settings.tick_duration_minutes)
+        self.time_manager = TimeManager(
+            self.settings.tick_duration_minutes, self.settings.tick_interval_seconds
+        )
         self.action_executor = ActionExecutor(self.world_manager)
-        self.llm_service = LLMService(self.settings)
         
-        # Memory system
-        self.memory_manager = MemoryManager(self.storage, self.vector_store, self.llm_service)
+        # The vector store, LLM service, memory, reflection, planning and behavior
+        # systems are built on first use (see the properties below), so commands
+        # that only inspect state don't open Chroma or an Ollama connection pool
+        
+        # Concurrency control for parallel stepping: bounds how many agents are
+        # processed at once, and applies actions one at a time so world updates
+        # and each agent's thinking/action log lines stay together
+        self._agent_slots = asyncio.Semaphore(max(1, self.settings.max_concurrent_agents))
+        self._action_lock = asyncio.Lock()
         
-        # Reflection system
-        self.reflection_engine = ReflectionEngine(
+        # State
+        self.agents: Dict[str, Agent] = {}
+        # Tick iteration order; rebuilt whenever agents are loaded
+        self._agent_list: List[Agent] = []
+        self.is_initialized = False
+        
+        # Setup tick callback
+        self.time_manager.add_tick_callback(self._on_tick)
+    
+    @cached_property
+    def vector_store(self) -> VectorStore:
+        """Vector store for memory embeddings, with collections ready to use."""
+        vector_store = VectorStore(
+            backend=self.settings.vector_backend,
+            quantize=self.settings.vector_quantize,
+            host=self.settings.chroma_host,
+            port=self.settings.chroma_port
+        )
+        vector_store.initialize_collections()
+        return vector_store
+    
+    @cached_property
+    def llm_service(self) -> LLMService:
+        """Shared LLM service."""
+        return LLMService(self.settings)
+    
+    @cached_property
+    def memory_manager(self) -> MemoryManager:
+        """Memory system."""
+        return MemoryManager(self.storage, self.vector_store, self.llm_service)
+    
+    @cached_property
+    def reflection_engine(self) -> ReflectionEngine:
+        """Reflection system."""
+        return ReflectionEngine(
             self.memory_manager, self.storage, self.llm_service, self.settings
         )
-        
-        # Planning system
-        self.planning_engine = PlanningEngine(
+    
+    @cached_property
+    def planning_engine(self) -> PlanningEngine:
+        """Planning system."""
+        return PlanningEngine(
             self.memory_manager, self.storage, self.llm_service, self.settings
         )
-        
-        # Behavior system with memory and planning integration
-        self.behavior_system = LLMBehavior(
+    
+    @cached_property
+    def behavior_system(self) -> LLMBehavior:
+        """Behavior system with memory and planning integration."""
+        return LLMBehavior(
             self.world_manager, 
             self.llm_service, 
             self.memory_manager, 
             self.planning_engine
         )
-        
-        # State
-        self.agents: Dict[str, Agent] = {}
-        self.is_initialized = False
-        
-        # Setup tick callback
-        self.time_manager.add_tick_callback(self._on_tick)
     
     async def initialize(self) -> None:
         """Initialize the simulation."""
@@ -88,9 +133,6 @@ class SimulationController:
         # Initialize storage
         await self.storage.initialize_schema()
         
-        # Initialize vector store
-        self.vector_store.initialize_collections()
-        
         # Initialize world
         await self.world_manager.initialize()
         
@@ -128,6 +170,8 @@ class SimulationController:
             if not current_location:
                 await self.world_manager.place_agent(agent.id, agent.home_location)
                 logger.debug(f"Placed {agent.name} at {agent.home_location}")
+        
+        self._agent_list = list(self.agents.values())
     
     async def start_simulation(self) -> None:
         """Start the simulation."""
@@ -162,82 +206,316 @@ class SimulationController:
         elapsed_minutes = tick * self.settings.tick_duration_minutes
         self.sim_logger.log_tick_start(tick, elapsed_minutes)
         
-        # Process each agent
-        for agent in self.agents.values():
+        # Agents still in the middle of a wait skip deciding and acting entirely
+        agents = [agent for agent in self._agent_list if tick >= agent.state.wait_until_tick]
+        if logger.isEnabledFor(logging.DEBUG) and len(agents) < len(self._agent_list):
+            logger.debug(f"{len(self._agent_list) - len(agents)} agents still waiting on tick {tick}")
+        
+        await self._step_agents(agents, tick)
+        
+        # Get current agent summaries for beautiful logging, fetching plans
+        # concurrently; skipped entirely when the logger doesn't use them
+        if self.sim_logger.wants_tick_summary:
+            get_planning_info = self._get_planning_info
+            summarize_agent = self._summarize_agent
+            planning_infos = await asyncio.gather(*(get_planning_info(agent.id) for agent in self._agent_list))
+            agent_summaries = {
+                agent.id: summarize_agent(agent, planning_info)
+                for agent, planning_info in zip(self._agent_list, planning_infos)
+            }
+            
+            # Log beautiful tick completion
+            self.sim_logger.log_tick_complete(agent_summaries)
+        
+        # Stream logged data to disk periodically so long runs don't hold it all
+        flush_interval = self.settings.log_flush_interval
+        if flush_interval and tick % flush_interval == 0:
             try:
-                await self._process_agent_tick(agent, tick)
-            except Exception as e:
-                logger.error(f"Error processing agent {agent.name} on tick {tick}: {e}")
+                self.sim_logger.flush_partial()
+            except OSError as e:
+                # Logs are diagnostic; keep the buffers and keep simulating
+                logger.warning(f"Failed to stream logged data on tick {tick}: {e}")
         
-        # Get current agent summaries for beautiful logging
-        agent_summaries = {}
-        for agent_id, agent in self.agents.items():
-            location = self.world_manager.get_agent_location(agent_id)
-            place_info = self.world_manager.get_place_info(location) if location else None
+        logger.info(f"[{self.time_manager.format_tick_time(tick)}] Tick complete")
+    
+    async def _step_agents(self, agents: List[Agent], tick: int) -> None:
+        """Decide and process the given agents' actions for a tick, then save their state.
+        
+        Args:
+            agents: Agents acting this tick
+            tick: Current tick number
+        """
+        # Decide all agents' actions concurrently, unless the simulation needs
+        # each agent to see the effects of the previous agent's action
+        if self.settings.parallel_stepping:
+            decisions = await self.behavior_system.choose_actions_batch(agents)
+        else:
+            decisions = [None] * len(agents)
+        
+        # Process each agent, overlapping their memory/reflection/planning LLM calls
+        process_agent_tick = self._process_agent_tick
+        if self.settings.parallel_stepping:
+            results = await asyncio.gather(
+                *(process_agent_tick(agent, tick, decision) for agent, decision in zip(agents, decisions)),
+                return_exceptions=True
+            )
+            for agent, result in zip(agents, results):
+                if isinstance(result, Exception):
+                    self._log_agent_tick_error(agent, tick, result)
+        else:
+            for agent, decision in zip(agents, decisions):
+                try:
+                    await process_agent_tick(agent, tick, decision)
+                except Exception as e:
+                    self._log_agent_tick_error(agent, tick, e)
+        
+        # Save the tick's importance accumulation and moves in bulk rather than
+        # a write per memory or move, committed together. The transaction only
+        # spans these writes, never the LLM calls above, so other connections
+        # are not locked out while agents think. Locations go last since they
+        # also set the stored current_location.
+        if agents:
+            async with self.storage.transaction():
+                try:
+                    await self.storage.update_agent_states([agent.state for agent in agents])
+                except Exception as e:
+                    logger.error(f"Failed to save agent states on tick {tick}: {e}")
+                try:
+                    await self.world_manager.flush_locations()
+                except Exception as e:
+                    logger.error(f"Failed to save agent locations on tick {tick}: {e}")
+    
+    def _log_agent_tick_error(self, agent: Agent, tick: int, error: BaseException) -> None:
+        """Report an agent whose tick failed.
+        
+        Args:
+            agent: Agent whose tick failed
+            tick: Current tick number
+            error: The exception raised
+        """
+        logger.error(f"Error processing agent {agent.name} on tick {tick}: {error}")
+        # Log error beautifully too
+        if not self.sim_logger.enabled_for("agent_action"):
+            return
+        self.sim_logger.log_agent_action(
+            agent.name,
+            "error",
+            f"Action failed: {str(error)}",
+            False,
+            {"location": "unknown", "energy": agent.state.energy}
+        )
+    
+    async def _get_planning_info(self, agent_id: str) -> Dict:
+        """Get an agent's current plan and task for the tick summary.
+        
+        Args:
+            agent_id: ID of the agent
             
-            # Get planning information for the agent
-            planning_info = {"has_plan": False}
-            try:
-                current_plan = await self.planning_engine.get_current_daily_plan(agent_id)
-                current_task = await self.planning_engine.get_current_task(agent_id)
-                
-                planning_info = {
-                    "has_plan": current_plan is not None,
-                    "current_goal": current_plan.goals[0] if current_plan and current_plan.goals else None,
-                    "current_task": current_task.description if current_task else None,
-                    "current_task_location": current_task.location if current_task else None,
-                    "plan_blocks_count": len(current_plan.hourly_blocks) if current_plan else 0
-                }
-            except Exception as e:
-                planning_info = {"error": str(e)}
+        Returns:
+            Dictionary describing the agent's plan state, or an error entry
+            if the lookup failed, so one agent can't break the tick summary
+        """
+        try:
+            current_plan = await self.planning_engine.get_current_daily_plan(agent_id)
+            current_task = await self.planning_engine.get_current_task(agent_id)
             
-            agent_summaries[agent_id] = {
-                "name": agent.name,
-                "location": location,
-                "location_name": place_info["name"] if place_info else "unknown",
-                "energy": agent.state.energy,
-                "mood": agent.state.mood,
-                "status": agent.state.status.value if hasattr(agent.state.status, 'value') else str(agent.state.status),
-                "planning": planning_info
+            return {
+                "has_plan": current_plan is not None,
+                "current_goal": current_plan.goals[0] if current_plan and current_plan.goals else None,
+                "current_task": current_task.description if current_task else None,
+                "current_task_location": current_task.location if current_task else None,
+                "plan_blocks_count": len(current_plan.hourly_blocks) if current_plan else 0
             }
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def _summarize_agent(self, agent: Agent, planning_info: Dict) -> Dict:
+        """Build an agent's entry for the tick summary.
         
-        # Log beautiful tick completion
-        self.sim_logger.log_tick_complete(agent_summaries)
+        Args:
+            agent: Agent to summarize
+            planning_info: Result of _get_planning_info for the agent
+            
+        Returns:
+            Dictionary summarizing the agent
+        """
+        world_manager = self.world_manager
+        state = agent.state
+        location = world_manager.get_agent_location(agent.id)
         
-        logger.info(f"[{self.time_manager.format_tick_time(tick)}] Tick complete")
+        return {
+            "name": agent.name,
+            "location": location,
+            "location_name": world_manager.get_place_name(location) if location else "unknown",
+            "energy": state.energy,
+            "mood": state.mood,
+            "status": state.status.value,
+            "planning": planning_info
+        }
     
-    async def _process_agent_tick(self, agent: Agent, tick: int) -> None:
+    async def _process_agent_tick(
+        self,
+        agent: Agent,
+        tick: int,
+        decision: Optional[Tuple[Action, str]] = None
+    ) -> None:
         """Process one agent for a tick.
         
         Args:
             agent: Agent to process
             tick: Current tick number
+            decision: Pre-chosen (Action, reasoning), chosen here if None
         """
+        async with self._agent_slots:
+            await self._run_agent_tick(agent, tick, decision)
+    
+    async def _run_agent_tick(
+        self,
+        agent: Agent,
+        tick: int,
+        decision: Optional[Tuple[Action, str]]
+    ) -> None:
+        """Run one agent's tick once it holds a processing slot.
+        
+        Memory, reflection and planning failures are logged and skipped here;
+        anything else propagates to _on_tick, which reports it for the agent.
+        
+        Args:
+            agent: Agent to process
+            tick: Current tick number
+            decision: Pre-chosen (Action, reasoning), chosen here if None
+        """
+        # Choose action using LLM-powered behavior with real reasoning
+        if decision is None:
+            decision = await self.behavior_system.choose_action_with_reasoning(agent)
+        action, reasoning = decision
+        
+        async with self._action_lock:
+            location_name, result = await self._execute_agent_action(
+                agent, tick, action, reasoning
+            )
+        
+        # M3: Form memory from this action
+        memory = None
         try:
-            # Get current context for thinking display
-            current_location = self.world_manager.get_agent_location(agent.id)
-            place_info = self.world_manager.get_place_info(current_location) if current_location else None
-            available_actions = self.action_executor.get_available_actions(agent.id)
-            
-            # Choose action using LLM-powered behavior with real reasoning
-            action, reasoning = await self.behavior_system.choose_action_with_reasoning(agent)
-            action.agent_id = agent.id  # Ensure correct agent ID
+            memory = await self.memory_manager.form_memory_from_action(
+                agent, action, result, location_name
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Formed memory for {agent.name}: {memory.content[:50]}... (importance: {memory.importance_score:.1f})")
+        except Exception as e:
+            logger.error(f"Failed to form memory for {agent.name}: {e}")
+        
+        # M4 + M5: Reflection and planning are independent LLM round trips, so overlap them
+        await asyncio.gather(
+            self._reflect_on_memory(agent, tick, memory),
+            self._update_daily_plan(agent)
+        )
+    
+    async def _reflect_on_memory(self, agent: Agent, tick: int, memory: Optional[Memory]) -> None:
+        """Accumulate a new memory's importance and reflect if the threshold is reached.
+        
+        Args:
+            agent: Agent that formed the memory
+            tick: Current tick number
+            memory: Newly formed memory, or None if memory formation failed
+        """
+        if memory is None:
+            return
+        
+        try:
+            # M4: Update importance accumulator and check for reflection trigger
+            # The state is written with everyone else's at the end of the tick
+            await self.reflection_engine.update_importance_accumulator(
+                agent, memory.importance_score, persist=False
+            )
             
-            # Show the agent's thinking process
-            action_type_str = action.action_type.value if hasattr(action.action_type, 'value') else str(action.action_type)
-            location_name = place_info["name"] if place_info else current_location or "unknown"
+            # Check if agent should reflect
+            if await self.reflection_engine.should_reflect(agent, tick):
+                logger.info(f"Triggering reflection for {agent.name} (accumulated importance: {agent.state.importance_accumulator:.1f})")
+                agent.state.last_reflection_tick = tick
+                reflections = await self.reflection_engine.trigger_reflection(agent)
+                
+                if reflections:
+                    # Log reflection beautifully
+                    self.sim_logger.log_agent_reflection(
+                        agent.name,
+                        len(reflections),
+                        [r.content for r in reflections]
+                    )
+                    logger.info(f"Generated {len(reflections)} reflections for {agent.name}")
+        
+        except Exception as e:
+            logger.error(f"Failed to reflect for {agent.name}: {e}")
+    
+    async def _update_daily_plan(self, agent: Agent) -> None:
+        """Generate a new daily plan for an agent if one is needed.
+        
+        Args:
+            agent: Agent to plan for
+        """
+        try:
+            # M5: Check if agent should update their daily plan
+            if await self.planning_engine.should_plan(agent):
+                logger.info(f"Triggering daily planning for {agent.name}")
+                daily_plan = await self.planning_engine.generate_daily_plan(agent)
+                
+                if daily_plan:
+                    # Create plan summary for beautiful logging
+                    plan_summary = self._create_plan_summary(daily_plan)
+                    
+                    # Log plan generation with detailed summary
+                    self.sim_logger.log_agent_planning(agent.name, len(daily_plan.hourly_blocks), plan_summary)
+                    logger.info(f"Generated daily plan for {agent.name} with {len(daily_plan.hourly_blocks)} time blocks")
+        
+        except Exception as e:
+            logger.error(f"Failed to generate plan for {agent.name}: {e}")
+    
+    async def _execute_agent_action(
+        self,
+        agent: Agent,
+        tick: int,
+        action: Action,
+        reasoning: str
+    ) -> Tuple[str, ActionResult]:
+        """Execute an agent's chosen action and log its thinking and outcome.
+        
+        Args:
+            agent: Agent acting
+            tick: Current tick number
+            action: Chosen action
+            reasoning: Reasoning behind the action
             
-            self.sim_logger.log_agent_thinking(
+        Returns:
+            Tuple of (location name, action result)
+        """
+        sim_logger = self.sim_logger
+        log_actions = sim_logger.enabled_for("agent_action")
+        
+        # Get current context for thinking display
+        current_location = self.world_manager.get_agent_location(agent.id)
+        action_type_str = action.action_type.value
+        location_name = self.world_manager.get_place_name(current_location) if current_location else "unknown"
+        
+        # Show the agent's thinking process
+        if log_actions:
+            sim_logger.log_agent_thinking(
                 agent.name,
                 location_name,
-                available_actions,
+                self.action_executor.get_available_actions(agent.id),
                 action_type_str,
                 reasoning
             )
-            
-            # Execute the action
-            result = await self.action_executor.execute_action(action)
-            
+        
+        # Execute the action
+        result = await self.action_executor.execute_action(action)
+        
+        # A wait spanning several ticks keeps the agent idle until it ends
+        if result.success and action.action_type is ActionType.WAIT:
+            duration = result.side_effects.get("duration_minutes", 0)
+            agent.state.wait_until_tick = tick + math.ceil(duration / self.settings.tick_duration_minutes)
+        
+        if log_actions:
             # Prepare metadata for beautiful logging
             metadata = {
                 "location": location_name,
@@ -247,74 +525,21 @@ class SimulationController:
             }
             
             # Log action result with beautiful Apple-style UX
-            self.sim_logger.log_agent_action(
+            sim_logger.log_agent_action(
                 agent.name,
                 action_type_str,
                 result.message,
                 result.success,
                 metadata
             )
-            
-            # Still log to standard logger for debugging
-            if result.success:
-                logger.info(f"[{self.time_manager.format_tick_time(tick)}] {agent.name}: {result.message}")
-            else:
-                logger.warning(f"[{self.time_manager.format_tick_time(tick)}] {agent.name}: Failed - {result.message}")
-            
-            # M3: Form memory from this action
-            try:
-                memory = await self.memory_manager.form_memory_from_action(
-                    agent, action, result, location_name
-                )
-                logger.debug(f"Formed memory for {agent.name}: {memory.content[:50]}... (importance: {memory.importance_score:.1f})")
-                
-                # M4: Update importance accumulator and check for reflection trigger
-                await self.reflection_engine.update_importance_accumulator(agent, memory.importance_score)
-                
-                # Check if agent should reflect
-                if await self.reflection_engine.should_reflect(agent):
-                    logger.info(f"Triggering reflection for {agent.name} (accumulated importance: {agent.state.importance_accumulator:.1f})")
-                    reflections = await self.reflection_engine.trigger_reflection(agent)
-                    
-                    if reflections:
-                        # Log reflection beautifully
-                        self.sim_logger.log_agent_reflection(
-                            agent.name,
-                            len(reflections),
-                            [r.content for r in reflections]
-                        )
-                        logger.info(f"Generated {len(reflections)} reflections for {agent.name}")
-                
-            except Exception as e:
-                logger.error(f"Failed to form memory for {agent.name}: {e}")
-            
-            # M5: Check if agent should update their daily plan
-            try:
-                if await self.planning_engine.should_plan(agent):
-                    logger.info(f"Triggering daily planning for {agent.name}")
-                    daily_plan = await self.planning_engine.generate_daily_plan(agent)
-                    
-                    if daily_plan:
-                        # Create plan summary for beautiful logging
-                        plan_summary = self._create_plan_summary(daily_plan)
-                        
-                        # Log plan generation with detailed summary
-                        self.sim_logger.log_agent_planning(agent.name, len(daily_plan.hourly_blocks), plan_summary)
-                        logger.info(f"Generated daily plan for {agent.name} with {len(daily_plan.hourly_blocks)} time blocks")
-                        
-            except Exception as e:
-                logger.error(f"Failed to generate plan for {agent.name}: {e}")
-        except Exception as e:
-            logger.error(f"Error in _process_agent_tick for {agent.name}: {e}")
-            # Log error beautifully too
-            self.sim_logger.log_agent_action(
-                agent.name,
-                "error",
-                f"Action failed: {str(e)}",
-                False,
-                {"location": "unknown", "energy": agent.state.energy}
-            )
-    
+        
+        # Still log to standard logger for debugging
+        if result.success:
+            logger.info(f"[{self.time_manager.format_tick_time(tick)}] {agent.name}: {result.message}")
+        else:
+            logger.warning(f"[{self.time_manager.format_tick_time(tick)}] {agent.name}: Failed - {result.message}")
+        
+        return location_name, result
     
     def get_simulation_status(self) -> Dict:
         """Get current simulation status.
@@ -335,14 +560,13 @@ class SimulationController:
         agent_summaries = {}
         for agent_id, agent in self.agents.items():
             location = self.world_manager.get_agent_location(agent_id)
-            place_info = self.world_manager.get_place_info(location) if location else None
             
             agent_summaries[agent_id] = {
                 "name": agent.name,
                 "location": location,
-                "location_name": place_info["name"] if place_info else "unknown",
+                "location_name": self.world_manager.get_place_name(location) if location else "unknown",
                 "energy": agent.state.energy,
-                "status": agent.state.status.value if hasattr(agent.state.status, 'value') else str(agent.state.status)
+                "status": agent.state.status.value
             }
         
         return {
@@ -379,7 +603,7 @@ class SimulationController:
             "current_location": location,
             "current_location_name": place_info["name"] if place_info else "unknown",
             "state": {
-                "status": agent.state.status.value if hasattr(agent.state.status, 'value') else str(agent.state.status),
+                "status": agent.state.status.value,
                 "energy": agent.state.energy,
                 "mood": agent.state.mood,
                 "current_task": agent.state.current_task
@@ -470,11 +694,17 @@ class SimulationController:
             await self.time_manager.pause_simulation()
         
         # Export final data if there's any simulation activity
-        if self.sim_logger.get_logged_data().get('agent_actions'):
+        if self.sim_logger.has_logged_actions:
             total_ticks = self.time_manager.current_tick
             self.sim_logger.log_simulation_end(total_ticks)
         
-        # Close storage
+        # Write any moves not yet saved, then close storage and the LLM connection pool
+        try:
+            await self.world_manager.flush_locations()
+        except Exception as e:
+            logger.error(f"Failed to save agent locations: {e}")
         await self.storage.disconnect()
+        if "llm_service" in self.__dict__:
+            await self.llm_service.aclose()
         
         logger.info("Simulation cleanup complete")
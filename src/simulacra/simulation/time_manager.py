@@ -3,7 +3,7 @@
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, Callable, Any
+from typing import Any, Awaitable, Callable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -11,18 +11,24 @@ logger = logging.getLogger(__name__)
 class TimeManager:
     """Manages simulation time and tick progression."""
     
-    def __init__(self, tick_duration_minutes: int = 5):
+    def __init__(self, tick_duration_minutes: int = 5, tick_interval_seconds: float = 0.5):
         """Initialize time manager.
         
         Args:
             tick_duration_minutes: Duration of each simulation tick in minutes
+            tick_interval_seconds: Wall-clock seconds between tick starts while
+                running (0 runs ticks back to back)
         """
         self.tick_duration_minutes = tick_duration_minutes
+        self._tick_duration = timedelta(minutes=tick_duration_minutes)
+        self.tick_interval_seconds = max(0.0, tick_interval_seconds)
         self.current_tick = 0
         self.start_time: Optional[datetime] = None
         self.is_running = False
         self._simulation_task: Optional[asyncio.Task] = None
-        self._tick_callbacks: list[Callable[[int], Any]] = []
+        # Callbacks are classified once on registration rather than on every tick
+        self._sync_callbacks: list[Callable[[int], Any]] = []
+        self._async_callbacks: list[Callable[[int], Awaitable[Any]]] = []
     
     def add_tick_callback(self, callback: Callable[[int], Any]) -> None:
         """Add a callback to be called on each tick.
@@ -30,7 +36,10 @@ class TimeManager:
         Args:
             callback: Function to call with tick number
         """
-        self._tick_callbacks.append(callback)
+        if asyncio.iscoroutinefunction(callback):
+            self._async_callbacks.append(callback)
+        else:
+            self._sync_callbacks.append(callback)
     
     def remove_tick_callback(self, callback: Callable[[int], Any]) -> None:
         """Remove a tick callback.
@@ -38,8 +47,9 @@ class TimeManager:
         Args:
             callback: Function to remove
         """
-        if callback in self._tick_callbacks:
-            self._tick_callbacks.remove(callback)
+        for callbacks in (self._sync_callbacks, self._async_callbacks):
+            if callback in callbacks:
+                callbacks.remove(callback)
     
     async def start_simulation(self) -> None:
         """Start the simulation loop."""
@@ -79,15 +89,21 @@ class TimeManager:
         
         logger.debug(f"Advanced to tick {self.current_tick}")
         
-        # Call all tick callbacks
-        for callback in self._tick_callbacks:
+        # Call all tick callbacks, running the async ones concurrently
+        for callback in self._sync_callbacks:
             try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(self.current_tick)
-                else:
-                    callback(self.current_tick)
+                callback(self.current_tick)
             except Exception as e:
                 logger.error(f"Error in tick callback: {e}")
+        
+        if self._async_callbacks:
+            results = await asyncio.gather(
+                *(callback(self.current_tick) for callback in self._async_callbacks),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error in tick callback: {result}")
     
     async def fast_forward(self, ticks: int) -> None:
         """Fast forward by multiple ticks.
@@ -104,13 +120,22 @@ class TimeManager:
     
     async def _simulation_loop(self) -> None:
         """Main simulation loop."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        
         try:
             while self.is_running:
                 await self.advance_tick()
                 
-                # Sleep for a short interval (simulation runs faster than real time)
-                # In a real simulation, you might want this to be longer
-                await asyncio.sleep(0.5)  # Half second per tick for now
+                # Pace tick starts against deadlines rather than sleeping a fixed
+                # amount after each tick, so tick work doesn't add drift. A tick
+                # that overruns is followed immediately, and the schedule is
+                # re-anchored so later ticks don't burst to catch up.
+                deadline += self.tick_interval_seconds
+                now = loop.time()
+                if now > deadline:
+                    deadline = now
+                await asyncio.sleep(deadline - now)
                 
         except asyncio.CancelledError:
             logger.debug("Simulation loop cancelled")
@@ -129,8 +154,7 @@ class TimeManager:
         if self.start_time is None:
             return datetime.utcnow()
         
-        elapsed_minutes = self.current_tick * self.tick_duration_minutes
-        return self.start_time + timedelta(minutes=elapsed_minutes)
+        return self.start_time + self._tick_duration * self.current_tick
     
     def get_elapsed_time(self) -> timedelta:
         """Get elapsed simulation time.
@@ -141,7 +165,7 @@ class TimeManager:
         if self.start_time is None:
             return timedelta(0)
         
-        return timedelta(minutes=self.current_tick * self.tick_duration_minutes)
+        return self._tick_duration * self.current_tick
     
     def get_status(self) -> dict:
         """Get current time manager status.
@@ -4,7 +4,7 @@ import logging
 from typing import Dict, List, Optional
 
 from ..config.world_config import WorldConfigLoader
-from ..models.world import WorldState, AgentLocation
+from ..models.world import AgentLocation, WorldState
 from ..storage.sqlite_store import SQLiteStore
 
 logger = logging.getLogger(__name__)
@@ -23,6 +23,15 @@ class WorldManager:
         self.config_loader = config_loader
         self.storage = storage
         self._world_state: Optional[WorldState] = None
+        
+        # place_id -> place info dict, dropped whenever the place's occupancy changes
+        self._place_info_cache: Dict[str, Dict] = {}
+        # place_id -> the configuration-derived part of the place info, which
+        # never changes after initialization
+        self._place_static_info: Dict[str, Dict] = {}
+        # agent_id -> latest location not yet written to storage; moves are
+        # saved in batches by flush_locations rather than one commit each
+        self._pending_locations: Dict[str, AgentLocation] = {}
     
     async def initialize(self) -> None:
         """Initialize world state from configuration."""
@@ -31,27 +40,16 @@ class WorldManager:
         
         # Create initial world state
         self._world_state = world_config.to_world_state()
+        self._place_info_cache.clear()
+        self._place_static_info.clear()
         
         # Store places and objects in database
         await self.storage.connect()
         
-        # Create places
-        for place in world_config.places:
-            try:
-                await self.storage.create_place(place)
-                logger.debug(f"Created place: {place.name} ({place.id})")
-            except Exception as e:
-                # Place might already exist, that's okay
-                logger.debug(f"Place {place.id} already exists: {e}")
-        
-        # Create objects
-        for obj in world_config.objects:
-            try:
-                await self.storage.create_object(obj)
-                logger.debug(f"Created object: {obj.name} ({obj.id})")
-            except Exception as e:
-                # Object might already exist, that's okay
-                logger.debug(f"Object {obj.id} already exists: {e}")
+        # Create places and objects, letting the database skip existing rows
+        created_places = await self.storage.create_places(world_config.places)
+        created_objects = await self.storage.create_objects(world_config.objects)
+        logger.debug(f"Stored {created_places} new places and {created_objects} new objects")
         
         logger.info(f"World initialized with {len(self._world_state.places)} places and {len(self._world_state.objects)} objects")
     
@@ -76,16 +74,13 @@ class WorldManager:
             logger.warning(f"Cannot place agent {agent_id} at unknown place {place_id}")
             return False
         
-        # Create agent location
-        agent_location = AgentLocation(
-            agent_id=agent_id,
-            place_id=place_id
-        )
-        
         # Update world state
-        self.world_state.agent_locations[agent_id] = agent_location
+        previous_place_id = self.get_agent_location(agent_id)
+        agent_location = self.world_state.place_agent(agent_id, place_id)
+        self._invalidate_place_info(previous_place_id, place_id)
         
-        # Update storage
+        # Update storage, superseding any move still waiting to be flushed
+        self._pending_locations.pop(agent_id, None)
         await self.storage.update_agent_location(agent_location)
         
         logger.debug(f"Placed agent {agent_id} at {place_id}")
@@ -110,15 +105,33 @@ class WorldManager:
         
         # Perform the move
         if self.world_state.move_agent(agent_id, target_place_id):
-            # Update storage
             agent_location = self.world_state.agent_locations[agent_id]
-            await self.storage.update_agent_location(agent_location)
+            self._invalidate_place_info(agent_location.previous_place_id, target_place_id)
+            
+            # Queue the storage update for the next flush
+            self._pending_locations[agent_id] = agent_location
             
-            logger.debug(f"Moved agent {agent_id} to {target_place_id}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Moved agent {agent_id} to {target_place_id}")
             return True
         
         return False
     
+    async def flush_locations(self) -> int:
+        """Write agent moves made since the last flush to storage.
+        
+        Returns:
+            Number of agent locations written
+        """
+        if not self._pending_locations:
+            return 0
+        
+        agent_locations = list(self._pending_locations.values())
+        self._pending_locations.clear()
+        await self.storage.update_agent_locations(agent_locations)
+        
+        return len(agent_locations)
+    
     def get_agent_location(self, agent_id: str) -> Optional[str]:
         """Get current location of an agent.
         
@@ -142,6 +155,29 @@ class WorldManager:
         """
         return self.world_state.get_agents_at_location(place_id)
     
+    def get_occupancy_counts(self) -> Dict[str, int]:
+        """Get the number of agents at each occupied location.
+        
+        Returns:
+            Dictionary mapping place IDs to agent counts
+        """
+        return self.world_state.get_occupancy_counts()
+    
+    def get_other_agents_at_location(self, place_id: str, agent_id: str) -> List[str]:
+        """Get the agents at a location other than the given one.
+        
+        Args:
+            place_id: ID of the place
+            agent_id: ID of the agent to leave out
+            
+        Returns:
+            List of the other agent IDs at the location
+        """
+        place_info = self.get_place_info(place_id)
+        if not place_info:
+            return []
+        return [other_id for other_id in place_info["agents"] if other_id != agent_id]
+    
     def get_connected_places(self, place_id: str) -> List[str]:
         """Get places connected to a given place.
         
@@ -154,31 +190,67 @@ class WorldManager:
         place = self.world_state.places.get(place_id)
         return place.connected_places if place else []
     
+    def get_place_name(self, place_id: str) -> str:
+        """Get the display name of a place.
+        
+        Args:
+            place_id: ID of the place
+            
+        Returns:
+            Place name, or the place ID if the place is unknown
+        """
+        place = self.world_state.places.get(place_id)
+        return place.name if place else place_id
+    
     def get_place_info(self, place_id: str) -> Optional[Dict]:
         """Get information about a place.
         
+        The underlying data is cached until an agent enters or leaves the
+        place; each call returns a fresh shallow copy with its own agents list.
+        
         Args:
             place_id: ID of the place
             
         Returns:
             Dictionary with place information, or None if not found
         """
-        place = self.world_state.places.get(place_id)
-        if not place:
-            return None
+        cached = self._place_info_cache.get(place_id)
+        if cached is not None:
+            return {**cached, "agents": list(cached["agents"])}
         
-        agents_here = self.get_agents_at_location(place_id)
+        static_info = self._place_static_info.get(place_id)
+        if static_info is None:
+            place = self.world_state.places.get(place_id)
+            if not place:
+                return None
+            
+            static_info = self._place_static_info[place_id] = {
+                "id": place.id,
+                "name": place.name,
+                "description": place.description,
+                "capacity": place.capacity,
+                "connected_places": place.connected_places,
+                "properties": place.properties
+            }
         
-        return {
-            "id": place.id,
-            "name": place.name,
-            "description": place.description,
-            "capacity": place.capacity,
+        agents_here = tuple(self.world_state.get_agents_at_location(place_id))
+        
+        place_info = self._place_info_cache[place_id] = {
+            **static_info,
             "current_occupancy": len(agents_here),
-            "agents": agents_here,
-            "connected_places": place.connected_places,
-            "properties": place.properties
+            "agents": agents_here
         }
+        return {**place_info, "agents": list(agents_here)}
+    
+    def _invalidate_place_info(self, *place_ids: Optional[str]) -> None:
+        """Drop cached place info for places whose occupancy changed.
+        
+        Args:
+            place_ids: IDs of the affected places (None entries are ignored)
+        """
+        for place_id in place_ids:
+            if place_id is not None:
+                self._place_info_cache.pop(place_id, None)
     
     def get_world_summary(self) -> Dict:
         """Get a summary of the current world state.
@@ -186,21 +258,24 @@ class WorldManager:
         Returns:
             Dictionary with world state summary
         """
-        total_agents = len(self.world_state.agent_locations)
+        # Resolve the world state property and bound lookup once for the loop
+        world_state = self.world_state
+        get_agents_at_location = world_state.get_agents_at_location
+        total_agents = len(world_state.agent_locations)
         place_occupancy = {}
         
-        for place_id in self.world_state.places:
-            agents_here = self.get_agents_at_location(place_id)
+        for place_id, place in world_state.places.items():
+            agents_here = get_agents_at_location(place_id)
             place_occupancy[place_id] = {
-                "name": self.world_state.places[place_id].name,
+                "name": place.name,
                 "agent_count": len(agents_here),
                 "agents": agents_here
             }
         
         return {
-            "total_places": len(self.world_state.places),
-            "total_objects": len(self.world_state.objects),
+            "total_places": len(world_state.places),
+            "total_objects": len(world_state.objects),
             "total_agents": total_agents,
             "place_occupancy": place_occupancy,
-            "last_updated": self.world_state.last_updated.isoformat()
+            "last_updated": world_state.last_updated.isoformat()
         }
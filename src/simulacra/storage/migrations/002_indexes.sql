@@ -0,0 +1,8 @@
+-- Composite indexes for filtered, time-ordered lookups
+-- Safe to re-run: applied on every schema initialization
+
+-- get_recent_memories filtered by memory type
+CREATE INDEX IF NOT EXISTS idx_memories_agent_type_timestamp ON memories(agent_id, memory_type, timestamp DESC);
+
+-- get_plans by agent and plan type, newest first
+CREATE INDEX IF NOT EXISTS idx_plans_agent_type_created ON plans(agent_id, plan_type, created_at DESC);
@@ -0,0 +1,9 @@
+-- Keep agents.memories_count in step with inserted memories inside SQLite,
+-- instead of a separate UPDATE from the application per batch
+-- Safe to re-run: applied on every schema initialization
+
+CREATE TRIGGER IF NOT EXISTS increment_agent_memories_count
+    AFTER INSERT ON memories
+    BEGIN
+        UPDATE agents SET memories_count = memories_count + 1 WHERE id = NEW.agent_id;
+    END;
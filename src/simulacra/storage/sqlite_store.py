@@ -3,9 +3,11 @@
 import json
 import logging
 import sqlite3
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
 from uuid import UUID
 
 import aiosqlite
@@ -19,47 +21,188 @@ from ..models.memory import Memory, Reflection, MemoryType
 from ..models.planning import DailyPlan
 from ..models.world import Place, WorldObject, AgentLocation
 
+# orjson (optional, the "speedups" extra) encodes/decodes the JSON columns
+# several times faster than the stdlib; both produce interchangeable text
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _dumps(value: Any) -> str:
+        """Serialize a value to JSON text."""
+        return orjson.dumps(value).decode()
+    
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
+_STATS_TABLES = ("agents", "memories", "reflections", "events", "places", "objects", "plans")
+_TABLE_COUNTS_SQL = " UNION ALL ".join(
+    f"SELECT '{table}', COUNT(*) FROM {table}" for table in _STATS_TABLES
+)
+
+# Applied in order on every new connection. temp_store/cache_size/mmap_size keep
+# sorter spills, a 64 MB page cache and reads through mmap in memory; lock waits
+# are already bounded by the 30s connect timeout (SQLite's busy timeout).
+_DEFAULT_PRAGMAS: Dict[str, Any] = {
+    "foreign_keys": "ON",
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": -65536,
+    "mmap_size": 268435456,
+    # Bounds the ANALYZE work that PRAGMA optimize does on disconnect
+    "analysis_limit": 400,
+}
+
+
+@lru_cache(maxsize=32)
+def _recent_memories_sql(has_time_filter: bool, type_count: int) -> str:
+    """Get the get_recent_memories query for one combination of filters.
+    
+    Each shape is built once, and reusing the identical string keeps hitting
+    sqlite3's prepared-statement cache.
+    """
+    query = """
+            SELECT id, agent_id, content, memory_type, timestamp,
+                   importance_score, embedding_id, location
+            FROM memories
+            WHERE agent_id = ?
+        """
+    if has_time_filter:
+        query += " AND timestamp >= ?"
+    if type_count:
+        query += f" AND memory_type IN ({','.join('?' * type_count)})"
+    return query + " ORDER BY timestamp DESC LIMIT ?"
+
+
+@lru_cache(maxsize=32)
+def _plans_sql(filter_columns: Tuple[str, ...]) -> str:
+    """Get the get_plans query filtering on the given columns, in order."""
+    where_clause = " AND ".join(f"{column} = ?" for column in filter_columns) or "1=1"
+    return f"""
+            SELECT id, agent_id, plan_type, content, date_for, 
+                   start_time, end_time, status, created_at, updated_at
+            FROM plans
+            WHERE {where_clause}
+            ORDER BY created_at DESC
+            LIMIT ?
+        """
+
+
+_MEMORY_TYPES = {memory_type.value: memory_type for memory_type in MemoryType}
+
+
+def _memory_from_row(row: Any) -> Memory:
+    """Build a Memory from a memories row.
+    
+    Rows were validated when the memory was stored, so the model is built with
+    model_construct() rather than validated again field by field.
+    """
+    return Memory.model_construct(
+        id=UUID(row[0]),
+        agent_id=row[1],
+        content=row[2],
+        memory_type=_MEMORY_TYPES[row[3]],
+        timestamp=datetime.fromisoformat(row[4]),
+        importance_score=row[5],
+        embedding_id=row[6],
+        location=row[7]
+    )
+
 
 class SQLiteStore:
     """SQLite-based storage for structured data."""
     
-    def __init__(self, db_path: Union[str, Path] = "data/simulacra.db"):
+    def __init__(
+        self,
+        db_path: Union[str, Path] = "data/simulacra.db",
+        pragmas: Optional[Dict[str, Any]] = None
+    ):
         """Initialize SQLite store.
         
         Args:
             db_path: Path to the SQLite database file
+            pragmas: PRAGMA overrides applied on connect, on top of the defaults
         """
         self.db_path = Path(db_path)
+        self.pragmas = {**_DEFAULT_PRAGMAS, **(pragmas or {})}
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._connection: Optional[aiosqlite.Connection] = None
+        # Nesting depth of transaction(); writes only commit at depth 0
+        self._tx_depth = 0
     
     async def connect(self) -> None:
-        """Establish database connection."""
+        """Establish database connection.
+        
+        The store's methods check self._connection before calling this, so the
+        usual already-connected case doesn't create and await a coroutine.
+        """
         if self._connection is None:
             self._connection = await aiosqlite.connect(
                 str(self.db_path),
-                timeout=30.0
+                timeout=30.0,
+                cached_statements=256  # every query here is a fixed SQL string, reuse them prepared
             )
-            # Enable foreign keys and WAL mode for better performance
-            await self._connection.execute("PRAGMA foreign_keys = ON")
-            await self._connection.execute("PRAGMA journal_mode = WAL")
-            await self._connection.execute("PRAGMA synchronous = NORMAL")
+            # Enable foreign keys, WAL mode and the memory/caching settings
+            for name, value in self.pragmas.items():
+                await self._connection.execute(f"PRAGMA {name} = {value}")
     
     async def disconnect(self) -> None:
         """Close database connection."""
         if self._connection:
+            # Refresh planner statistics for tables whose contents have shifted
+            try:
+                await self._connection.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logger.debug(f"PRAGMA optimize failed: {e}")
             await self._connection.close()
             self._connection = None
     
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Group writes into one transaction, committed when the outermost block exits.
+        
+        Write methods called inside the block skip their own commit. Any
+        exception, including cancellation or KeyboardInterrupt, rolls the
+        whole transaction back, so a half-finished block is never saved.
+        """
+        if self._connection is None:
+            await self.connect()
+        
+        if self._tx_depth == 0 and not self._connection.in_transaction:
+            await self._connection.execute("BEGIN IMMEDIATE")
+        self._tx_depth += 1
+        
+        try:
+            yield
+        except BaseException:
+            self._tx_depth -= 1
+            if self._tx_depth == 0:
+                await self._connection.rollback()
+            raise
+        else:
+            self._tx_depth -= 1
+            if self._tx_depth == 0:
+                await self._connection.commit()
+    
+    async def _maybe_commit(self) -> None:
+        """Commit the current write unless it is part of an open transaction()."""
+        if self._tx_depth == 0:
+            await self._connection.commit()
+    
     async def initialize_schema(self) -> None:
         """Initialize database schema from migration files."""
-        await self.connect()
+        if self._connection is None:
+            await self.connect()
         
-        # Read and execute the initial schema
+        # Read and execute the migrations in order; later ones use IF NOT EXISTS
+        # so they can run against an existing database
         migrations_dir = Path(__file__).parent / "migrations"
-        schema_file = migrations_dir / "001_initial_schema.sql"
         
-        if schema_file.exists():
+        for schema_file in sorted(migrations_dir.glob("*.sql")):
             schema_sql = schema_file.read_text()
             
             # Use executescript for handling complex SQL with triggers
@@ -69,15 +212,16 @@ class SQLiteStore:
                 await self._connection.commit()
             except Exception as e:
                 if "already exists" in str(e):
-                    logger.debug("Schema already exists, continuing...")
+                    logger.debug(f"Schema from {schema_file.name} already exists, continuing...")
                 else:
-                    logger.error(f"Failed to execute schema: {e}")
+                    logger.error(f"Failed to execute schema {schema_file.name}: {e}")
                     raise
     
     # Agent operations
     async def create_agent(self, agent: Agent) -> None:
         """Create a new agent in the database."""
-        await self.connect()
+        if self._connection is None:
+            await self.connect()
         
         # Insert agent
         await self._connection.execute("""
@@ -91,7 +235,7 @@ class SQLiteStore:
             agent.bio,
             agent.personality,
             agent.home_location,
-            json.dumps(agent.relationships),
+            _dumps(agent.relationships),
             agent.memories_count,
             agent.reflections_count,
             agent.created_at.isoformat()
@@ -116,11 +260,12 @@ class SQLiteStore:
             agent.state.last_updated.isoformat()
         ))
         
-        await self._connection.commit()
+        await self._maybe_commit()
     
     async def get_agent(self, agent_id: str) -> Optional[Agent]:
         """Retrieve an agent by ID."""
-        await self.connect()
+        if self._connection is None:
+            await self.connect()
         
         cursor = await self._connection.execute("""
             SELECT 
@@ -144,7 +289,7 @@ class SQLiteStore:
             "bio": row[2],
             "personality": row[3],
             "home_location": row[4],
-            "relationships": json.loads(row[5]) if row[5] else {},
+            "relationships": _loads(row[5]) if row[5] else {},
             "memories_count": row[6],
             "reflections_count": row[7],
             "created_at": datetime.fromisoformat(row[8]),
@@ -163,18 +308,19 @@ class SQLiteStore:
         
         return Agent(**agent_data)
     
-    async def update_agent_state(self, agent_state: AgentState) -> None:
-        """Update agent state."""
-        await self.connect()
-        
-        await self._connection.execute("""
-            UPDATE agent_states SET
-                status = ?, current_location = ?, current_task = ?,
-                energy = ?, mood = ?, last_reflection_time = ?,
-                importance_accumulator = ?
-            WHERE agent_id = ?
-        """, (
-            agent_state.status.value if hasattr(agent_state.status, 'value') else agent_state.status,
+    _UPDATE_AGENT_STATE_SQL = """
+        UPDATE agent_states SET
+            status = ?, current_location = ?, current_task = ?,
+            energy = ?, mood = ?, last_reflection_time = ?,
+            importance_accumulator = ?
+        WHERE agent_id = ?
+    """
+    
+    @staticmethod
+    def _agent_state_params(agent_state: AgentState) -> tuple:
+        """Get the UPDATE parameters for an agent state."""
+        return (
+            agent_state.status.value,
             agent_state.current_location,
             agent_state.current_task,
             agent_state.energy,
@@ -182,38 +328,70 @@ class SQLiteStore:
             agent_state.last_reflection_time.isoformat() if agent_state.last_reflection_time else None,
             agent_state.importance_accumulator,
             agent_state.agent_id
-        ))
+        )
+    
+    async def update_agent_state(self, agent_state: AgentState) -> None:
+        """Update agent state."""
+        if self._connection is None:
+            await self.connect()
+        
+        await self._connection.execute(
+            self._UPDATE_AGENT_STATE_SQL, self._agent_state_params(agent_state)
+        )
         
-        await self._connection.commit()
+        await self._maybe_commit()
+    
+    async def update_agent_states(self, agent_states: Iterable[AgentState]) -> None:
+        """Update several agent states in one transaction.
+        
+        Args:
+            agent_states: Agent states to write
+        """
+        if self._connection is None:
+            await self.connect()
+        
+        await self._connection.executemany(
+            self._UPDATE_AGENT_STATE_SQL,
+            [self._agent_state_params(agent_state) for agent_state in agent_states]
+        )
+        
+        await self._maybe_commit()
     
     # Memory operations
     async def add_memory(self, memory: Memory) -> None:
         """Add a memory to the database."""
-        await self.connect()
+        await self.add_memories([memory])
+    
+    async def add_memories(self, memories: Iterable[Memory]) -> None:
+        """Add several memories to the database in one transaction.
         
-        await self._connection.execute("""
+        Args:
+            memories: Memories to add
+        """
+        if self._connection is None:
+            await self.connect()
+        
+        # agents.memories_count is maintained by an insert trigger (migration 003)
+        await self._connection.executemany("""
             INSERT INTO memories (
                 id, agent_id, content, memory_type, timestamp,
                 importance_score, embedding_id, location
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            str(memory.id),
-            memory.agent_id,
-            memory.content,
-            memory.memory_type.value if hasattr(memory.memory_type, 'value') else memory.memory_type,
-            memory.timestamp.isoformat(),
-            memory.importance_score,
-            memory.embedding_id,
-            memory.location
-        ))
-        
-        # Update agent memory count
-        await self._connection.execute("""
-            UPDATE agents SET memories_count = memories_count + 1
-            WHERE id = ?
-        """, (memory.agent_id,))
+        """, [
+            (
+                str(memory.id),
+                memory.agent_id,
+                memory.content,
+                memory.memory_type.value,
+                memory.timestamp.isoformat(),
+                memory.importance_score,
+                memory.embedding_id,
+                memory.location
+            )
+            for memory in memories
+        ])
         
-        await self._connection.commit()
+        await self._maybe_commit()
     
     async def get_recent_memories(
         self, 
@@ -224,55 +402,34 @@ class SQLiteStore:
         hours: Optional[int] = None
     ) -> List[Memory]:
         """Get recent memories for an agent."""
-        await self.connect()
+        if self._connection is None:
+            await self.connect()
         
-        query = """
-            SELECT id, agent_id, content, memory_type, timestamp,
-                   importance_score, embedding_id, location
-            FROM memories
-            WHERE agent_id = ?
-        """
         params = [agent_id]
         
         # Add time filtering
         if since:
-            query += " AND timestamp >= ?"
             params.append(since.isoformat())
         elif hours:
             cutoff_time = datetime.now() - timedelta(hours=hours)
-            query += " AND timestamp >= ?"
             params.append(cutoff_time.isoformat())
+        has_time_filter = len(params) > 1
         
         if memory_types:
-            placeholders = ",".join("?" * len(memory_types))
-            query += f" AND memory_type IN ({placeholders})"
             params.extend(memory_types)
         
-        query += " ORDER BY timestamp DESC LIMIT ?"
         params.append(limit)
         
+        query = _recent_memories_sql(has_time_filter, len(memory_types) if memory_types else 0)
         cursor = await self._connection.execute(query, params)
         rows = await cursor.fetchall()
         
-        memories = []
-        for row in rows:
-            memory = Memory(
-                id=UUID(row[0]),
-                agent_id=row[1],
-                content=row[2],
-                memory_type=row[3],  # Let the Memory model handle string->enum conversion
-                timestamp=datetime.fromisoformat(row[4]),
-                importance_score=row[5],
-                embedding_id=row[6],
-                location=row[7]
-            )
-            memories.append(memory)
-        
-        return memories
+        return [_memory_from_row(row) for row in rows]
     
     async def get_memory(self, memory_id: str) -> Optional[Memory]:
         """Get a specific memory by ID."""
-        await self.connect()
+        if self._connection is None:
+            await self.connect()
         
         cursor = await self._connection.execute("""
             SELECT id, agent_id, content, memory_type, timestamp,
@@ -285,44 +442,48 @@ class SQLiteStore:
         if not row:
             return None
         
-        return Memory(
-            id=UUID(row[0]),
-            agent_id=row[1],
-            content=row[2],
-            memory_type=row[3],  # Let the Memory model handle string->enum conversion
-            timestamp=datetime.fromisoformat(row[4]),
-            importance_score=row[5],
-            embedding_id=row[6],
-            location=row[7]
-        )
+        return _memory_from_row(row)
     
     # Event operations
     async def add_event(self, event: Event) -> None:
         """Add an event to the database."""
-        await self.connect()
+        await self.add_events([event])
+    
+    async def add_events(self, events: Iterable[Event]) -> None:
+        """Add several events to the database in one transaction.
         
-        await self._connection.execute("""
+        Args:
+            events: Events to add
+        """
+        if self._connection is None:
+            await self.connect()
+        
+        await self._connection.executemany("""
             INSERT INTO events (
                 id, event_type, timestamp, agent_id, location,
                 content, parameters, observers
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            str(event.id),
-            event.event_type.value,
-            event.timestamp.isoformat(),
-            event.agent_id,
-            event.location,
-            event.content,
-            json.dumps(event.parameters),
-            json.dumps(event.observers)
-        ))
+        """, [
+            (
+                str(event.id),
+                event.event_type.value,
+                event.timestamp.isoformat(),
+                event.agent_id,
+                event.location,
+                event.content,
+                _dumps(event.parameters),
+                _dumps(event.observers)
+            )
+            for event in events
+        ])
         
-        await self._connection.commit()
+        await self._maybe_commit()
     
     # World state operations
     async def create_place(self, place: Place) -> None:
         """Create a place in the world."""
-        await self.connect()
+        if self._connection is None:
+            await self.connect()
         
         await self._connection.execute("""
             INSERT INTO places (
@@ -333,15 +494,16 @@ class SQLiteStore:
             place.name,
             place.description,
             place.capacity,
-            json.dumps(place.properties),
-            json.dumps(place.connected_places)
+            _dumps(place.properties),
+            _dumps(place.connected_places)
         ))
         
-        await self._connection.commit()
+        await self._maybe_commit()
     
     async def create_object(self, obj: WorldObject) -> None:
         """Create an object in the world."""
-        await self.connect()
+        if self._connection is None:
+            await self.connect()
         
         await self._connection.execute("""
             INSERT INTO objects (
@@ -353,39 +515,117 @@ class SQLiteStore:
             obj.name,
             obj.description,
             obj.location,
-            json.dumps(obj.properties),
-            json.dumps(obj.interactions),
+            _dumps(obj.properties),
+            _dumps(obj.interactions),
             obj.is_movable
         ))
         
-        await self._connection.commit()
+        await self._maybe_commit()
+    
+    async def create_places(self, places: Iterable[Place]) -> int:
+        """Create places in one transaction, skipping any that already exist.
+        
+        Args:
+            places: Places to create
+            
+        Returns:
+            Number of places inserted
+        """
+        if self._connection is None:
+            await self.connect()
+        
+        cursor = await self._connection.executemany("""
+            INSERT OR IGNORE INTO places (
+                id, name, description, capacity, properties, connected_places
+            ) VALUES (?, ?, ?, ?, ?, ?)
+        """, [
+            (
+                place.id,
+                place.name,
+                place.description,
+                place.capacity,
+                _dumps(place.properties),
+                _dumps(place.connected_places)
+            )
+            for place in places
+        ])
+        
+        await self._maybe_commit()
+        return cursor.rowcount
+    
+    async def create_objects(self, objects: Iterable[WorldObject]) -> int:
+        """Create objects in one transaction, skipping any that already exist.
+        
+        Args:
+            objects: Objects to create
+            
+        Returns:
+            Number of objects inserted
+        """
+        if self._connection is None:
+            await self.connect()
+        
+        cursor = await self._connection.executemany("""
+            INSERT OR IGNORE INTO objects (
+                id, name, description, location, properties, 
+                interactions, is_movable
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (
+                obj.id,
+                obj.name,
+                obj.description,
+                obj.location,
+                _dumps(obj.properties),
+                _dumps(obj.interactions),
+                obj.is_movable
+            )
+            for obj in objects
+        ])
+        
+        await self._maybe_commit()
+        return cursor.rowcount
     
     async def update_agent_location(self, agent_location: AgentLocation) -> None:
         """Update an agent's location."""
-        await self.connect()
+        await self.update_agent_locations([agent_location])
+    
+    async def update_agent_locations(self, agent_locations: Iterable[AgentLocation]) -> None:
+        """Update several agents' locations in one transaction.
         
-        await self._connection.execute("""
+        Args:
+            agent_locations: Agent locations to write
+        """
+        if self._connection is None:
+            await self.connect()
+        
+        agent_locations = list(agent_locations)
+        await self._connection.executemany("""
             INSERT OR REPLACE INTO agent_locations (
                 agent_id, place_id, previous_place_id, last_updated
             ) VALUES (?, ?, ?, ?)
-        """, (
-            agent_location.agent_id,
-            agent_location.place_id,
-            agent_location.previous_place_id,
-            agent_location.last_updated.isoformat()
-        ))
+        """, [
+            (
+                agent_location.agent_id,
+                agent_location.place_id,
+                agent_location.previous_place_id,
+                agent_location.last_updated.isoformat()
+            )
+            for agent_location in agent_locations
+        ])
         
         # Also update agent state
-        await self._connection.execute("""
+        await self._connection.executemany("""
             UPDATE agent_states SET current_location = ?
             WHERE agent_id = ?
-        """, (agent_location.place_id, agent_location.agent_id))
+        """, [(agent_location.place_id, agent_location.agent_id) for agent_location in agent_locations])
         
-        await self._connection.commit()
+        await self._maybe_commit()
     
     async def get_agents_at_location(self, place_id: str) -> List[str]:
         """Get all agent IDs at a specific location."""
-        await self.connect()
+        if self._connection is None:
+            await self.connect()
         
         cursor = await self._connection.execute("""
             SELECT agent_id FROM agent_locations WHERE place_id = ?
@@ -397,23 +637,35 @@ class SQLiteStore:
     # Reflection operations
     async def add_reflection(self, reflection: Reflection) -> None:
         """Add a reflection to the database."""
-        await self.connect()
+        await self.add_reflections([reflection])
+    
+    async def add_reflections(self, reflections: Iterable[Reflection]) -> None:
+        """Add several reflections to the database in one transaction.
         
-        await self._connection.execute("""
+        Args:
+            reflections: Reflections to add
+        """
+        if self._connection is None:
+            await self.connect()
+        
+        await self._connection.executemany("""
             INSERT INTO reflections (
                 id, agent_id, content, supporting_memories, 
                 timestamp, importance_score
             ) VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            str(reflection.id),
-            reflection.agent_id,
-            reflection.content,
-            json.dumps([str(uuid) for uuid in reflection.supporting_memories]),
-            reflection.timestamp.isoformat(),
-            reflection.importance_score
-        ))
+        """, [
+            (
+                str(reflection.id),
+                reflection.agent_id,
+                reflection.content,
+                _dumps([str(uuid) for uuid in reflection.supporting_memories]),
+                reflection.timestamp.isoformat(),
+                reflection.importance_score
+            )
+            for reflection in reflections
+        ])
         
-        await self._connection.commit()
+        await self._maybe_commit()
     
     async def get_agent_reflections(
         self, 
@@ -421,7 +673,8 @@ class SQLiteStore:
         limit: int = 10
     ) -> List[Reflection]:
         """Get recent reflections for an agent."""
-        await self.connect()
+        if self._connection is None:
+            await self.connect()
         
         cursor = await self._connection.execute("""
             SELECT id, agent_id, content, supporting_memories, 
@@ -441,12 +694,12 @@ class SQLiteStore:
             
             if supporting_memories_json:
                 try:
-                    memory_strings = json.loads(supporting_memories_json)
+                    memory_strings = _loads(supporting_memories_json)
                     supporting_memories = [UUID(uuid_str) for uuid_str in memory_strings]
                 except (json.JSONDecodeError, ValueError) as e:
                     logger.warning(f"Failed to parse supporting memories: {e}")
             
-            reflection = Reflection(
+            reflection = Reflection.model_construct(
                 id=UUID(row[0]),
                 agent_id=row[1],
                 content=row[2],
@@ -471,7 +724,8 @@ class SQLiteStore:
         status: str = "pending"
     ) -> None:
         """Add a new plan to storage."""
-        await self.connect()
+        if self._connection is None:
+            await self.connect()
         
         await self._connection.execute("""
             INSERT OR REPLACE INTO plans (
@@ -491,7 +745,7 @@ class SQLiteStore:
             datetime.now().isoformat()
         ))
         
-        await self._connection.commit()
+        await self._maybe_commit()
     
     async def get_plans(
         self,
@@ -502,62 +756,40 @@ class SQLiteStore:
         limit: int = 10
     ) -> List[Dict[str, Any]]:
         """Get plans matching the criteria."""
-        await self.connect()
+        if self._connection is None:
+            await self.connect()
         
-        conditions = []
+        columns = []
         params = []
         
         if agent_id:
-            conditions.append("agent_id = ?")
+            columns.append("agent_id")
             params.append(agent_id)
         
         if plan_type:
-            conditions.append("plan_type = ?")
+            columns.append("plan_type")
             params.append(plan_type)
         
         if date_for:
-            conditions.append("date_for = ?")
+            columns.append("date_for")
             params.append(date_for.isoformat())
         
         if status:
-            conditions.append("status = ?")
+            columns.append("status")
             params.append(status)
         
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
         params.append(limit)
         
-        cursor = await self._connection.execute(f"""
-            SELECT id, agent_id, plan_type, content, date_for, 
-                   start_time, end_time, status, created_at, updated_at
-            FROM plans
-            WHERE {where_clause}
-            ORDER BY created_at DESC
-            LIMIT ?
-        """, params)
-        
-        rows = await cursor.fetchall()
-        plans = []
-        
-        for row in rows:
-            plan = {
-                "id": row[0],
-                "agent_id": row[1],
-                "plan_type": row[2],
-                "content": row[3],
-                "date_for": row[4],
-                "start_time": row[5],
-                "end_time": row[6],
-                "status": row[7],
-                "created_at": row[8],
-                "updated_at": row[9]
-            }
-            plans.append(plan)
+        cursor = await self._connection.execute(_plans_sql(tuple(columns)), params)
         
-        return plans
+        # The selected column names are the plan dict keys
+        cursor.row_factory = sqlite3.Row
+        return [dict(row) for row in await cursor.fetchall()]
     
     async def update_plan_status(self, plan_id: str, status: str) -> bool:
         """Update the status of a plan."""
-        await self.connect()
+        if self._connection is None:
+            await self.connect()
         
         cursor = await self._connection.execute("""
             UPDATE plans 
@@ -565,32 +797,27 @@ class SQLiteStore:
             WHERE id = ?
         """, (status, datetime.now().isoformat(), plan_id))
         
-        await self._connection.commit()
+        await self._maybe_commit()
         return cursor.rowcount > 0
     
     async def delete_plan(self, plan_id: str) -> bool:
         """Delete a plan."""
-        await self.connect()
+        if self._connection is None:
+            await self.connect()
         
         cursor = await self._connection.execute("""
             DELETE FROM plans WHERE id = ?
         """, (plan_id,))
         
-        await self._connection.commit()
+        await self._maybe_commit()
         return cursor.rowcount > 0
 
     # Utility methods
     async def get_database_stats(self) -> Dict[str, Any]:
         """Get database statistics."""
-        await self.connect()
-        
-        stats = {}
-        
-        # Count records in each table
-        tables = ["agents", "memories", "reflections", "events", "places", "objects", "plans"]
-        for table in tables:
-            cursor = await self._connection.execute(f"SELECT COUNT(*) FROM {table}")
-            count = await cursor.fetchone()
-            stats[f"{table}_count"] = count[0] if count else 0
+        if self._connection is None:
+            await self.connect()
         
-        return stats
+        # Count records in every table with one round trip
+        cursor = await self._connection.execute(_TABLE_COUNTS_SQL)
+        return {f"{table}_count": count for table, count in await cursor.fetchall()}
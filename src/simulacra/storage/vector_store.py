@@ -2,37 +2,266 @@
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
 from uuid import UUID
 
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 
 from ..models.memory import Memory, MemorySearchResult
 
 logger = logging.getLogger(__name__)
 
+VECTOR_BACKENDS = ("chroma", "memory")
+
+# Chroma collections by name -> creation metadata; embeddings are stored unit
+# length, so the inner-product space ranks by cosine
+_CHROMA_COLLECTIONS = {
+    "agent_memories": {"description": "Agent memory embeddings for semantic search", "hnsw:space": "ip"},
+    "agent_reflections": {"description": "Agent reflection embeddings", "hnsw:space": "ip"},
+}
+
+# Embeddings may be plain lists (as parsed from Ollama) or float32 arrays,
+# which pass through without a per-element conversion
+Embedding = Union[Sequence[float], np.ndarray]
+
+
+def _normalize(embedding: Embedding) -> np.ndarray:
+    """Scale an embedding to unit length, so cosine similarity is a dot product."""
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def _similarities_from_results(results: Dict[str, Any]) -> List[Tuple[str, float]]:
+    """Map a single-query Chroma result to (id, 0-1 similarity) pairs.
+    
+    Collections use the inner-product space over unit vectors (enforced by
+    VectorStore.initialize_collections), so distance is 1 - cos, in [0, 2];
+    the clip only absorbs float rounding. The conversion runs vectorized over
+    all results.
+    """
+    if not results["ids"] or not results["ids"][0]:
+        return []
+    
+    distances = np.clip(np.asarray(results["distances"][0], dtype=np.float32), 0.0, 2.0)
+    return list(zip(results["ids"][0], (1.0 - distances / 2.0).tolist()))
+
+
+class _AgentVectors:
+    """One agent's embeddings as a contiguous matrix plus column arrays."""
+    
+    def __init__(self, dimensions: int, capacity: int = 64, quantize: bool = False):
+        """Initialize empty storage.
+        
+        Args:
+            dimensions: Embedding size
+            capacity: Initial number of rows to allocate
+            quantize: Store rows as int8 with a per-row scale (4x smaller)
+        """
+        self.size = 0
+        self.quantize = quantize
+        # Rows are L2-normalized so cosine similarity is a dot product
+        self.matrix = np.empty((capacity, dimensions), dtype=np.int8 if quantize else np.float32)
+        self.scales = np.ones(capacity, dtype=np.float32)
+        self.importance = np.empty(capacity, dtype=np.float32)
+        # Interned memory types, so the type filter compares one byte per row
+        self.type_codes = np.empty(capacity, dtype=np.int8)
+        self.ids: List[str] = []
+        # Filtered row indices by (memory types, min importance); cleared on append
+        self.candidate_cache: Dict[Tuple[FrozenSet[str], Optional[float]], np.ndarray] = {}
+    
+    def append(
+        self,
+        embedding_id: str,
+        embedding: Embedding,
+        importance: float,
+        type_code: int
+    ) -> None:
+        """Append one row, doubling the buffers when full."""
+        if self.size == len(self.matrix):
+            capacity = 2 * len(self.matrix)
+            self.matrix = np.resize(self.matrix, (capacity, self.matrix.shape[1]))
+            self.scales = np.resize(self.scales, capacity)
+            self.importance = np.resize(self.importance, capacity)
+            self.type_codes = np.resize(self.type_codes, capacity)
+        
+        vector = _normalize(embedding)
+        if self.quantize:
+            # Symmetric per-row quantization: the largest component maps to 127
+            scale = float(np.abs(vector).max()) / 127.0 or 1.0
+            self.matrix[self.size] = np.round(vector / scale).astype(np.int8)
+            self.scales[self.size] = scale
+        else:
+            self.matrix[self.size] = vector
+        self.importance[self.size] = importance
+        self.type_codes[self.size] = type_code
+        self.ids.append(embedding_id)
+        self.size += 1
+        self.candidate_cache.clear()
+    
+    def similarities(self, query: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Score rows against a unit-length query.
+        
+        Args:
+            query: Normalized float32 query vector
+            rows: Row indices to score, or None for every row
+            
+        Returns:
+            Cosine similarity per scored row
+        """
+        selector = slice(0, self.size) if rows is None else rows
+        similarities = self.matrix[selector] @ query
+        if self.quantize:
+            similarities *= self.scales[selector]
+        return similarities
+
+
+class _InMemoryCollection:
+    """In-process replacement for a Chroma collection, partitioned by agent."""
+    
+    def __init__(self, quantize: bool = False):
+        """Initialize an empty collection.
+        
+        Args:
+            quantize: Store embeddings as int8 instead of float32
+        """
+        self.quantize = quantize
+        self._agents: Dict[str, _AgentVectors] = {}
+        self._type_codes: Dict[Optional[str], int] = {}
+    
+    def add(
+        self,
+        ids: Sequence[str],
+        embeddings: Sequence[Embedding],
+        agent_ids: Sequence[str],
+        memory_types: Optional[Sequence[str]] = None,
+        importances: Optional[Sequence[float]] = None
+    ) -> None:
+        """Add embeddings, routing each row to its agent's matrix.
+        
+        Metadata arrives as columns and only the filterable ones are kept,
+        so no per-row dict is built or retained.
+        
+        Args:
+            ids: Embedding IDs
+            embeddings: Embedding vectors
+            agent_ids: Owning agent per row
+            memory_types: Memory type per row, if filterable
+            importances: Importance score per row, if filterable
+        """
+        memory_types = memory_types or [None] * len(ids)
+        importances = importances or [0.0] * len(ids)
+        for embedding_id, embedding, agent_id, memory_type, importance in zip(
+            ids, embeddings, agent_ids, memory_types, importances
+        ):
+            vectors = self._agents.get(agent_id)
+            if vectors is None:
+                vectors = self._agents[agent_id] = _AgentVectors(len(embedding), quantize=self.quantize)
+            type_code = self._type_codes.setdefault(memory_type, len(self._type_codes))
+            vectors.append(embedding_id, embedding, importance, type_code)
+    
+    def query(
+        self,
+        query_embedding: Embedding,
+        agent_id: str,
+        limit: int,
+        memory_types: Optional[List[str]] = None,
+        min_importance: Optional[float] = None
+    ) -> List[Tuple[str, float]]:
+        """Find an agent's most similar rows by cosine similarity.
+        
+        Returns:
+            List of (embedding_id, cosine_similarity) tuples, most similar first
+        """
+        vectors = self._agents.get(agent_id)
+        if vectors is None or vectors.size == 0 or limit <= 0:
+            return []
+        
+        # Filter on the metadata columns with a boolean mask, reusing the rows
+        # from earlier searches until the agent gains an embedding
+        candidates = None
+        if memory_types or min_importance is not None:
+            key = (frozenset(memory_types or ()), min_importance)
+            candidates = vectors.candidate_cache.get(key)
+            if candidates is None:
+                mask = np.ones(vectors.size, dtype=bool)
+                if memory_types:
+                    codes = [self._type_codes[t] for t in memory_types if t in self._type_codes]
+                    mask &= np.isin(vectors.type_codes[:vectors.size], codes)
+                if min_importance is not None:
+                    mask &= vectors.importance[:vectors.size] >= min_importance
+                candidates = vectors.candidate_cache[key] = np.flatnonzero(mask)
+            if len(candidates) == 0:
+                return []
+        
+        # Stored rows are unit length, so one matrix-vector product scores them all
+        similarities = vectors.similarities(_normalize(query_embedding), candidates)
+        
+        # O(N) selection of the top rows, then sort only those
+        if len(similarities) > limit:
+            top = np.argpartition(-similarities, limit - 1)[:limit]
+        else:
+            top = np.arange(len(similarities))
+        top = top[np.argsort(-similarities[top])]
+        
+        rows = top if candidates is None else candidates[top]
+        return [(vectors.ids[row], float(similarities[i])) for row, i in zip(rows, top)]
+    
+    def count(self) -> int:
+        """Get the number of stored embeddings."""
+        return sum(vectors.size for vectors in self._agents.values())
+
 
 class VectorStore:
-    """Chroma-based vector storage for semantic similarity search."""
+    """Chroma-based vector storage for semantic similarity search.
     
-    def __init__(self, persist_directory: str = "data/chroma"):
+    The "memory" backend keeps each agent's embeddings in a NumPy matrix
+    in-process instead, trading persistence for much cheaper searches.
+    """
+    
+    def __init__(
+        self,
+        persist_directory: str = "data/chroma",
+        backend: str = "chroma",
+        quantize: bool = False,
+        host: Optional[str] = None,
+        port: int = 8000
+    ):
         """Initialize vector store.
         
         Args:
             persist_directory: Directory to persist Chroma data
+            backend: "chroma" for persistent storage, "memory" for in-process search
+            quantize: Keep "memory" backend embeddings as int8 rather than float32
+            host: Chroma server host; when set, Chroma runs out of process and
+                persist_directory is unused
+            port: Chroma server port
         """
+        if backend not in VECTOR_BACKENDS:
+            raise ValueError(f"Unknown vector backend: {backend}")
+        
+        self.backend = backend
+        self.quantize = quantize
         self.persist_directory = Path(persist_directory)
-        self.persist_directory.mkdir(parents=True, exist_ok=True)
+        self.client = None
         
-        # Initialize Chroma client
-        self.client = chromadb.PersistentClient(
-            path=str(self.persist_directory),
-            settings=Settings(
+        if backend == "chroma":
+            client_settings = Settings(
                 allow_reset=True,
                 anonymized_telemetry=False
             )
-        )
+            
+            # Initialize Chroma client; a server keeps index writes off this process
+            if host:
+                self.client = chromadb.HttpClient(host=host, port=port, settings=client_settings)
+            else:
+                self.persist_directory.mkdir(parents=True, exist_ok=True)
+                self.client = chromadb.PersistentClient(
+                    path=str(self.persist_directory),
+                    settings=client_settings
+                )
         
         # Collections for different types of content
         self.memory_collection = None
@@ -40,18 +269,18 @@ class VectorStore:
     
     def initialize_collections(self) -> None:
         """Initialize Chroma collections."""
+        if self.backend == "memory":
+            if self.memory_collection is None:
+                self.memory_collection = _InMemoryCollection(quantize=self.quantize)
+                self.reflection_collection = _InMemoryCollection(quantize=self.quantize)
+            return
+        
         try:
             # Memory collection for agent memories
-            self.memory_collection = self.client.get_or_create_collection(
-                name="agent_memories",
-                metadata={"description": "Agent memory embeddings for semantic search"}
-            )
+            self.memory_collection = self._get_inner_product_collection("agent_memories")
             
             # Reflection collection for high-level insights
-            self.reflection_collection = self.client.get_or_create_collection(
-                name="agent_reflections", 
-                metadata={"description": "Agent reflection embeddings"}
-            )
+            self.reflection_collection = self._get_inner_product_collection("agent_reflections")
             
             logger.info("Initialized Chroma collections")
             
@@ -59,10 +288,58 @@ class VectorStore:
             logger.error(f"Failed to initialize collections: {e}")
             raise
     
+    def _get_inner_product_collection(self, name: str):
+        """Get or create a Chroma collection, migrating it to the inner-product space.
+        
+        The distance space is fixed when a collection is created, so
+        collections persisted before the switch to unit vectors are still in
+        L2 space with unnormalized embeddings. Those are copied into a new
+        inner-product collection with normalized embeddings, then swapped in
+        under the original name.
+        
+        Args:
+            name: Collection name, a key of _CHROMA_COLLECTIONS
+            
+        Returns:
+            The collection, in inner-product space
+        """
+        metadata = _CHROMA_COLLECTIONS[name]
+        collection = self.client.get_or_create_collection(name=name, metadata=metadata)
+        
+        configuration = getattr(collection, "configuration_json", None) or {}
+        space = (configuration.get("hnsw") or {}).get("space") or (collection.metadata or {}).get("hnsw:space", "l2")
+        if space == "ip":
+            return collection
+        
+        existing = collection.get(include=["embeddings", "documents", "metadatas"])
+        logger.warning(
+            f"Migrating Chroma collection {name} from {space} to inner-product space "
+            f"({len(existing['ids'])} embeddings)"
+        )
+        
+        migrated_name = f"{name}_ip_migration"
+        try:
+            self.client.delete_collection(migrated_name)
+        except Exception:
+            pass
+        migrated = self.client.create_collection(name=migrated_name, metadata=metadata)
+        if existing["ids"]:
+            migrated.add(
+                ids=existing["ids"],
+                embeddings=[_normalize(embedding) for embedding in existing["embeddings"]],
+                documents=existing["documents"],
+                metadatas=existing["metadatas"]
+            )
+        
+        # Only drop the original once its contents are safely copied
+        self.client.delete_collection(name)
+        migrated.modify(name=name)
+        return self.client.get_collection(name)
+    
     async def add_memory_embedding(
         self,
         memory: Memory,
-        embedding: List[float]
+        embedding: Embedding
     ) -> str:
         """Add a memory embedding to the vector store.
         
@@ -73,38 +350,72 @@ class VectorStore:
         Returns:
             The embedding ID for reference
         """
+        embedding_ids = await self.add_memory_embeddings([memory], [embedding])
+        return embedding_ids[0]
+    
+    async def add_memory_embeddings(
+        self,
+        memories: Sequence[Memory],
+        embeddings: Sequence[Embedding]
+    ) -> List[str]:
+        """Add several memory embeddings to the vector store in one call.
+        
+        Args:
+            memories: The memory objects
+            embeddings: The embedding vectors, one per memory
+            
+        Returns:
+            The embedding IDs for reference, in input order
+        """
         if not self.memory_collection:
             self.initialize_collections()
         
-        embedding_id = str(memory.id)
+        if not memories:
+            return []
+        
+        embedding_ids = [str(memory.id) for memory in memories]
+        
+        if self.backend == "memory":
+            self.memory_collection.add(
+                embedding_ids,
+                embeddings,
+                agent_ids=[memory.agent_id for memory in memories],
+                memory_types=[memory.memory_type.value for memory in memories],
+                importances=[memory.importance_score for memory in memories]
+            )
+            logger.debug(f"Added {len(embedding_ids)} memory embeddings")
+            return embedding_ids
         
         # Prepare metadata
-        metadata = {
-            "agent_id": memory.agent_id,
-            "memory_type": memory.memory_type.value if hasattr(memory.memory_type, 'value') else memory.memory_type,
-            "timestamp": memory.timestamp.isoformat(),
-            "importance": memory.importance_score,
-            "location": memory.location or "",
-        }
+        metadatas = [
+            {
+                "agent_id": memory.agent_id,
+                "memory_type": memory.memory_type.value,
+                "timestamp": memory.timestamp.isoformat(),
+                "importance": memory.importance_score,
+                "location": memory.location or "",
+            }
+            for memory in memories
+        ]
         
         try:
             self.memory_collection.add(
-                embeddings=[embedding],
-                documents=[memory.content],
-                metadatas=[metadata],
-                ids=[embedding_id]
+                embeddings=[_normalize(embedding) for embedding in embeddings],
+                documents=[memory.content for memory in memories],
+                metadatas=metadatas,
+                ids=embedding_ids
             )
             
-            logger.debug(f"Added embedding for memory {embedding_id}")
-            return embedding_id
+            logger.debug(f"Added {len(embedding_ids)} memory embeddings")
+            return embedding_ids
             
         except Exception as e:
-            logger.error(f"Failed to add memory embedding: {e}")
+            logger.error(f"Failed to add memory embeddings: {e}")
             raise
     
     async def search_memories(
         self,
-        query_embedding: List[float],
+        query_embedding: Embedding,
         agent_id: str,
         limit: int = 10,
         memory_types: Optional[List[str]] = None,
@@ -125,32 +436,36 @@ class VectorStore:
         if not self.memory_collection:
             self.initialize_collections()
         
-        # Build where clause for filtering
-        where_clause = {"agent_id": agent_id}
+        if self.backend == "memory":
+            matches = self.memory_collection.query(
+                query_embedding, agent_id, limit,
+                memory_types=memory_types,
+                min_importance=min_importance
+            )
+            # Same 0-1 similarity scale as the Chroma path below
+            return [(memory_id, (1.0 + similarity) / 2.0) for memory_id, similarity in matches]
+        
+        # Build where clause for filtering; Chroma takes one operator per
+        # clause, so several conditions are combined under $and
+        conditions = [{"agent_id": agent_id}]
         
         if memory_types:
-            where_clause["memory_type"] = {"$in": memory_types}
+            conditions.append({"memory_type": {"$in": memory_types}})
         
         if min_importance is not None:
-            where_clause["importance"] = {"$gte": min_importance}
+            conditions.append({"importance": {"$gte": min_importance}})
+        
+        where_clause = conditions[0] if len(conditions) == 1 else {"$and": conditions}
         
         try:
             results = self.memory_collection.query(
-                query_embeddings=[query_embedding],
+                query_embeddings=[_normalize(query_embedding)],
                 n_results=limit,
                 where=where_clause,
-                include=["distances", "metadatas"]
+                include=["distances"]
             )
             
-            # Extract results
-            memory_similarities = []
-            if results["ids"]:
-                for memory_id, distance in zip(results["ids"][0], results["distances"][0]):
-                    # Convert distance to similarity (Chroma uses cosine distance)
-                    # Clamp distance to reasonable range and convert to 0-1 similarity
-                    clamped_distance = max(0.0, min(2.0, distance))  # Cosine distance is typically 0-2
-                    similarity = 1.0 - (clamped_distance / 2.0)  # Convert to 0-1 similarity
-                    memory_similarities.append((memory_id, similarity))
+            memory_similarities = _similarities_from_results(results)
             
             logger.debug(f"Found {len(memory_similarities)} similar memories for agent {agent_id}")
             return memory_similarities
@@ -164,7 +479,7 @@ class VectorStore:
         reflection_id: UUID,
         agent_id: str,
         content: str,
-        embedding: List[float],
+        embedding: Embedding,
         supporting_memories: List[UUID]
     ) -> str:
         """Add a reflection embedding to the vector store.
@@ -184,6 +499,11 @@ class VectorStore:
         
         embedding_id = str(reflection_id)
         
+        if self.backend == "memory":
+            self.reflection_collection.add([embedding_id], [embedding], agent_ids=[agent_id])
+            logger.debug(f"Added reflection embedding {embedding_id}")
+            return embedding_id
+        
         # Prepare metadata
         metadata = {
             "agent_id": agent_id,
@@ -193,7 +513,7 @@ class VectorStore:
         
         try:
             self.reflection_collection.add(
-                embeddings=[embedding],
+                embeddings=[_normalize(embedding)],
                 documents=[content],
                 metadatas=[metadata],
                 ids=[embedding_id]
@@ -208,7 +528,7 @@ class VectorStore:
     
     async def search_reflections(
         self,
-        query_embedding: List[float],
+        query_embedding: Embedding,
         agent_id: str,
         limit: int = 5
     ) -> List[Tuple[str, float]]:
@@ -225,22 +545,19 @@ class VectorStore:
         if not self.reflection_collection:
             self.initialize_collections()
         
+        if self.backend == "memory":
+            matches = self.reflection_collection.query(query_embedding, agent_id, limit)
+            return [(reflection_id, (1.0 + similarity) / 2.0) for reflection_id, similarity in matches]
+        
         try:
             results = self.reflection_collection.query(
-                query_embeddings=[query_embedding],
+                query_embeddings=[_normalize(query_embedding)],
                 n_results=limit,
                 where={"agent_id": agent_id},
                 include=["distances"]
             )
             
-            # Extract results
-            reflection_similarities = []
-            if results["ids"]:
-                for reflection_id, distance in zip(results["ids"][0], results["distances"][0]):
-                    similarity = 1.0 - distance
-                    reflection_similarities.append((reflection_id, similarity))
-            
-            return reflection_similarities
+            return _similarities_from_results(results)
             
         except Exception as e:
             logger.error(f"Failed to search reflections: {e}")
@@ -260,6 +577,12 @@ class VectorStore:
     
     def reset_collections(self) -> None:
         """Reset all collections (useful for testing)."""
+        if self.backend == "memory":
+            self.memory_collection = None
+            self.reflection_collection = None
+            self.initialize_collections()
+            return
+        
         try:
             if self.memory_collection:
                 self.client.delete_collection("agent_memories")
@@ -0,0 +1,182 @@
+"""Unit tests for agent cognitive systems."""
+
+from datetime import date, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from simulacra.agents.memory_manager import MemoryManager
+from simulacra.agents.planning_engine import PlanningEngine
+from simulacra.agents.reflection_engine import ReflectionEngine
+from simulacra.llm.ollama_client import OllamaEmbeddingResponse
+from simulacra.models.action import Action, ActionResult, ActionType
+from simulacra.models.memory import Memory, MemoryType, Reflection
+from simulacra.models.planning import DailyPlan
+
+
+def _make_memory_manager(test_settings, memories, similarities):
+    """Create a memory manager backed by mocked stores."""
+    llm_service = MagicMock()
+    llm_service.settings = test_settings
+    llm_service.ollama_client.embeddings = AsyncMock(
+        return_value=OllamaEmbeddingResponse(embedding=[0.1] * 4)
+    )
+    
+    by_id = {str(memory.id): memory for memory in memories}
+    sqlite_store = MagicMock()
+    sqlite_store.get_memory = AsyncMock(side_effect=lambda memory_id: by_id.get(memory_id))
+    
+    vector_store = MagicMock()
+    vector_store.search_memories = AsyncMock(
+        return_value=[(str(memory.id), sim) for memory, sim in zip(memories, similarities)]
+    )
+    
+    return MemoryManager(sqlite_store, vector_store, llm_service)
+
+
+class TestMemoryRetrieval:
+    """Test hybrid memory retrieval scoring."""
+    
+    @pytest.mark.asyncio
+    async def test_retrieval_ranks_by_hybrid_score(self, test_settings):
+        """Test that retrieval combines semantic, recency and importance scores."""
+        now = datetime.utcnow()
+        old_trivial = Memory(
+            agent_id="a", content="old", memory_type=MemoryType.ACTION,
+            timestamp=now - timedelta(hours=48), importance_score=1.0
+        )
+        fresh_important = Memory(
+            agent_id="a", content="fresh", memory_type=MemoryType.ACTION,
+            timestamp=now, importance_score=9.0
+        )
+        manager = _make_memory_manager(
+            test_settings, [old_trivial, fresh_important], [0.8, 0.7]
+        )
+        
+        results = await manager.retrieve_relevant_memories("a", "context", limit=1)
+        
+        assert len(results) == 1
+        result = results[0]
+        assert result.memory.id == fresh_important.id
+        expected = 0.6 * 0.7 + 0.2 * result.recency_score + 0.2 * 0.9
+        assert result.score == pytest.approx(expected)
+        assert result.recency_score == pytest.approx(1.0, abs=1e-3)
+    
+    @pytest.mark.asyncio
+    async def test_retrieval_skips_missing_memories(self, test_settings):
+        """Test that vector hits without a stored memory are ignored."""
+        stored = Memory(agent_id="a", content="stored", importance_score=5.0)
+        missing = Memory(agent_id="a", content="missing", importance_score=5.0)
+        manager = _make_memory_manager(test_settings, [stored, missing], [0.9, 0.9])
+        manager.sqlite_store.get_memory = AsyncMock(
+            side_effect=lambda memory_id: stored if memory_id == str(stored.id) else None
+        )
+        
+        results = await manager.retrieve_relevant_memories("a", "context", limit=5)
+        
+        assert [r.memory.id for r in results] == [stored.id]
+    
+    @pytest.mark.asyncio
+    async def test_action_memory_skips_llm_scoring(self, test_settings, sample_agent):
+        """Test that routine action memories are scored without the LLM."""
+        manager = _make_memory_manager(test_settings, [], [])
+        manager._score_memory_importance = AsyncMock(return_value=8.0)
+        manager._store_memory = AsyncMock()
+        action = Action(agent_id=sample_agent.id, action_type=ActionType.WAIT)
+        result = ActionResult(action_id=action.id, success=True, message="Waited")
+        
+        memory = await manager.form_memory_from_action(sample_agent, action, result, "home")
+        assert memory.importance_score == 1.0
+        manager._score_memory_importance.assert_not_awaited()
+        
+        memory = await manager.form_memory_from_action(sample_agent, action, result, "home", infer=True)
+        assert memory.importance_score == 8.0
+
+
+class TestPlanningEngine:
+    """Test daily plan lookups."""
+    
+    @pytest.mark.asyncio
+    async def test_current_plan_cached_and_refreshed_on_store(self, test_settings):
+        """Test that today's plan is read once and replaced when a plan is stored."""
+        sqlite_store = MagicMock()
+        sqlite_store.get_plans = AsyncMock(return_value=[])
+        sqlite_store.add_plan = AsyncMock()
+        engine = PlanningEngine(MagicMock(), sqlite_store, MagicMock(), test_settings)
+        
+        assert await engine.get_current_daily_plan("alice") is None
+        assert await engine.get_current_task("alice") is None
+        assert sqlite_store.get_plans.await_count == 1
+        
+        plan = DailyPlan(agent_id="alice", date=date.today(), goals=["Read"])
+        await engine._store_daily_plan(plan)
+        
+        assert await engine.get_current_daily_plan("alice") is plan
+        assert sqlite_store.get_plans.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_should_plan_counts_memories_in_memory(self, test_settings, sample_agent):
+        """Test that replanning triggers are queried once, then counted in memory."""
+        plan = DailyPlan(agent_id=sample_agent.id, date=date.today(), updated_at=datetime.now())
+        sqlite_store = MagicMock()
+        sqlite_store.add_plan = AsyncMock()
+        memory_manager = MagicMock()
+        memory_manager.get_recent_memories = AsyncMock(return_value=[
+            Memory(agent_id=sample_agent.id, content="Big news", importance_score=8.0)
+        ])
+        engine = PlanningEngine(memory_manager, sqlite_store, MagicMock(), test_settings)
+        await engine._store_daily_plan(plan)
+        
+        assert await engine.should_plan(sample_agent) is False
+        
+        engine.note_memory(Memory(agent_id=sample_agent.id, content="Won", importance_score=9.0))
+        engine.note_memory(Memory(agent_id=sample_agent.id, content="Sat", importance_score=2.0))
+        assert await engine.should_plan(sample_agent) is False
+        
+        engine.note_memory(Memory(agent_id=sample_agent.id, content="Lost", importance_score=7.0))
+        assert await engine.should_plan(sample_agent) is True
+        assert memory_manager.get_recent_memories.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_stored_reflections_trigger_replan(self, test_settings, sample_agent):
+        """Test that reflection memories count towards replanning."""
+        plan = DailyPlan(agent_id=sample_agent.id, date=date.today(), updated_at=datetime.now())
+        memory_manager = _make_memory_manager(test_settings, [], [])
+        memory_manager.sqlite_store.add_memories = AsyncMock()
+        memory_manager.sqlite_store.add_reflections = AsyncMock()
+        memory_manager.vector_store.add_memory_embeddings = AsyncMock(return_value=[])
+        memory_manager.get_recent_memories = AsyncMock(return_value=[])
+        sqlite_store = MagicMock()
+        sqlite_store.add_plan = AsyncMock()
+        planning_engine = PlanningEngine(memory_manager, sqlite_store, MagicMock(), test_settings)
+        reflection_engine = ReflectionEngine(
+            memory_manager, memory_manager.sqlite_store, MagicMock(), test_settings
+        )
+        await planning_engine._store_daily_plan(plan)
+        assert await planning_engine.should_plan(sample_agent) is False
+        
+        await reflection_engine._store_reflections_as_memories([
+            Reflection(agent_id=sample_agent.id, content=f"Insight {i}", importance_score=8.0)
+            for i in range(3)
+        ])
+        
+        assert await planning_engine.should_plan(sample_agent) is True
+
+
+class TestReflectionEngine:
+    """Test the reflection trigger."""
+    
+    @pytest.mark.asyncio
+    async def test_should_reflect_respects_min_gap(self, test_settings, sample_agent):
+        """Test that a failed reflection is not retried on the very next tick."""
+        engine = ReflectionEngine(MagicMock(), MagicMock(), MagicMock(), test_settings)
+        sample_agent.state.importance_accumulator = test_settings.reflection_threshold
+        
+        assert await engine.should_reflect(sample_agent, tick=10) is True
+        
+        sample_agent.state.last_reflection_tick = 10
+        assert await engine.should_reflect(sample_agent, tick=11) is False
+        assert await engine.should_reflect(sample_agent, tick=10 + test_settings.reflection_min_gap_ticks) is True
+        
+        sample_agent.state.importance_accumulator = 0.0
+        assert await engine.should_reflect(sample_agent, tick=100) is False
@@ -57,6 +57,19 @@ class TestOllamaClient:
         assert response.model == "test-model"
         assert response.done is True
     
+    @pytest.mark.asyncio
+    async def test_persistent_client_survives_context_exit(self, test_settings):
+        """Test that a persistent client keeps its pool open until disconnect."""
+        client = OllamaClient(test_settings.ollama_base_url, persistent=True)
+        
+        async with client:
+            pool = client._client
+        
+        assert client._client is pool
+        
+        await client.disconnect()
+        assert client._client is None
+    
     @pytest.mark.asyncio
     async def test_generate_embeddings(self, test_settings):
         """Test embedding generation."""
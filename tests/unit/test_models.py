@@ -0,0 +1,132 @@
+"""Unit tests for data models."""
+
+from simulacra.models.action import Action, ActionType
+from simulacra.models.agent import Agent, AgentStatus
+from simulacra.models.event import Event, EventType, MovementDetails
+from simulacra.models.world import AgentLocation, Place, WorldState
+
+
+def _make_world() -> WorldState:
+    """Create a small two-place world with one agent."""
+    places = {
+        "home": Place(id="home", name="Home", description="A home", connected_places=["park"]),
+        "park": Place(id="park", name="Park", description="A park", connected_places=["home"]),
+        "shop": Place(id="shop", name="Shop", description="An isolated shop"),
+    }
+    world = WorldState(places=places)
+    world.place_agent("alice", "home")
+    return world
+
+
+class TestWorldState:
+    """Test world state operations."""
+    
+    def test_move_agent_to_connected_place(self):
+        """Test moving an agent along a connection."""
+        world = _make_world()
+        
+        assert world.move_agent("alice", "park") is True
+        
+        location = world.agent_locations["alice"]
+        assert location.place_id == "park"
+        assert location.previous_place_id == "home"
+        assert location.last_updated == world.last_updated
+    
+    def test_can_move_to_uses_connections(self):
+        """Test connectivity checks for validated and constructed places."""
+        world = _make_world()
+        world.places["cafe"] = Place.model_construct(
+            id="cafe", name="Cafe", description="A cafe", connected_places=["home"]
+        )
+        
+        assert world.can_move_to("alice", "park") is True
+        assert world.can_move_to("alice", "shop") is False
+        assert world.places["cafe"].is_connected_to("home") is True
+    
+    def test_move_agent_placed_by_direct_assignment(self):
+        """Test moving an agent whose location was assigned without place_agent."""
+        world = _make_world()
+        world.agent_locations["bob"] = AgentLocation(agent_id="bob", place_id="park")
+        
+        assert world.move_agent("bob", "home") is True
+        assert world.get_agents_at_location("home") == ["alice", "bob"]
+    
+    def test_move_agent_rejects_unconnected_place(self):
+        """Test that moves to unconnected or unknown places fail."""
+        world = _make_world()
+        
+        assert world.move_agent("alice", "shop") is False
+        assert world.move_agent("alice", "nowhere") is False
+        assert world.move_agent("bob", "park") is False
+        assert world.agent_locations["alice"].place_id == "home"
+    
+    def test_occupancy_tracks_moves(self):
+        """Test that per-place occupancy follows placement and movement."""
+        world = _make_world()
+        world.place_agent("bob", "park")
+        
+        assert world.get_agents_at_location("home") == ["alice"]
+        assert world.get_agents_at_location("park") == ["bob"]
+        assert world.get_occupancy_counts() == {"home": 1, "park": 1}
+        
+        world.move_agent("alice", "park")
+        assert world.get_agents_at_location("home") == []
+        assert world.get_agents_at_location("park") == ["bob", "alice"]
+        
+        # Re-placing an agent removes them from their old place
+        world.place_agent("bob", "shop")
+        assert world.get_agents_at_location("park") == ["alice"]
+        assert world.get_agents_at_location("shop") == ["bob"]
+    
+    def test_occupancy_built_from_initial_locations(self):
+        """Test that a world created with locations indexes them."""
+        world = WorldState(
+            places=_make_world().places,
+            agent_locations={"carol": AgentLocation(agent_id="carol", place_id="shop")}
+        )
+        
+        assert world.get_agents_at_location("shop") == ["carol"]
+
+
+class TestAgent:
+    """Test Agent model."""
+    
+    def test_personality_tags_follow_personality(self, sample_agent):
+        """Test that personality tags are tokenized and refreshed on change."""
+        assert sample_agent.personality_tags == frozenset({"helpful", "reliable", "test", "oriented"})
+        
+        sample_agent.personality = "Quiet, introverted"
+        assert sample_agent.personality_tags == frozenset({"quiet", "introverted"})
+    
+    def test_loaded_status_is_enum(self):
+        """Test that a stored status string is coerced to the enum member."""
+        agent = Agent(id="a", name="A", bio="", personality="", home_location="h",
+                      state={"agent_id": "a", "status": "idle"})
+        assert agent.state.status is AgentStatus.IDLE
+
+
+class TestAction:
+    """Test Action model."""
+    
+    def test_action_type_is_enum(self):
+        """Test that string action types are coerced to the enum member."""
+        action = Action(agent_id="alice", action_type="move")
+        assert action.action_type is ActionType.MOVE
+
+
+class TestEvent:
+    """Test event model behavior."""
+    
+    def test_details_discriminated_by_event_type(self):
+        """Test that event details round-trip through the tagged union."""
+        event = Event(
+            event_type=EventType.MOVEMENT,
+            content="Alice walked to the park",
+            details={"event_type": "movement", "from_location": "home", "to_location": "park"}
+        )
+        
+        assert isinstance(event.details, MovementDetails)
+        
+        restored = Event.model_validate_json(event.model_dump_json())
+        assert isinstance(restored.details, MovementDetails)
+        assert restored.details.to_location == "park"
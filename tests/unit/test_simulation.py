@@ -0,0 +1,382 @@
+"""Unit tests for simulation services."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from simulacra.agents.memory_manager import MemoryManager
+from simulacra.logging.simulation_logger import SimulationLogger
+from simulacra.models.action import Action, ActionType, WaitAction
+from simulacra.models.world import Place, WorldState
+from simulacra.simulation.action_executor import ActionExecutor
+from simulacra.simulation.llm_behavior import LLMBehavior
+from simulacra.simulation.simple_behavior import SimpleBehavior
+from simulacra.simulation.time_manager import TimeManager
+from simulacra.simulation.world_manager import WorldManager
+
+
+def _make_world_manager() -> WorldManager:
+    """Create a world manager over a small world with mocked storage."""
+    places = {
+        "home": Place(id="home", name="Home", description="A home", connected_places=["park"]),
+        "park": Place(id="park", name="Park", description="A park", connected_places=["home"]),
+    }
+    storage = MagicMock()
+    storage.update_agent_location = AsyncMock()
+    storage.update_agent_locations = AsyncMock()
+    
+    world_manager = WorldManager(MagicMock(), storage)
+    world_manager._world_state = WorldState(places=places)
+    return world_manager
+
+
+class TestTimeManager:
+    """Test tick scheduling."""
+    
+    @pytest.mark.asyncio
+    async def test_zero_interval_runs_ticks_back_to_back(self):
+        """Test that a zero tick interval runs without pacing sleeps."""
+        time_manager = TimeManager(tick_interval_seconds=0)
+        ticks = []
+        time_manager.add_tick_callback(ticks.append)
+        
+        await time_manager.start_simulation()
+        await asyncio.sleep(0.05)
+        await time_manager.pause_simulation()
+        
+        assert len(ticks) > 10
+        assert ticks == list(range(1, len(ticks) + 1))
+    
+    @pytest.mark.asyncio
+    async def test_slow_tick_does_not_cause_catch_up_burst(self):
+        """Test that ticks after an overrun keep their normal spacing."""
+        time_manager = TimeManager(tick_interval_seconds=0.05)
+        loop = asyncio.get_running_loop()
+        starts = []
+        
+        async def on_tick(tick):
+            starts.append(loop.time())
+            if tick == 1:
+                await asyncio.sleep(0.3)
+        
+        time_manager.add_tick_callback(on_tick)
+        await time_manager.start_simulation()
+        await asyncio.sleep(0.5)
+        await time_manager.pause_simulation()
+        
+        gaps = [later - earlier for earlier, later in zip(starts[1:], starts[2:])]
+        assert len(gaps) >= 2
+        assert min(gaps) > 0.03
+
+
+class TestWorldManager:
+    """Test world manager operations."""
+    
+    @pytest.mark.asyncio
+    async def test_place_info_refreshes_after_move(self):
+        """Test that cached place info follows agents moving between places."""
+        world_manager = _make_world_manager()
+        await world_manager.place_agent("alice", "home")
+        
+        place_info = world_manager.get_place_info("home")
+        assert place_info["agents"] == ["alice"]
+        place_info["agents"].append("mallory")
+        place_info["current_occupancy"] = 2
+        assert world_manager.get_place_info("home")["agents"] == ["alice"]
+        assert world_manager.get_place_info("home")["current_occupancy"] == 1
+        assert world_manager.get_place_info("park")["agents"] == []
+        
+        assert await world_manager.move_agent("alice", "park") is True
+        
+        assert world_manager.get_place_info("home")["agents"] == []
+        assert world_manager.get_place_info("park")["current_occupancy"] == 1
+        assert world_manager.get_place_name("park") == "Park"
+        assert world_manager.get_place_name("nowhere") == "nowhere"
+    
+    @pytest.mark.asyncio
+    async def test_moves_are_flushed_in_one_batch(self):
+        """Test that moves are saved together, keeping each agent's latest location."""
+        world_manager = _make_world_manager()
+        await world_manager.place_agent("alice", "home")
+        await world_manager.place_agent("bob", "home")
+        await world_manager.move_agent("alice", "park")
+        await world_manager.move_agent("alice", "home")
+        await world_manager.move_agent("bob", "park")
+        
+        assert await world_manager.flush_locations() == 2
+        
+        (saved,), _ = world_manager.storage.update_agent_locations.call_args
+        assert {location.agent_id: location.place_id for location in saved} == {"alice": "home", "bob": "park"}
+        assert await world_manager.flush_locations() == 0
+    
+    @pytest.mark.asyncio
+    async def test_get_other_agents_at_location(self):
+        """Test that the asking agent is left out of its co-located agents."""
+        world_manager = _make_world_manager()
+        await world_manager.place_agent("alice", "home")
+        await world_manager.place_agent("bob", "home")
+        
+        assert world_manager.get_other_agents_at_location("home", "alice") == ["bob"]
+        assert world_manager.get_other_agents_at_location("nowhere", "alice") == []
+
+
+class TestActionExecutor:
+    """Test action execution."""
+    
+    @pytest.mark.asyncio
+    async def test_execute_wait(self):
+        """Test that a wait action reports its duration and location."""
+        world_manager = _make_world_manager()
+        await world_manager.place_agent("alice", "home")
+        executor = ActionExecutor(world_manager)
+        action = WaitAction(duration_minutes=10, reason="resting").to_action("alice")
+        
+        result = await executor.execute_action(action)
+        
+        assert result.success is True
+        assert result.action_id == action.id
+        assert result.message == "Waited for 10 minutes (resting) at Home"
+        assert result.side_effects == {"duration_minutes": 10}
+    
+    @pytest.mark.asyncio
+    async def test_execute_unvalidated_action(self):
+        """Test that string action types from model_construct still dispatch."""
+        world_manager = _make_world_manager()
+        await world_manager.place_agent("alice", "home")
+        executor = ActionExecutor(world_manager)
+        
+        observe = Action.model_construct(agent_id="alice", action_type="observe", parameters={})
+        unknown = Action.model_construct(agent_id="alice", action_type="dance", parameters={})
+        
+        assert (await executor.execute_action(observe)).success is True
+        assert (await executor.execute_action(unknown)).message == "Unknown action type: dance"
+    
+    @pytest.mark.asyncio
+    async def test_available_actions_follow_location(self):
+        """Test that cached available actions are looked up by current location."""
+        world_manager = _make_world_manager()
+        await world_manager.place_agent("alice", "home")
+        executor = ActionExecutor(world_manager)
+        
+        actions = executor.get_available_actions("alice")
+        assert actions[0] == "move to Park"
+        
+        # Callers get their own copy of the cached list
+        actions.clear()
+        assert executor.get_available_actions("alice")[0] == "move to Park"
+        
+        await world_manager.move_agent("alice", "park")
+        assert executor.get_available_actions("alice")[0] == "move to Home"
+        assert executor.get_available_actions("nobody") == [
+            "wait and rest", "observe surroundings", "interact with environment"
+        ]
+
+
+class TestSimpleBehavior:
+    """Test rule-based behavior."""
+    
+    @pytest.mark.asyncio
+    async def test_actions_carry_agent_id(self, sample_agent):
+        """Test that every chosen action is built for the acting agent."""
+        world_manager = _make_world_manager()
+        await world_manager.place_agent(sample_agent.id, "home")
+        behavior = SimpleBehavior(world_manager)
+        
+        for _ in range(20):
+            action = await behavior.choose_action(sample_agent)
+            assert action.agent_id == sample_agent.id
+
+
+class TestLLMBehavior:
+    """Test LLM decision generation and parsing."""
+    
+    @pytest.mark.asyncio
+    async def test_stream_decision_stops_after_json_object(self, test_settings):
+        """Test that streaming stops once the JSON object is complete."""
+        chunks = ['{"reasoning": "I am {ti', 'red}", "action": {"type": "WAIT"}', '}', "\n\n", "\n"]
+        consumed = []
+        
+        async def generate_stream(**kwargs):
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+        
+        llm_service = MagicMock()
+        llm_service.settings = test_settings
+        llm_service.ollama_client.generate_stream = generate_stream
+        behavior = LLMBehavior(_make_world_manager(), llm_service=llm_service)
+        
+        response = await behavior._stream_decision("prompt")
+        
+        assert response == '{"reasoning": "I am {tired}", "action": {"type": "WAIT"}}'
+        assert consumed == chunks[:3]
+    
+    @pytest.mark.asyncio
+    async def test_identical_prompts_coalesce_in_deterministic_mode(self, test_settings):
+        """Test that concurrent identical prompts share one LLM request."""
+        calls = []
+        
+        async def generate_stream(**kwargs):
+            calls.append(kwargs["options"]["temperature"])
+            await asyncio.sleep(0)
+            yield '{"reasoning": "Same", "action": {"type": "OBSERVE"}}'
+        
+        llm_service = MagicMock()
+        llm_service.settings = test_settings.model_copy(update={"deterministic_mode": True})
+        llm_service.ollama_client.generate_stream = generate_stream
+        behavior = LLMBehavior(_make_world_manager(), llm_service=llm_service)
+        
+        responses = await asyncio.gather(
+            behavior._request_decision("prompt"),
+            behavior._request_decision("prompt"),
+            behavior._request_decision("other prompt"),
+        )
+        
+        assert responses[0] == responses[1] == responses[2]
+        assert calls == [0.0, 0.0]
+        assert behavior._pending_decisions == {}
+    
+    def test_fast_path_decision(self, test_settings, sample_agent):
+        """Test that trivially constrained contexts are decided without the LLM."""
+        llm_service = MagicMock()
+        llm_service.settings = test_settings
+        behavior = LLMBehavior(_make_world_manager(), llm_service=llm_service)
+        context = {
+            "current_task": None,
+            "agent_energy": 80.0,
+            "available_destinations": [],
+            "other_agents": [],
+        }
+        
+        action, _ = behavior._fast_path_decision(sample_agent, context)
+        assert action.action_type is ActionType.OBSERVE
+        
+        action, _ = behavior._fast_path_decision(sample_agent, {**context, "agent_energy": 10.0})
+        assert action.action_type is ActionType.WAIT
+        
+        assert behavior._fast_path_decision(sample_agent, {**context, "other_agents": ["bob"]}) is None
+        assert behavior._fast_path_decision(sample_agent, {**context, "current_task": "read"}) is None
+    
+    def test_parse_llm_response(self, test_settings, sample_agent):
+        """Test that reasoning and action are extracted from the JSON response."""
+        llm_service = MagicMock()
+        llm_service.settings = test_settings
+        behavior = LLMBehavior(_make_world_manager(), llm_service=llm_service)
+        
+        action, reasoning = behavior._parse_llm_response(
+            '{"reasoning": "I want to chat.", "action": {"type": "Wait", "reason": "for Bob to arrive"}}',
+            sample_agent,
+            {"available_destinations": [], "current_location": "home"}
+        )
+        
+        assert reasoning == "I want to chat."
+        assert action.action_type is ActionType.WAIT
+        assert action.parameters["reason"] == "for Bob to arrive"
+    
+    @pytest.mark.asyncio
+    async def test_interaction_with_agent_is_scored_by_llm(self, test_settings, sample_agent):
+        """Test that an LLM-chosen interaction with a co-located agent reaches the LLM scorer."""
+        world_manager = _make_world_manager()
+        await world_manager.place_agent(sample_agent.id, "home")
+        await world_manager.place_agent("bob", "home")
+        llm_service = MagicMock()
+        llm_service.settings = test_settings
+        behavior = LLMBehavior(world_manager, llm_service=llm_service)
+        
+        action, _ = behavior._parse_llm_response(
+            '{"reasoning": "Say hi.", "action": {"type": "INTERACT", "target": "Bob about lunch"}}',
+            sample_agent,
+            {"available_destinations": [], "current_location": "home", "other_agents": ["bob"]}
+        )
+        result = await ActionExecutor(world_manager).execute_action(action)
+        
+        assert action.parameters["target_agent_id"] == "bob"
+        assert result.side_effects["target_agent"] == "bob"
+        
+        memory_manager = MemoryManager(MagicMock(), MagicMock(), llm_service)
+        memory_manager._score_memory_importance = AsyncMock(return_value=6.0)
+        memory_manager._store_memory = AsyncMock()
+        memory = await memory_manager.form_memory_from_action(sample_agent, action, result, "Home")
+        
+        memory_manager._score_memory_importance.assert_awaited_once()
+        assert memory.importance_score == 6.0
+    
+    def test_interaction_target_matches_whole_agent_id(self, test_settings, sample_agent):
+        """Test that interaction targets don't match agent ids as substrings."""
+        llm_service = MagicMock()
+        llm_service.settings = test_settings
+        behavior = LLMBehavior(_make_world_manager(), llm_service=llm_service)
+        context = {"available_destinations": [], "current_location": "home", "other_agents": ["al", "alice", "alice_2"]}
+        
+        def target_of(target):
+            action, _ = behavior._parse_llm_response(
+                json.dumps({"reasoning": "Chat.", "action": {"type": "INTERACT", "target": target}}),
+                sample_agent,
+                context
+            )
+            return action.parameters["target_agent_id"]
+        
+        assert target_of("alice_2") == "alice_2"
+        assert target_of("Alice") == "alice"
+        assert target_of("ask alice about the weather") == "alice"
+        assert target_of("the kitchen table") is None
+    
+    def test_parse_move_resolves_destination_name(self, test_settings, sample_agent):
+        """Test that MOVE targets are matched against destination names."""
+        llm_service = MagicMock()
+        llm_service.settings = test_settings
+        behavior = LLMBehavior(_make_world_manager(), llm_service=llm_service)
+        context = {
+            "available_destinations": ["Home", "Town Square"],
+            "dest_by_name_lower": {"home": "home", "town square": "square"},
+            "current_location": "park",
+        }
+        
+        action = behavior._parse_action_text("MOVE to the town square", sample_agent, context)
+        
+        assert action.action_type is ActionType.MOVE
+        assert action.parameters["target_place_id"] == "square"
+
+
+class TestSimulationLogger:
+    """Test streaming logged data to disk."""
+    
+    def test_flush_partial_streams_and_frees_buffers(self, tmp_path):
+        """Test that flushed data leaves memory but is still exported."""
+        sim_logger = SimulationLogger("session", output_dir=str(tmp_path))
+        sim_logger.log_tick_start(1, 5)
+        sim_logger.log_agent_action("Alice", "move", "Moved to the park")
+        sim_logger.log_tick_complete({"alice": {"name": "Alice", "energy": 90.0}})
+        
+        stream_path = sim_logger.flush_partial()
+        sim_logger.log_agent_action("Alice", "wait", "Waited")
+        
+        assert stream_path == str(tmp_path / "session" / "simulation_stream.ndjson")
+        assert sim_logger.rich_logger.get_logged_data()["agent_actions"][0]["action"] == "wait"
+        assert sim_logger.has_logged_actions
+        
+        data = sim_logger.get_logged_data()
+        assert [a["action"] for a in data["agent_actions"]] == ["move", "wait"]
+        assert data["simulation_state"][1]["agents"]["alice"]["energy"] == 90.0
+    
+    def test_failed_flush_keeps_buffers(self, tmp_path):
+        """Test that data stays buffered when the stream can't be written."""
+        sim_logger = SimulationLogger("session", output_dir=str(tmp_path))
+        sim_logger.log_agent_action("Alice", "move", "Moved to the park")
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        
+        with pytest.raises(OSError):
+            sim_logger.flush_partial(blocker / "stream.ndjson")
+        
+        assert sim_logger.rich_logger.get_logged_data()["agent_actions"][0]["action"] == "move"
+    
+    def test_enabled_for_follows_options(self, tmp_path):
+        """Test that disabled record kinds are reported to callers."""
+        sim_logger = SimulationLogger("session", output_dir=str(tmp_path), agent_actions=False)
+        
+        assert sim_logger.enabled_for("tick_summary")
+        assert sim_logger.wants_tick_summary
+        assert not sim_logger.enabled_for("agent_action")
@@ -1,5 +1,7 @@
 """Unit tests for storage layer."""
 
+import asyncio
+
 import pytest
 from uuid import uuid4
 
@@ -28,6 +30,17 @@ class TestSQLiteStore:
         assert retrieved_agent.personality == sample_agent.personality
         assert retrieved_agent.home_location == sample_agent.home_location
     
+    @pytest.mark.asyncio
+    async def test_update_agent_states_in_bulk(self, sqlite_store: SQLiteStore, sample_agent: Agent):
+        """Test writing several agent states in one call."""
+        await sqlite_store.create_agent(sample_agent)
+        sample_agent.state.importance_accumulator = 12.5
+        
+        await sqlite_store.update_agent_states([sample_agent.state])
+        
+        retrieved_agent = await sqlite_store.get_agent(sample_agent.id)
+        assert retrieved_agent.state.importance_accumulator == 12.5
+    
     @pytest.mark.asyncio
     async def test_get_nonexistent_agent(self, sqlite_store: SQLiteStore):
         """Test retrieving a non-existent agent."""
@@ -59,6 +72,89 @@ class TestSQLiteStore:
         assert memories[0].memory_type == sample_memory.memory_type
         assert memories[0].importance_score == sample_memory.importance_score
     
+    @pytest.mark.asyncio
+    async def test_add_memories_in_bulk(self, sqlite_store: SQLiteStore, sample_agent: Agent):
+        """Test adding several memories and counting them per agent."""
+        await sqlite_store.create_agent(sample_agent)
+        memories = [
+            Memory(agent_id=sample_agent.id, content=f"Memory {i}", importance_score=float(i))
+            for i in range(3)
+        ]
+        
+        await sqlite_store.add_memories(memories)
+        
+        stored = await sqlite_store.get_recent_memories(sample_agent.id, limit=10)
+        assert sorted(memory.content for memory in stored) == ["Memory 0", "Memory 1", "Memory 2"]
+        assert (await sqlite_store.get_agent(sample_agent.id)).memories_count == 3
+        
+        perceptions = await sqlite_store.get_recent_memories(
+            sample_agent.id, memory_types=[MemoryType.PERCEPTION.value, MemoryType.ACTION.value]
+        )
+        assert len(perceptions) == 3
+        assert await sqlite_store.get_recent_memories(sample_agent.id, memory_types=[MemoryType.REFLECTION.value]) == []
+    
+    @pytest.mark.asyncio
+    async def test_transaction_rolls_back_on_error(self, sqlite_store: SQLiteStore, sample_agent: Agent):
+        """Test that writes inside a failed transaction are discarded."""
+        await sqlite_store.create_agent(sample_agent)
+        
+        async with sqlite_store.transaction():
+            async with sqlite_store.transaction():
+                await sqlite_store.add_memory(Memory(agent_id=sample_agent.id, content="kept"))
+        
+        with pytest.raises(RuntimeError):
+            async with sqlite_store.transaction():
+                await sqlite_store.add_memory(Memory(agent_id=sample_agent.id, content="dropped"))
+                raise RuntimeError("tick failed")
+        
+        with pytest.raises(asyncio.CancelledError):
+            async with sqlite_store.transaction():
+                await sqlite_store.add_memory(Memory(agent_id=sample_agent.id, content="cancelled"))
+                raise asyncio.CancelledError()
+        
+        stored = await sqlite_store.get_recent_memories(sample_agent.id, limit=10)
+        assert [memory.content for memory in stored] == ["kept"]
+    
+    @pytest.mark.asyncio
+    async def test_pragma_overrides(self, tmp_path):
+        """Test that PRAGMA overrides are applied on connect."""
+        store = SQLiteStore(tmp_path / "pragmas.db", pragmas={"cache_size": -1024})
+        await store.connect()
+        try:
+            async with store._connection.execute("PRAGMA cache_size") as cursor:
+                assert (await cursor.fetchone())[0] == -1024
+            async with store._connection.execute("PRAGMA journal_mode") as cursor:
+                assert (await cursor.fetchone())[0] == "wal"
+        finally:
+            await store.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_initialize_schema_applies_later_migrations(self, sqlite_store: SQLiteStore):
+        """Test that re-running schema initialization creates the composite indexes."""
+        await sqlite_store.initialize_schema()
+        
+        cursor = await sqlite_store._connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'"
+        )
+        names = {row[0] for row in await cursor.fetchall()}
+        assert {"idx_memories_agent_type_timestamp", "idx_plans_agent_type_created"} <= names
+    
+    @pytest.mark.asyncio
+    async def test_get_plans_returns_dicts(self, sqlite_store: SQLiteStore, sample_agent: Agent):
+        """Test that stored plans come back keyed by column name."""
+        await sqlite_store.create_agent(sample_agent)
+        await sqlite_store.add_plan("plan-1", sample_agent.id, "daily", "{}")
+        
+        plans = await sqlite_store.get_plans(agent_id=sample_agent.id, plan_type="daily")
+        
+        assert len(plans) == 1
+        assert plans[0]["id"] == "plan-1"
+        assert plans[0]["status"] == "pending"
+        assert set(plans[0]) == {
+            "id", "agent_id", "plan_type", "content", "date_for",
+            "start_time", "end_time", "status", "created_at", "updated_at"
+        }
+    
     @pytest.mark.asyncio
     async def test_create_place(self, sqlite_store: SQLiteStore, sample_place: Place):
         """Test creating a place."""
@@ -82,6 +178,20 @@ class TestSQLiteStore:
         stats = await sqlite_store.get_database_stats()
         assert stats["objects_count"] == 1
     
+    @pytest.mark.asyncio
+    async def test_create_places_and_objects_in_bulk(self, sqlite_store: SQLiteStore, sample_object: WorldObject, sample_place: Place):
+        """Test bulk creation skips rows that already exist."""
+        sample_object.location = sample_place.id
+        
+        assert await sqlite_store.create_places([sample_place]) == 1
+        assert await sqlite_store.create_objects([sample_object]) == 1
+        assert await sqlite_store.create_places([sample_place]) == 0
+        assert await sqlite_store.create_objects([sample_object]) == 0
+        
+        stats = await sqlite_store.get_database_stats()
+        assert stats["places_count"] == 1
+        assert stats["objects_count"] == 1
+    
     @pytest.mark.asyncio
     async def test_agent_location_tracking(self, sqlite_store: SQLiteStore, sample_agent: Agent, sample_place: Place):
         """Test agent location tracking."""
@@ -115,6 +225,19 @@ class TestVectorStore:
         stats = vector_store.get_collection_stats()
         assert stats["memory_count"] == 1
     
+    @pytest.mark.asyncio
+    async def test_add_memory_embeddings(self, vector_store: VectorStore, sample_memory: Memory, sample_embedding: list[float]):
+        """Test adding several memory embeddings in one call."""
+        other = sample_memory.model_copy(update={"id": uuid4(), "content": "Another memory"})
+        
+        embedding_ids = await vector_store.add_memory_embeddings(
+            [sample_memory, other], [sample_embedding, sample_embedding]
+        )
+        
+        assert embedding_ids == [str(sample_memory.id), str(other.id)]
+        assert vector_store.get_collection_stats()["memory_count"] == 2
+        assert await vector_store.add_memory_embeddings([], []) == []
+    
     @pytest.mark.asyncio
     async def test_search_memories(self, vector_store: VectorStore, sample_memory: Memory, sample_embedding: list[float]):
         """Test searching for similar memories."""
@@ -133,6 +256,26 @@ class TestVectorStore:
         assert memory_id == str(sample_memory.id)
         assert similarity > 0.9  # Should be very similar to itself
     
+    @pytest.mark.asyncio
+    async def test_search_memories_with_filters(self, vector_store: VectorStore, sample_memory: Memory, sample_embedding: list[float]):
+        """Test that type and importance filters combine in one query."""
+        await vector_store.add_memory_embedding(sample_memory, sample_embedding)
+        
+        results = await vector_store.search_memories(
+            query_embedding=sample_embedding,
+            agent_id=sample_memory.agent_id,
+            memory_types=[sample_memory.memory_type.value],
+            min_importance=1.0
+        )
+        assert [memory_id for memory_id, _ in results] == [str(sample_memory.id)]
+        
+        results = await vector_store.search_memories(
+            query_embedding=sample_embedding,
+            agent_id=sample_memory.agent_id,
+            min_importance=9.0
+        )
+        assert results == []
+    
     @pytest.mark.asyncio
     async def test_search_empty_collection(self, vector_store: VectorStore, sample_embedding: list[float]):
         """Test searching in an empty collection."""
@@ -152,3 +295,76 @@ class TestVectorStore:
         assert "reflection_count" in stats
         assert stats["memory_count"] == 0
         assert stats["reflection_count"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_memory_backend_search(self, tmp_path, sample_memory: Memory):
+        """Test that the in-process backend ranks and filters like Chroma."""
+        store = VectorStore(str(tmp_path), backend="memory")
+        store.initialize_collections()
+        near = sample_memory.model_copy(update={"id": uuid4(), "importance_score": 2.0})
+        far = sample_memory.model_copy(update={"id": uuid4(), "memory_type": MemoryType.ACTION})
+        other_agent = sample_memory.model_copy(update={"id": uuid4(), "agent_id": "someone_else"})
+        await store.add_memory_embeddings(
+            [near, far, other_agent],
+            [[1.0, 0.1, 0.0], [0.0, 1.0, 0.0], [1.0, 0.0, 0.0]]
+        )
+        
+        results = await store.search_memories([1.0, 0.0, 0.0], sample_memory.agent_id, limit=5)
+        assert [memory_id for memory_id, _ in results] == [str(near.id), str(far.id)]
+        assert results[0][1] > 0.99
+        assert results[1][1] == pytest.approx(0.5)
+        
+        filtered = await store.search_memories(
+            [1.0, 0.0, 0.0], sample_memory.agent_id, limit=5,
+            memory_types=[MemoryType.ACTION.value]
+        )
+        assert [memory_id for memory_id, _ in filtered] == [str(far.id)]
+        
+        important = await store.search_memories(
+            [1.0, 0.0, 0.0], sample_memory.agent_id, limit=1, min_importance=3.0
+        )
+        assert [memory_id for memory_id, _ in important] == [str(far.id)]
+        
+        # Cached filter results are dropped when the agent gains an embedding
+        newer = sample_memory.model_copy(update={"id": uuid4(), "memory_type": MemoryType.ACTION})
+        await store.add_memory_embeddings([newer], [[1.0, 0.0, 0.0]])
+        filtered = await store.search_memories(
+            [1.0, 0.0, 0.0], sample_memory.agent_id, limit=5,
+            memory_types=[MemoryType.ACTION.value]
+        )
+        assert [memory_id for memory_id, _ in filtered] == [str(newer.id), str(far.id)]
+        assert store.get_collection_stats()["memory_count"] == 4
+    
+    @pytest.mark.asyncio
+    async def test_quantized_memory_backend(self, tmp_path, sample_memory: Memory):
+        """Test that int8 storage keeps rankings and near-exact similarities."""
+        store = VectorStore(str(tmp_path), backend="memory", quantize=True)
+        store.initialize_collections()
+        near = sample_memory.model_copy(update={"id": uuid4()})
+        far = sample_memory.model_copy(update={"id": uuid4()})
+        await store.add_memory_embeddings([far, near], [[0.0, 1.0, 0.3], [1.0, 0.2, 0.0]])
+        
+        results = await store.search_memories([1.0, 0.2, 0.0], sample_memory.agent_id, limit=2)
+        
+        assert [memory_id for memory_id, _ in results] == [str(near.id), str(far.id)]
+        assert results[0][1] == pytest.approx(1.0, abs=0.01)
+    
+    @pytest.mark.asyncio
+    async def test_l2_collection_migrated_to_inner_product(self, tmp_path, sample_memory: Memory):
+        """Test that collections persisted in L2 space are normalized into inner-product space."""
+        legacy = VectorStore(str(tmp_path))
+        legacy.client.create_collection("agent_memories").add(
+            ids=[str(sample_memory.id)],
+            embeddings=[[3.0, 0.0, 0.0]],
+            documents=[sample_memory.content],
+            metadatas=[{"agent_id": sample_memory.agent_id}]
+        )
+        
+        store = VectorStore(str(tmp_path))
+        store.initialize_collections()
+        
+        assert store.memory_collection.configuration_json["hnsw"]["space"] == "ip"
+        assert store.get_collection_stats()["memory_count"] == 1
+        results = await store.search_memories([1.0, 0.0, 0.0], sample_memory.agent_id)
+        assert results[0][0] == str(sample_memory.id)
+        assert results[0][1] == pytest.approx(1.0, abs=1e-5)